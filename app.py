@@ -2,19 +2,22 @@
 AI Meeting Booking System - 메인 애플리케이션
 """
 import streamlit as st
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, Optional
 
 from src.utils.config import PAGE_CONFIG
 from src.utils.styles import get_css_styles
-from src.utils.session import SessionManager
+from src.utils.session import SessionManager, rerun_fragment
 from src.components.layout import HeaderComponent, MessageComponent, UsageGuideComponent
 from src.components.sidebar import SidebarLogoComponent, MeetingHistoryComponent
 from src.components.ai_chat import AIAssistantComponent
 from src.components.meeting_form import MeetingFormComponent, MeetingActionsComponent
 from src.components.attendee_table import AttendeeManagementComponent
+from src.components.profiler_panel import ProfilerPanelComponent
 from src.services.meeting_service import MeetingService
-from src.models.chat import LLMResponse
+from src.models.chat import LLMResponse, StreamEvent
 from src.models.meeting import Meeting
+from src.models.employee import NameResolution
+from src.utils.profiler import profiled
 
 
 class MeetingBookingApp:
@@ -33,6 +36,7 @@ class MeetingBookingApp:
         """CSS 스타일 로드"""
         st.markdown(get_css_styles(), unsafe_allow_html=True)
 
+    @profiled()
     def create_sidebar(self):
         """사이드바 생성"""
         with st.sidebar:
@@ -52,6 +56,12 @@ class MeetingBookingApp:
             st.divider()
 
             # AI 어시스턴트
+            self._render_ai_assistant()
+
+    @st.fragment
+    def _render_ai_assistant(self):
+        """AI 어시스턴트 (채팅만 바뀌면 이 영역만 다시 실행)"""
+        with self.session_manager.get_profiler().rerun("fragment:ai_assistant"):
             ai_assistant = AIAssistantComponent(
                 self.session_manager.get_ai_service(),
                 self.session_manager.get_chat_storage()
@@ -87,86 +97,111 @@ class MeetingBookingApp:
     def _handle_ai_assistant_actions(self, ai_result: Dict[str, Any]):
         """AI 어시스턴트 액션 처리"""
         if ai_result['send_clicked'] and ai_result['prompt']:
-            self._process_ai_prompt_stream(ai_result['prompt'])
+            self._process_ai_prompt_stream(ai_result['prompt'], ai_result['chat_container'])
 
         elif ai_result['clear_clicked']:
             self.session_manager.get_chat_storage().clear_messages()
             MessageComponent.render_success("채팅 히스토리를 초기화했습니다!")
-            st.rerun()
+            rerun_fragment()
 
-    def _process_ai_prompt_stream(self, prompt: str):
-        """AI 프롬프트 처리 (즉시 적용)"""
+    def _process_ai_prompt_stream(self, prompt: str, chat_container):
+        """AI 프롬프트 처리 (RESPONSE는 실시간 표시, ACTION은 도착 즉시 적용)"""
         ai_service = self.session_manager.get_ai_service()
-        current_meeting = self.session_manager.get_current_meeting()
 
-        # AI 서비스 초기화 확인
+        # AI 서비스 초기화 확인 (실패해도 규칙 기반 fast-path 명령은 처리 가능)
         if not ai_service.is_initialized:
             success, message = ai_service.initialize()
             if not success:
                 MessageComponent.render_error(message)
-                return
 
-        try:
-            result = ai_service.process_prompt_stream(prompt, current_meeting)
-            if result and len(result) == 2:
-                action_data, response_generator = result
-            else:
-                self.session_manager.add_chat_message(prompt, "응답 처리 중 오류가 발생했습니다.")
-                st.rerun()
+        applied_updates = {}
+
+        def apply_action(action_data: dict):
+            """ACTION 처리 - 즉시 적용"""
+            if action_data.get("action") != "update" or "updates" not in action_data:
                 return
 
-            # RESPONSE 수집
-            full_response = ""
-            try:
-                for chunk in response_generator:
-                    full_response += chunk
-            except Exception:
-                full_response = "응답 생성 중 오류가 발생했습니다."
+            llm_response = LLMResponse(
+                action="update",
+                updates=action_data["updates"],
+                message="회의 정보가 업데이트되었습니다."
+            )
 
-            # 응답 정리
-            full_response = full_response.replace('```', '').strip()
-
-            # ACTION 처리 - 즉시 적용
-            if action_data and action_data.get("action") == "update" and "updates" in action_data:
-                llm_response = LLMResponse(
-                    action="update",
-                    updates=action_data["updates"],
-                    message="회의 정보가 업데이트되었습니다."
-                )
+            # 변경사항 분석을 위한 이전 상태 저장
+            previous_meeting = self.session_manager.get_current_meeting()
 
-                # 변경사항 분석을 위한 이전 상태 저장
-                previous_meeting = current_meeting
+            # 회의 정보 즉시 업데이트
+            updated_meeting = MeetingService.update_meeting_from_llm_response(
+                previous_meeting, llm_response
+            )
+            self.session_manager.set_current_meeting(updated_meeting)
 
-                # 회의 정보 즉시 업데이트
-                updated_meeting = MeetingService.update_meeting_from_llm_response(
-                    current_meeting, llm_response
-                )
-                self.session_manager.set_current_meeting(updated_meeting)
+            # 하이라이트 효과 적용
+            self._save_highlighted_fields(action_data["updates"])
 
-                # 하이라이트 효과 적용
-                self._save_highlighted_fields(action_data.get("updates", {}))
+            applied_updates.update(
+                previous_meeting=previous_meeting,
+                updated_meeting=updated_meeting,
+                updates=action_data["updates"],
+                name_resolution=llm_response.name_resolution
+            )
 
+        try:
+            events = ai_service.process_prompt_stream(prompt, self.session_manager.get_current_meeting())
+
+            # RESPONSE 실시간 표시
+            with chat_container:
+                with st.chat_message("user"):
+                    st.markdown(prompt)
+                with st.chat_message("assistant"):
+                    try:
+                        full_response = st.write_stream(
+                            self._iter_response_text(events, apply_action)
+                        )
+                    except Exception:
+                        full_response = "응답 생성 중 오류가 발생했습니다."
+
+            # 응답 정리
+            if not isinstance(full_response, str):
+                full_response = "".join(str(part) for part in full_response)
+            full_response = full_response.replace('```', '').strip() or "응답을 처리했습니다."
+
+            if applied_updates:
                 # 변경사항 상세 분석 및 메시지 개선
-                enhanced_response = self._enhance_response_with_changes(
-                    full_response, previous_meeting, updated_meeting, action_data.get("updates", {})
+                full_response = self._enhance_response_with_changes(
+                    full_response,
+                    applied_updates["previous_meeting"],
+                    applied_updates["updated_meeting"],
+                    applied_updates["updates"],
+                    applied_updates["name_resolution"]
                 )
 
-                # 개선된 응답으로 채팅에 추가
-                self.session_manager.add_chat_message(prompt, enhanced_response)
-            else:
-                # 일반 채팅
-                self.session_manager.add_chat_message(prompt, full_response)
-
-            st.rerun()
+            self.session_manager.add_chat_message(prompt, full_response)
+            # 회의 정보가 바뀐 경우에만 폼까지 다시 그림
+            if applied_updates:
+                st.rerun()
+            rerun_fragment()
 
         except Exception as e:
             error_message = f"AI 처리 중 오류가 발생했습니다: {str(e)}"
             self.session_manager.add_chat_message(prompt, error_message)
-            st.rerun()
+            if applied_updates:
+                st.rerun()
+            rerun_fragment()
+
+    @staticmethod
+    def _iter_response_text(events: Iterator[StreamEvent], on_action) -> Iterator[str]:
+        """스트림 이벤트 중 텍스트만 전달하고 ACTION은 콜백으로 처리"""
+        for event in events:
+            if event.is_action():
+                on_action(event.action)
+            elif event.text:
+                yield event.text
 
     def _enhance_response_with_changes(self, original_response: str, previous_meeting: Meeting,
-                                     updated_meeting: Meeting, updates: dict) -> str:
-        """변경사항을 분석하여 응답을 개선"""
+                                     updated_meeting: Meeting, updates: dict,
+                                     name_resolution: Optional[NameResolution] = None) -> str:
+        """변경사항을 분석하여 응답을 개선 (추가하지 못한 참석자는 사용자에게 확인 요청)"""
         changes = []
 
         # 제목 변경 확인
@@ -194,8 +229,8 @@ class MeetingBookingApp:
 
             if new_count > prev_count:
                 # 새로 추가된 참석자 찾기
-                prev_ids = {att.employee_id for att in previous_meeting.attendees}
-                new_attendees = [att for att in updated_meeting.attendees if att.employee_id not in prev_ids]
+                new_attendees = [att for att in updated_meeting.attendees
+                                 if att.employee_id not in previous_meeting.attendees]
                 if new_attendees:
                     names = ", ".join([att.name for att in new_attendees])
                     changes.append(f"• 참석자 추가: {names}")
@@ -206,6 +241,7 @@ class MeetingBookingApp:
                 changes.append("• 회의 안건 업데이트")
 
         # 변경사항이 있으면 원래 응답을 개선
+        enhanced = original_response
         if changes:
             change_summary = "\n".join(changes)
             if "✅" not in original_response:
@@ -214,9 +250,20 @@ class MeetingBookingApp:
             else:
                 # 이미 체크마크가 있으면 변경사항 추가
                 enhanced = f"{original_response}\n\n**변경사항:**\n{change_summary}"
-            return enhanced
 
-        return original_response
+        # 동명이인/미확인 이름은 임의로 추가하지 않고 되물음
+        questions = []
+        if name_resolution is not None:
+            for name, matches in name_resolution.ambiguous.items():
+                candidates = ", ".join(f"{m.employee.name}({m.employee.team})" for m in matches)
+                questions.append(f"• '{name}' 후보가 여러 명입니다: {candidates} 중 누구인지 알려주세요.")
+            if name_resolution.unresolved:
+                questions.append(f"• 찾을 수 없는 참석자: {', '.join(name_resolution.unresolved)} "
+                                 "(이름을 확인해주세요)")
+        if questions:
+            enhanced = f"{enhanced}\n\n**참석자 확인 필요:**\n" + "\n".join(questions)
+
+        return enhanced
 
     def _save_highlighted_fields(self, updates: dict):
         """변경된 필드들을 하이라이트용으로 저장"""
@@ -231,6 +278,7 @@ class MeetingBookingApp:
         # 3초 후 하이라이트 자동 제거를 위한 타이머 설정
         st.session_state.highlight_duration = 3.0
 
+    @profiled()
     def create_main_content(self):
         """메인 컨텐츠 생성"""
         current_meeting = self.session_manager.get_current_meeting()
@@ -244,11 +292,11 @@ class MeetingBookingApp:
         updated_meeting = meeting_form.render(current_meeting, self.session_manager)
 
         # 참석자 관리 (먼저 표시)
-        attendee_management = AttendeeManagementComponent()
-        updated_meeting = attendee_management.render(updated_meeting)
+        self._render_attendee_management(updated_meeting)
 
         # 회의 안건 (나중에 표시)
-        content = meeting_form.render_content_editor(updated_meeting, self.session_manager)
+        self._render_content_editor(meeting_form)
+        content = self.session_manager.get_current_meeting().content
 
         # 최종 회의 정보 업데이트 (content 포함)
         final_meeting = Meeting(
@@ -289,10 +337,37 @@ class MeetingBookingApp:
         usage_guide = UsageGuideComponent()
         usage_guide.render()
     
+    @st.fragment
+    def _render_attendee_management(self, meeting: Meeting):
+        """참석자 관리 (참석자 추가/삭제/역할 변경은 이 영역만 다시 실행)
+
+        참석자 목록은 회의 객체 간에 공유되므로, 단독 재실행 시 마지막 전체 실행에서
+        받은 회의 객체를 그대로 써도 현재 참석자와 시간이 반영됩니다.
+        """
+        with self.session_manager.get_profiler().rerun("fragment:attendees"):
+            attendee_management = AttendeeManagementComponent()
+            attendee_management.render(meeting)
+
+    @st.fragment
+    def _render_content_editor(self, meeting_form: MeetingFormComponent):
+        """회의 안건 에디터 (입력 시 에디터 영역만 다시 실행)"""
+        with self.session_manager.get_profiler().rerun("fragment:content_editor"):
+            current_meeting = self.session_manager.get_current_meeting()
+            content = meeting_form.render_content_editor(current_meeting, self.session_manager)
+            if content != current_meeting.content:
+                # 에디터 키를 지우지 않도록 set_current_meeting 대신 내용만 갱신
+                current_meeting.content = content
+
     def run(self):
         """애플리케이션 실행"""
-        self.create_sidebar()
-        self.create_main_content()
+        profiler = self.session_manager.get_profiler()
+        with profiler.rerun("app"):
+            self.create_sidebar()
+            self.create_main_content()
+
+        # 디버그 패널은 방금 끝난 재실행까지 포함해 표시
+        with st.sidebar:
+            ProfilerPanelComponent(profiler).render()
 
 
 def main():
@@ -0,0 +1,205 @@
+"""
+일정 저장소 동시성 벤치마크
+
+스레드 여러 개가 같은 일정 저장소에 충돌 확인, 회의 일정 일괄 생성, 수정, 삭제,
+날짜별 조회를 섞어 실행하면서 스레드 수별 처리량을 측정하고, 끝난 뒤 인덱스 정합성과
+동시 book_meeting의 이중 예약 여부를 검사합니다. 샤드 1개(전역 잠금)와 기본 샤드 수를 비교합니다.
+
+CPython(GIL)에서는 잠금 경합이 없어도 순수 파이썬 구간이 병렬로 돌지 않으므로
+처리량은 스레드 수에 비례해 늘지 않습니다. 이 벤치마크는 잠금 방식이 GIL 이상의
+직렬화를 더하지 않는지(샤드 잠금 처리량이 스레드 수와 함께 떨어지지 않는지)를 확인하며,
+free-threaded 빌드에서는 샤드 간 작업이 실제로 병렬 실행됩니다.
+
+사용법:
+    python -m benchmarks.contention --threads 1,2,4,8 --ops 20000
+"""
+import argparse
+import contextlib
+import os
+import random
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Set
+
+from benchmarks.run_benchmarks import SCALES
+from src.api.schedule_api import BaseScheduleAPI, MockScheduleAPI
+from src.api.synthetic_data import SyntheticDataGenerator
+from src.utils.config import SCHEDULE_LOCK_SHARDS
+
+
+@dataclass
+class ContentionResult:
+    """저장소/스레드 수 1조합의 결과"""
+    store: str
+    threads: int
+    ops: int
+    elapsed_s: float
+    ops_per_s: float
+    errors: int
+
+
+def run_workload(schedule_api: BaseScheduleAPI, employee_ids: List[str], base_day,
+                 threads: int, ops: int, seed: int) -> ContentionResult:
+    """스레드 threads개로 작업 ops개를 나눠 실행"""
+    created: List[str] = []
+    created_lock = threading.Lock()
+    errors: List[BaseException] = []
+    start_barrier = threading.Barrier(threads + 1)
+
+    def worker(index: int):
+        rng = random.Random(f"{seed}:{threads}:{index}")
+        start_barrier.wait()
+        for _ in range(ops // threads):
+            attendees = rng.sample(employee_ids, 5)
+            start = base_day + timedelta(days=rng.randrange(10), hours=rng.randrange(9, 18))
+            end = start + timedelta(hours=1)
+            roll = rng.random()
+            try:
+                if roll < 0.7:
+                    schedule_api.check_conflicts(attendees, start, end)
+                elif roll < 0.85:
+                    ids = schedule_api.create_meeting_schedules(attendees, "경합 테스트", start, end)
+                    with created_lock:
+                        created.extend(ids)
+                elif roll < 0.95:
+                    with created_lock:
+                        target = created.pop(rng.randrange(len(created))) if created else None
+                    if target is not None:
+                        if rng.random() < 0.5:
+                            schedule_api.delete_schedule(target)
+                        else:
+                            schedule_api.update_schedule(target, start_datetime=start, end_datetime=end)
+                            with created_lock:
+                                created.append(target)
+                else:
+                    schedule_api.get_all_schedules_for_date(start)
+            except Exception as e:  # 동시성 오류를 집계하고 계속 진행
+                errors.append(e)
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    start_barrier.wait()
+    started = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    total = ops // threads * threads
+    return ContentionResult("", threads, total, round(elapsed, 3),
+                            round(total / elapsed, 1), len(errors))
+
+
+def run_booking_race(schedule_api: BaseScheduleAPI, employee_ids: List[str], base_day,
+                     threads: int, attempts: int, seed: int) -> List[str]:
+    """좁은 시간대/참석자 풀에 동시에 book_meeting을 시도한 뒤 이중 예약 여부 확인"""
+    pool = employee_ids[:12]
+    slots = [base_day + timedelta(hours=9 + hour) for hour in range(3)]
+    booked: List[str] = []
+    booked_lock = threading.Lock()
+    start_barrier = threading.Barrier(threads)
+
+    def worker(index: int):
+        rng = random.Random(f"{seed}:race:{index}")
+        start_barrier.wait()
+        for _ in range(attempts // threads):
+            start = rng.choice(slots) + timedelta(minutes=rng.choice([0, 30]))
+            result = schedule_api.book_meeting(rng.sample(pool, 3), "예약 경합", start,
+                                               start + timedelta(hours=1))
+            if result.success:
+                with booked_lock:
+                    booked.extend(result.schedule_ids)
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+
+    problems = []
+    for schedule_id in booked:
+        schedule = schedule_api.get_schedule(schedule_id)
+        overlapping = schedule_api.check_conflicts([schedule.employee_id], schedule.start_datetime,
+                                                   schedule.end_datetime, schedule_id)
+        if overlapping:
+            problems.append(f"이중 예약: {schedule.employee_id} {schedule.start_datetime}")
+    return problems
+
+
+def check_integrity(schedule_api: MockScheduleAPI) -> List[str]:
+    """모든 일정이 담당자 인덱스와 날짜 색인에서 조회되는지 확인"""
+    problems = []
+    by_date: Dict[date, Set[str]] = {}
+    for schedule in schedule_api.schedules:
+        found = schedule_api.check_conflicts([schedule.employee_id], schedule.start_datetime,
+                                             schedule.end_datetime)
+        if schedule not in found.get(schedule.employee_id, []):
+            problems.append(f"인덱스 누락: {schedule.schedule_id}")
+        by_date.setdefault(schedule.start_datetime.date(), set()).add(schedule.schedule_id)
+
+    for day, schedule_ids in by_date.items():
+        found_ids = {schedule.schedule_id for schedule in schedule_api.get_all_schedules_for_date(
+            datetime.combine(day, datetime.min.time()))}
+        if found_ids != schedule_ids:
+            problems.append(f"날짜 색인 불일치: {day} ({len(found_ids)} != {len(schedule_ids)})")
+    return problems
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="일정 저장소 동시성 벤치마크")
+    parser.add_argument("--threads", default="1,2,4,8", help="쉼표로 구분한 스레드 수")
+    parser.add_argument("--ops", type=int, default=20000, help="스레드 수별 총 작업 수")
+    parser.add_argument("--scale", default="small", choices=list(SCALES))
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    scale = SCALES[args.scale]
+    generator = SyntheticDataGenerator(seed=args.seed, employee_count=scale.employees,
+                                       ad_hoc_per_day=scale.ad_hoc_per_day)
+    world = generator.generate()
+    employee_ids = [emp.id for emp in world.employees]
+    base_day = world.start_date + timedelta(days=7)
+
+    stores: List[tuple] = [
+        ("global-lock", lambda: MockScheduleAPI(generate_sample_data=False, lock_shards=1)),
+        (f"sharded-{SCHEDULE_LOCK_SHARDS}", lambda: MockScheduleAPI(generate_sample_data=False)),
+    ]
+
+    results: List[ContentionResult] = []
+    problems: List[str] = []
+    # 일정 생성/삭제 로그가 결과 표와 섞이지 않도록 stdout 차단
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for store_name, factory in stores:
+            for threads in (int(value) for value in args.threads.split(",")):
+                schedule_api = factory()
+                schedule_api.add_schedules(generator.iter_schedules(world.employees))
+                result = run_workload(schedule_api, employee_ids, base_day, threads,
+                                      args.ops, args.seed)
+                result.store = store_name
+                results.append(result)
+                problems.extend(f"{store_name}/{threads}: {problem}"
+                                for problem in check_integrity(schedule_api))
+
+                # 예약 경합은 기존 일정이 없는 날짜에서 확인
+                race_day = base_day + timedelta(days=400)
+                problems.extend(f"{store_name}/{threads}: {problem}"
+                                for problem in run_booking_race(schedule_api, employee_ids, race_day,
+                                                                threads, 2000, args.seed))
+
+    print(f"{'store':<14} {'threads':>7} {'ops':>7} {'ops/s':>10} {'errors':>6}")
+    for result in results:
+        print(f"{result.store:<14} {result.threads:>7} {result.ops:>7} "
+              f"{result.ops_per_s:>10.1f} {result.errors:>6}")
+
+    for problem in problems[:10]:
+        print(f"  {problem}")
+    failed = problems or any(result.errors for result in results)
+    print("정합성 오류 있음" if failed else "정합성 검사 통과")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+"""
+프래그먼트 재실행 벤치마크
+
+AppTest는 프래그먼트도 전체 스크립트로 실행하므로, 실제 `streamlit run` 서버를 띄우고
+브라우저와 같은 웹소켓 프로토콜로 위젯 입력을 보내 측정합니다. 같은 입력을 두 방식으로
+보냅니다.
+
+- full: fragment_id 없이 재실행 요청 (프래그먼트 도입 전처럼 스크립트 전체 실행)
+- fragment: 위젯이 속한 fragment_id로 재실행 요청 (브라우저가 실제로 보내는 방식)
+
+입력 1회마다 응답 완료까지의 왕복 시간과 수신 바이트를 재고, 서버 쪽 렌더 프로파일러
+JSONL 로그에서 스크립트 실행 종류(app / fragment:*)별 실행 횟수와 실행 시간을 집계합니다.
+
+사용법:
+    python -m benchmarks.fragment_reruns
+    python -m benchmarks.fragment_reruns --iterations 100 --port 8599
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from websockets.sync.client import connect
+
+from benchmarks.harness import percentile
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+SEARCH_QUERIES = ["김", "김철", "개발", "ㄱㅊ", "이영", "마케팅", "박", "정"]
+DONE_STATUSES = (
+    ForwardMsg.ScriptFinishedStatus.FINISHED_SUCCESSFULLY,
+    ForwardMsg.ScriptFinishedStatus.FINISHED_FRAGMENT_RUN_SUCCESSFULLY,
+)
+
+
+@dataclass
+class Widget:
+    """화면에 렌더된 위젯"""
+    widget_id: str
+    fragment_id: str
+
+
+@dataclass
+class ScenarioResult:
+    """입력 종류 × 재실행 방식별 결과"""
+    scenario: str
+    mode: str
+    iterations: int
+    p50_ms: float
+    p99_ms: float
+    kib_per_input: float
+    script_runs: Dict[str, int]
+    script_p50_ms: float
+
+
+class StreamlitSession:
+    """웹소켓으로 Streamlit 서버와 통신하는 브라우저 대역"""
+
+    def __init__(self, url: str):
+        self._ws = connect(url, subprotocols=["streamlit"], max_size=None)
+        self.widgets: Dict[str, Widget] = {}
+        self._states: Dict[str, WidgetState] = {}
+
+    def close(self) -> None:
+        self._ws.close()
+
+    def rerun(self, fragment_id: str = "", trigger: Optional[WidgetState] = None) -> int:
+        """재실행 요청 후 실행이 끝날 때까지 메시지를 받고 수신 바이트 반환"""
+        msg = BackMsg()
+        msg.rerun_script.fragment_id = fragment_id
+        states = list(self._states.values()) + ([trigger] if trigger is not None else [])
+        msg.rerun_script.widget_states.widgets.extend(states)
+        self._ws.send(msg.SerializeToString())
+
+        received = 0
+        while True:
+            raw = self._ws.recv()
+            received += len(raw)
+            forward = ForwardMsg()
+            forward.ParseFromString(raw)
+            kind = forward.WhichOneof("type")
+            if kind == "delta":
+                self._collect_widget(forward.delta)
+            elif kind == "script_finished" and forward.script_finished in DONE_STATUSES:
+                return received
+
+    def set_string(self, key: str, value: str) -> None:
+        """텍스트 입력값 변경 (브라우저처럼 이후 요청에도 계속 전송)"""
+        state = WidgetState(id=self.widgets[key].widget_id, string_value=value)
+        self._states[key] = state
+
+    def trigger(self, key: str) -> WidgetState:
+        """버튼 클릭 (이번 요청에만 포함)"""
+        return WidgetState(id=self.widgets[key].widget_id, trigger_value=True)
+
+    def _collect_widget(self, delta) -> None:
+        """위젯 ID와 소속 프래그먼트 기록 (위젯 ID 끝부분이 사용자 지정 key)"""
+        if delta.WhichOneof("type") != "new_element":
+            return
+        element_type = delta.new_element.WhichOneof("type")
+        widget_id = getattr(getattr(delta.new_element, element_type), "id", "")
+        if widget_id.startswith("$$ID-"):
+            key = widget_id.split("-", 2)[2]
+            self.widgets[key] = Widget(widget_id, delta.fragment_id)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port: int, log_path: str) -> subprocess.Popen:
+    """프로파일러를 켠 streamlit 서버 실행 후 헬스체크 대기"""
+    env = dict(os.environ, MEETING_PROFILER="1", PROFILER_LOG_PATH=log_path,
+               PROFILER_TRACE_ALLOCATIONS="0")
+    server = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", APP_PATH,
+         "--server.headless", "true", "--server.port", str(port),
+         "--server.enableXsrfProtection", "false", "--browser.gatherUsageStats", "false"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return server
+        except OSError:
+            time.sleep(0.2)
+    server.terminate()
+    raise RuntimeError("streamlit 서버가 60초 안에 시작되지 않았습니다")
+
+
+def read_log(log_path: str, offset: int) -> Tuple[List[dict], int]:
+    """offset 이후에 추가된 프로파일러 로그 레코드 반환"""
+    if not os.path.exists(log_path):
+        return [], offset
+    with open(log_path, encoding="utf-8") as f:
+        f.seek(offset)
+        records = [json.loads(line) for line in f if line.strip()]
+        return records, f.tell()
+
+
+def _search(session: StreamlitSession, i: int) -> Tuple[str, Optional[WidgetState]]:
+    """참석자 검색어 입력 (참석자 관리 프래그먼트)"""
+    session.set_string("attendee_search", SEARCH_QUERIES[i % len(SEARCH_QUERIES)])
+    return session.widgets["attendee_search"].fragment_id, None
+
+
+def _clear_chat(session: StreamlitSession, i: int) -> Tuple[str, Optional[WidgetState]]:
+    """채팅 초기화 버튼 클릭 (AI 어시스턴트 프래그먼트)"""
+    return session.widgets["chat_clear"].fragment_id, session.trigger("chat_clear")
+
+
+SCENARIOS: List[Tuple[str, Callable[[StreamlitSession, int], Tuple[str, Optional[WidgetState]]]]] = [
+    ("attendee_search", _search),
+    ("chat_clear", _clear_chat),
+]
+
+
+def run_scenario(session: StreamlitSession, log_path: str, name: str, interact: Callable,
+                 mode: str, iterations: int) -> ScenarioResult:
+    """입력을 iterations회 보내고 왕복 시간과 서버 실행 기록 집계"""
+    _, offset = read_log(log_path, 0)
+    samples: List[float] = []
+    received = 0
+    for i in range(iterations):
+        fragment_id, trigger = interact(session, i)
+        started = time.perf_counter()
+        received += session.rerun(fragment_id if mode == "fragment" else "", trigger)
+        samples.append((time.perf_counter() - started) * 1000)
+
+    # 로그는 실행 종료 직후 기록되므로 잠깐 기다렸다가 읽음
+    time.sleep(0.2)
+    records, _ = read_log(log_path, offset)
+    samples.sort()
+    script_ms = sorted(record["wall_ms"] for record in records)
+    return ScenarioResult(
+        scenario=name,
+        mode=mode,
+        iterations=iterations,
+        p50_ms=round(percentile(samples, 50), 1),
+        p99_ms=round(percentile(samples, 99), 1),
+        kib_per_input=round(received / iterations / 1024, 1),
+        script_runs=dict(Counter(record["kind"] for record in records)),
+        script_p50_ms=round(statistics.median(script_ms), 1) if script_ms else 0.0
+    )
+
+
+def format_results(results: List[ScenarioResult]) -> str:
+    """결과 표 문자열"""
+    lines = [f"{'scenario':<18} {'mode':<9} {'p50 ms':>8} {'p99 ms':>8} {'KiB/input':>10} "
+             f"{'script p50':>11}  script runs"]
+    for result in results:
+        runs = ", ".join(f"{kind}={count}" for kind, count in sorted(result.script_runs.items()))
+        lines.append(
+            f"{result.scenario:<18} {result.mode:<9} {result.p50_ms:>8.1f} {result.p99_ms:>8.1f} "
+            f"{result.kib_per_input:>10.1f} {result.script_p50_ms:>11.1f}  {runs}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="프래그먼트 재실행 벤치마크 (실제 streamlit 서버)")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--port", type=int, default=0, help="서버 포트 (기본: 빈 포트)")
+    args = parser.parse_args(argv)
+
+    port = args.port or _free_port()
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = os.path.join(tmp, "render_profile.jsonl")
+        server = start_server(port, log_path)
+        try:
+            session = StreamlitSession(f"ws://127.0.0.1:{port}/_stcore/stream")
+            try:
+                session.rerun()
+                results = []
+                for name, interact in SCENARIOS:
+                    for mode in ("full", "fragment"):
+                        results.append(run_scenario(session, log_path, name, interact, mode,
+                                                    args.iterations))
+            finally:
+                session.close()
+        finally:
+            server.terminate()
+            server.wait(timeout=10)
+
+    print(format_results(results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+"""
+벤치마크 측정/기준선 비교 유틸리티
+"""
+import json
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, List
+
+
+@dataclass
+class BenchmarkResult:
+    """벤치마크 결과"""
+    name: str
+    scale: str
+    iterations: int
+    p50_ms: float
+    p99_ms: float
+    mean_ms: float
+    peak_memory_kib: float
+
+    @property
+    def key(self) -> str:
+        return f"{self.scale}/{self.name}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def measure(name: str, scale: str, func: Callable[[int], Any],
+            iterations: int = 200, warmup: int = 5) -> BenchmarkResult:
+    """func(i)를 반복 실행해 지연시간 분위수와 최대 메모리 측정
+
+    지연시간은 tracemalloc 없이 측정하고, 최대 메모리는 별도 1회 실행으로 측정합니다.
+    """
+    for i in range(warmup):
+        func(i)
+
+    samples: List[float] = []
+    for i in range(iterations):
+        started = time.perf_counter()
+        func(warmup + i)
+        samples.append((time.perf_counter() - started) * 1000)
+
+    tracemalloc.start()
+    try:
+        func(warmup + iterations)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    samples.sort()
+    return BenchmarkResult(
+        name=name,
+        scale=scale,
+        iterations=iterations,
+        p50_ms=round(percentile(samples, 50), 4),
+        p99_ms=round(percentile(samples, 99), 4),
+        mean_ms=round(statistics.fmean(samples), 4),
+        peak_memory_kib=round(peak / 1024, 1)
+    )
+
+
+def save_baseline(path: str, results: List[BenchmarkResult]) -> None:
+    """결과를 JSON 기준선으로 저장"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({result.key: result.to_dict() for result in results}, f,
+                  ensure_ascii=False, indent=2)
+
+
+def compare_with_baseline(path: str, results: List[BenchmarkResult],
+                          threshold: float) -> List[str]:
+    """기준선 대비 p50이 threshold배 이상 느려진 항목 반환"""
+    with open(path, encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    regressions = []
+    for result in results:
+        previous = baseline.get(result.key)
+        if not previous or previous["p50_ms"] <= 0:
+            continue
+        ratio = result.p50_ms / previous["p50_ms"]
+        if ratio >= threshold:
+            regressions.append(
+                f"{result.key}: p50 {previous['p50_ms']:.3f}ms -> {result.p50_ms:.3f}ms ({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def format_table(results: List[BenchmarkResult]) -> str:
+    """결과 표 문자열"""
+    lines = [f"{'benchmark':<48} {'p50 ms':>10} {'p99 ms':>10} {'peak KiB':>10}"]
+    for result in results:
+        lines.append(
+            f"{result.key:<48} {result.p50_ms:>10.3f} {result.p99_ms:>10.3f} "
+            f"{result.peak_memory_kib:>10.1f}"
+        )
+    return "\n".join(lines)
+
+
+def percentile(sorted_samples: List[float], percent: float) -> float:
+    """정렬된 표본의 분위수 (nearest-rank)"""
+    if not sorted_samples:
+        return 0.0
+    index = min(len(sorted_samples) - 1, max(0, round(percent / 100 * len(sorted_samples)) - 1))
+    return sorted_samples[index]
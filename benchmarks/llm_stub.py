@@ -0,0 +1,41 @@
+"""
+오프라인 벤치마크용 Gemini 클라이언트 스텁
+"""
+from dataclasses import dataclass
+from typing import Iterator
+
+STUB_RESPONSE = """ACTION:
+```json
+{
+    "action": "update",
+    "updates": {"title": "팀 미팅", "start_time": "2025-01-07 14:00", "attendees": "김철수, 이영희"},
+    "requires_confirmation": true,
+    "action_description": "회의 제목을 '팀 미팅'으로, 시간을 1월 7일 오후 2시로 변경"
+}
+```
+
+RESPONSE:
+회의 일정을 내일 오후 2시 '팀 미팅'으로 변경하고 김철수님, 이영희님을 참석자로 추가하겠습니다.
+"""
+
+
+@dataclass
+class StubChunk:
+    text: str
+
+
+class _StubModels:
+    def __init__(self, response: str, chunk_size: int):
+        self.response = response
+        self.chunk_size = chunk_size
+
+    def generate_content_stream(self, model: str, contents: str) -> Iterator[StubChunk]:
+        for i in range(0, len(self.response), self.chunk_size):
+            yield StubChunk(self.response[i:i + self.chunk_size])
+
+
+class StubGenAIClient:
+    """generate_content_stream만 흉내 내는 로컬 클라이언트"""
+
+    def __init__(self, response: str = STUB_RESPONSE, chunk_size: int = 16):
+        self.models = _StubModels(response, chunk_size)
@@ -0,0 +1,343 @@
+"""
+Streamlit 앱 다중 세션 부하 테스트
+
+AppTest로 세션 N개를 띄워 검색 → 참석자 추가 → 채팅 → 저장 → 초기화 흐름을 반복하고,
+재실행 지연시간 분위수, 세션당 메모리, 처리량 상한을 보고합니다. LLM은 로컬 스텁을 사용합니다.
+
+AppTest는 실행할 때마다 전역 Runtime 싱글턴을 교체하므로 스크립트는 한 번에 하나만
+실행할 수 있습니다. 세션 스레드(사용자 생각 시간 포함)는 동시에 돌지만 재실행은 잠금으로
+직렬화되며, GIL에 묶인 서버 프로세스 하나가 CPU 포화 상태일 때와 같은 처리량 상한을 줍니다.
+응답 지연은 대기 시간을 포함하고, 서비스 시간은 스크립트 실행 시간만 셉니다.
+AppTest는 프래그먼트도 전체 스크립트로 실행하므로 결과는 전체 재실행 기준 상한입니다.
+
+사용법:
+    python -m benchmarks.load_test --sessions 1,4,8,16 --rounds 2 --think-ms 500
+    python -m benchmarks.load_test --scale small --slo-ms 300 --json load_test.json
+"""
+import argparse
+import contextlib
+import gc
+import itertools
+import json
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from streamlit.logger import set_log_level
+from streamlit.testing.v1 import AppTest
+
+from benchmarks.harness import percentile
+from benchmarks.llm_stub import STUB_RESPONSE, StubGenAIClient
+from benchmarks.run_benchmarks import SCALES, build_world
+from src.api.employee_api import get_employee_api
+from src.models.meeting import AttendeeRole
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+# AppTest 실행 직렬화 (Runtime 싱글턴 보호)
+_run_lock = threading.Lock()
+
+# 채팅마다 겹치지 않는 회의 시간을 배정해 저장이 이중 예약으로 거절되지 않게 함
+_SLOT_BASE = (datetime.now() + timedelta(days=365)).replace(hour=9, minute=0, second=0, microsecond=0)
+_slots = itertools.count()
+
+
+def _stub_response(slot: int) -> str:
+    start = _SLOT_BASE + timedelta(days=slot // 8, hours=slot % 8)
+    return STUB_RESPONSE.replace("2025-01-07 14:00", start.strftime("%Y-%m-%d %H:%M"))
+
+
+@dataclass
+class RerunSample:
+    """재실행 1회 측정값"""
+    step: str
+    service_ms: float
+    response_ms: float
+    error: Optional[str] = None
+
+
+@dataclass
+class LevelResult:
+    """동시 세션 수 1단계의 결과"""
+    sessions: int
+    reruns: int
+    errors: int
+    elapsed_s: float
+    reruns_per_s: float
+    flows_per_s: float
+    utilization: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    service_p50_ms: float
+    service_p95_ms: float
+
+
+class SessionDriver:
+    """AppTest 세션 1개 (사용자 1명)"""
+
+    def __init__(self, index: int, rng: random.Random, queries: List[str],
+                 think_ms: float, timeout: float):
+        self.index = index
+        self.rng = rng
+        self.queries = queries
+        self.think_ms = think_ms
+        self.app = AppTest.from_file(APP_PATH, default_timeout=timeout)
+        self.samples: List[RerunSample] = []
+        self.flows = 0
+
+    def run(self, rounds: int) -> None:
+        """세션 시작 후 흐름을 rounds회 반복"""
+        self.open()
+        for _ in range(rounds):
+            self.run_flow()
+
+    def open(self) -> None:
+        """첫 실행 (세션 상태 생성) 후 LLM 스텁 주입"""
+        def start(app: AppTest):
+            app.run()
+            ai_service = app.session_state["ai_service"]
+            ai_service.client = StubGenAIClient()
+            # 실제 API 키가 있어도 initialize()가 스텁을 덮어쓰지 않도록 초기화 완료로 표시
+            ai_service.is_initialized = True
+
+        self._rerun("open", start)
+
+    def run_flow(self) -> None:
+        """검색 → 추가 → 채팅 → 저장 → 초기화"""
+        query = self.rng.choice(self.queries)
+        steps = [
+            ("search", lambda app: self._search(app, query)),
+            ("add", lambda app: _button(app, "추가").click().run()),
+            ("chat", self._chat),
+            ("save", self._save),
+            ("reset", lambda app: _button(app, "🔄").click().run()),
+        ]
+        ok = True
+        for step, interact in steps:
+            self._think()
+            ok = self._rerun(step, interact) and ok
+        self.flows += ok
+
+    @staticmethod
+    def _search(app: AppTest, query: str) -> None:
+        # 저장 검증을 통과하도록 첫 참석자는 주관자로 추가
+        app.selectbox(key="attendee_role").set_value(AttendeeRole.ORGANIZER.value)
+        app.text_input(key="attendee_search").input(query).run()
+
+    @staticmethod
+    def _chat(app: AppTest) -> None:
+        # 프롬프트도 슬롯별로 달라야 공유 응답 캐시에서 이전 시간이 재사용되지 않음
+        slot = next(_slots)
+        app.session_state["ai_service"].client = StubGenAIClient(_stub_response(slot))
+        app.chat_input[0].set_value(f"다음 스프린트 계획 회의 준비해줘 (#{slot})").run()
+
+    @staticmethod
+    def _save(app: AppTest) -> None:
+        _button(app, "💾").click().run()
+        if not any("성공적으로" in md.value for md in app.markdown):
+            errors = [md.value for md in app.markdown if "❌" in md.value]
+            raise RuntimeError(f"저장 실패: {errors[0].strip() if errors else '응답 없음'}")
+
+    def _think(self) -> None:
+        """사용자 생각 시간 (지수 분포)"""
+        if self.think_ms > 0:
+            time.sleep(self.rng.expovariate(1000 / self.think_ms))
+
+    def _rerun(self, step: str, interact: Callable[[AppTest], Any]) -> bool:
+        requested = time.perf_counter()
+        error = None
+        with _run_lock:
+            started = time.perf_counter()
+            try:
+                interact(self.app)
+                if self.app.exception:
+                    error = self.app.exception[0].message
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+            finished = time.perf_counter()
+
+        self.samples.append(RerunSample(step, (finished - started) * 1000,
+                                        (finished - requested) * 1000, error))
+        return error is None
+
+
+def _button(app: AppTest, label_prefix: str):
+    """라벨이 label_prefix로 시작하는 첫 버튼"""
+    for button in app.button:
+        if button.label.startswith(label_prefix):
+            return button
+    raise LookupError(f"버튼 없음: {label_prefix}")
+
+
+def run_level(sessions: int, rounds: int, think_ms: float, seed: int,
+              queries: List[str], timeout: float) -> Tuple[LevelResult, List[RerunSample]]:
+    """동시 세션 sessions개로 흐름 실행"""
+    drivers = [
+        SessionDriver(i, random.Random(f"{seed}:{sessions}:{i}"), queries, think_ms, timeout)
+        for i in range(sessions)
+    ]
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        list(pool.map(lambda driver: driver.run(rounds), drivers))
+    elapsed = time.perf_counter() - started
+
+    samples = [sample for driver in drivers for sample in driver.samples]
+    response = sorted(sample.response_ms for sample in samples)
+    service = sorted(sample.service_ms for sample in samples)
+    result = LevelResult(
+        sessions=sessions,
+        reruns=len(samples),
+        errors=sum(1 for sample in samples if sample.error),
+        elapsed_s=round(elapsed, 3),
+        reruns_per_s=round(len(samples) / elapsed, 2),
+        flows_per_s=round(sum(driver.flows for driver in drivers) / elapsed, 3),
+        utilization=round(sum(service) / 1000 / elapsed, 3),
+        p50_ms=round(percentile(response, 50), 1),
+        p95_ms=round(percentile(response, 95), 1),
+        p99_ms=round(percentile(response, 99), 1),
+        service_p50_ms=round(percentile(service, 50), 1),
+        service_p95_ms=round(percentile(service, 95), 1)
+    )
+    return result, samples
+
+
+def measure_session_memory(count: int, seed: int, queries: List[str], timeout: float) -> float:
+    """세션 count개가 흐름 1회 후 유지하는 메모리 (KiB/세션)
+
+    AppTest 요소 트리와 공유 캐시/저장소 증가분이 포함되므로 상한에 가까운 값입니다.
+    """
+    # 모듈 import, 컴포넌트 등록 등 1회성 비용 제외
+    SessionDriver(-1, random.Random(seed), queries, 0, timeout).run(1)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        drivers = [SessionDriver(i, random.Random(f"{seed}:memory:{i}"), queries, 0, timeout)
+                   for i in range(count)]
+        for driver in drivers:
+            driver.run(1)
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return (after - before) / count / 1024
+
+
+def summarize_steps(samples: List[RerunSample]) -> Dict[str, Dict[str, float]]:
+    """단계별 서비스 시간 요약"""
+    by_step: Dict[str, List[float]] = {}
+    for sample in samples:
+        by_step.setdefault(sample.step, []).append(sample.service_ms)
+    summary = {}
+    for step, values in by_step.items():
+        values.sort()
+        summary[step] = {
+            "count": len(values),
+            "p50_ms": round(percentile(values, 50), 1),
+            "p95_ms": round(percentile(values, 95), 1),
+            "mean_ms": round(statistics.fmean(values), 1)
+        }
+    return summary
+
+
+def format_levels(levels: List[LevelResult]) -> str:
+    """단계별 결과 표 문자열"""
+    lines = [f"{'sessions':>8} {'reruns':>7} {'errors':>6} {'rerun/s':>8} {'flow/s':>7} "
+             f"{'util':>5} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'svc p50':>8}"]
+    for level in levels:
+        lines.append(
+            f"{level.sessions:>8} {level.reruns:>7} {level.errors:>6} {level.reruns_per_s:>8.2f} "
+            f"{level.flows_per_s:>7.2f} {level.utilization:>5.2f} {level.p50_ms:>8.1f} "
+            f"{level.p95_ms:>8.1f} {level.p99_ms:>8.1f} {level.service_p50_ms:>8.1f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="MeetingAgent 다중 세션 부하 테스트")
+    parser.add_argument("--sessions", default="1,4,8,16", help="쉼표로 구분한 동시 세션 수")
+    parser.add_argument("--rounds", type=int, default=2, help="세션별 흐름 반복 횟수")
+    parser.add_argument("--think-ms", type=float, default=500,
+                        help="단계 사이 평균 생각 시간 (0이면 포화 부하)")
+    parser.add_argument("--scale", default="app", choices=["app", *SCALES],
+                        help="app: 앱 기본 샘플 데이터, 그 외: 합성 데이터 규모")
+    parser.add_argument("--memory-sessions", type=int, default=4,
+                        help="세션당 메모리 측정에 쓸 세션 수 (0이면 생략)")
+    parser.add_argument("--slo-ms", type=float, default=500, help="p95 응답 지연 목표")
+    parser.add_argument("--timeout", type=float, default=30, help="재실행 1회 제한 시간(초)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", metavar="PATH", help="결과를 JSON으로 저장")
+    args = parser.parse_args(argv)
+
+    set_log_level("error")
+
+    if args.scale != "app":
+        _, world, schedule_count = build_world(SCALES[args.scale], args.seed)
+        print(f"[{args.scale}] 임직원 {len(world.employees):,}명, 일정 {schedule_count:,}개",
+              file=sys.stderr)
+    queries = sorted({emp.name[:2] for emp in get_employee_api().employees})
+
+    levels: List[LevelResult] = []
+    samples: List[RerunSample] = []
+    memory_kib = None
+    # Mock API/서비스 로그 출력이 결과 표와 섞이지 않도록 stdout 차단
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        if args.memory_sessions > 0:
+            memory_kib = measure_session_memory(args.memory_sessions, args.seed, queries, args.timeout)
+        for sessions in (int(value) for value in args.sessions.split(",")):
+            level, level_samples = run_level(sessions, args.rounds, args.think_ms, args.seed,
+                                             queries, args.timeout)
+            levels.append(level)
+            samples.extend(level_samples)
+            print(f"  sessions={sessions} done ({level.elapsed_s:.1f}s)", file=sys.stderr)
+
+    print(format_levels(levels))
+
+    print("\n단계별 서비스 시간:")
+    steps = summarize_steps(samples)
+    for step, stats in steps.items():
+        print(f"  {step:<8} n={stats['count']:<5} p50 {stats['p50_ms']:>7.1f} ms   "
+              f"p95 {stats['p95_ms']:>7.1f} ms")
+
+    if memory_kib is not None:
+        print(f"\n세션당 메모리: {memory_kib:,.0f} KiB")
+
+    ceiling = max(levels, key=lambda level: level.reruns_per_s)
+    print(f"처리량 상한: {ceiling.reruns_per_s:.1f} rerun/s, {ceiling.flows_per_s:.2f} flow/s "
+          f"(동시 세션 {ceiling.sessions})")
+    within_slo = [level.sessions for level in levels if level.p95_ms <= args.slo_ms]
+    if within_slo:
+        print(f"p95 ≤ {args.slo_ms:.0f} ms를 만족하는 최대 동시 세션: {max(within_slo)}")
+    else:
+        print(f"p95 ≤ {args.slo_ms:.0f} ms를 만족하는 단계 없음")
+
+    errors = [sample for sample in samples if sample.error]
+    for sample in errors[:5]:
+        print(f"  오류 [{sample.step}] {sample.error}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({
+                "levels": [asdict(level) for level in levels],
+                "steps": steps,
+                "memory_kib_per_session": memory_kib,
+                "slo_ms": args.slo_ms
+            }, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.json}")
+
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
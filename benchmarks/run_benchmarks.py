@@ -0,0 +1,252 @@
+"""
+스케줄링/검색/AI 응답 핫패스 벤치마크
+
+사용법:
+    python -m benchmarks.run_benchmarks --scales small,medium
+    python -m benchmarks.run_benchmarks --save-baseline benchmarks/baseline.json
+    python -m benchmarks.run_benchmarks --compare benchmarks/baseline.json
+"""
+import argparse
+import contextlib
+import os
+import random
+import sys
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Callable, Dict, List
+
+from benchmarks.harness import (
+    BenchmarkResult, measure, save_baseline, compare_with_baseline, format_table
+)
+from benchmarks.llm_stub import STUB_RESPONSE, StubGenAIClient
+from src.api.employee_api import get_employee_api
+from src.api.schedule_api import MockScheduleAPI, get_schedule_api
+from src.api.synthetic_data import SyntheticDataGenerator
+from src.models.chat import LLMResponse
+from src.models.meeting import Meeting, Attendee, AttendeeRole
+from src.services.ai_service import AIService
+from src.services.attendee_service import AttendeeService
+from src.services.meeting_service import MeetingService
+
+
+@dataclass
+class Scale:
+    """데이터 규모"""
+    name: str
+    employees: int
+    ad_hoc_per_day: float
+    attendees: int
+
+
+SCALES = {
+    "small": Scale("small", employees=1_000, ad_hoc_per_day=1.0, attendees=5),
+    "medium": Scale("medium", employees=10_000, ad_hoc_per_day=1.5, attendees=25),
+    "large": Scale("large", employees=50_000, ad_hoc_per_day=2.0, attendees=40),
+}
+
+
+def _vowel_typo(syllable: str) -> str:
+    """음절의 모음을 다음 모음으로 바꾼 오타 ('수' -> '숴')"""
+    offset = ord(syllable) - 0xAC00
+    vowel = (offset % 588) // 28
+    return chr(ord(syllable) + ((vowel + 1) % 21 - vowel) * 28)
+
+
+def build_world(scale: Scale, seed: int):
+    """규모별 합성 데이터를 Mock 백엔드에 적재"""
+    generator = SyntheticDataGenerator(seed=seed, employee_count=scale.employees,
+                                       ad_hoc_per_day=scale.ad_hoc_per_day)
+    world, schedule_count = generator.populate(MockScheduleAPI(generate_sample_data=False))
+    return generator, world, schedule_count
+
+
+def benchmark_scale(scale: Scale, seed: int, iterations: int) -> List[BenchmarkResult]:
+    """한 규모에 대한 전체 벤치마크 실행"""
+    generator, world, schedule_count = build_world(scale, seed)
+    print(f"[{scale.name}] 임직원 {len(world.employees):,}명, 일정 {schedule_count:,}개", file=sys.stderr)
+
+    rng = random.Random(seed)
+    emp_api = get_employee_api()
+    schedule_api = get_schedule_api()
+
+    employees = world.employees
+    attendees = rng.sample(employees, scale.attendees)
+    attendee_ids = [emp.id for emp in attendees]
+    meeting_day = world.start_date + timedelta(days=8)  # 둘째 주 화요일
+    meeting = Meeting(
+        title="벤치마크 회의",
+        start_time=meeting_day.replace(hour=14),
+        end_time=meeting_day.replace(hour=15),
+        content="",
+        attendees=[
+            Attendee(emp.id, emp.name, emp.team,
+                     AttendeeRole.ORGANIZER if i == 0 else AttendeeRole.REQUIRED)
+            for i, emp in enumerate(attendees)
+        ]
+    )
+    name_queries = [emp.name[:2] for emp in rng.sample(employees, 50)]
+    # LLM이 추출한 참석자 목록: 정확한 이름, 띄어쓰기 변형, 모음 오타 섞음
+    resolve_names = [
+        (emp.name, f"{emp.name[0]} {emp.name[1:]}", emp.name[:-1] + _vowel_typo(emp.name[-1]))[i % 3]
+        for i, emp in enumerate(rng.sample(employees, 30))
+    ]
+    all_hands_names = [emp.name for emp in rng.sample(employees, min(300, len(employees)))]
+    llm_response = LLMResponse(
+        action="update",
+        updates={
+            "title": "팀 미팅",
+            "start_time": meeting_day.replace(hour=10).strftime("%Y-%m-%d %H:%M"),
+            "attendees": ", ".join(emp.name for emp in attendees[:5])
+        }
+    )
+
+    ai_service = AIService()
+    ai_service.client = StubGenAIClient()
+    ai_service.is_initialized = True
+
+    def check_conflicts(i: int):
+        start = meeting.start_time + timedelta(minutes=30 * (i % 16))
+        schedule_api.check_conflicts(attendee_ids, start, start + timedelta(hours=1))
+
+    def attendee_table_rerun(i: int):
+        # 제목/내용 입력으로 인한 rerun: 참석자/시간이 같으므로 캐시 적중
+        MeetingService.check_attendee_conflicts(meeting)
+
+    big_meeting = Meeting(title="대규모 회의", start_time=meeting.start_time,
+                          end_time=meeting.end_time, content="", attendees=[])
+    AttendeeService.add_attendees(big_meeting, [emp.id for emp in employees[:200]],
+                                  AttendeeRole.REQUIRED)
+
+    def incremental_conflicts(i: int):
+        # 200명 회의에서 참석자 한 명 추가 후 종료 시간 10분 연장
+        AttendeeService.add_attendee(big_meeting, employees[(200 + i) % len(employees)].id,
+                                     AttendeeRole.OPTIONAL)
+        MeetingService.check_attendee_conflicts(big_meeting)
+        big_meeting.end_time += timedelta(minutes=10)
+        MeetingService.check_attendee_conflicts(big_meeting)
+
+    def suggest_alternative_times(i: int):
+        schedule_api.suggest_alternative_times(attendee_ids, 60, meeting_day + timedelta(days=i % 5))
+
+    def find_available_slots(i: int):
+        schedule_api.find_available_slots(attendee_ids, 60, world.start_date,
+                                          world.start_date + timedelta(days=14))
+
+    def search_by_name(i: int):
+        emp_api.search_by_name(name_queries[i % len(name_queries)])
+
+    def resolve_names_30(i: int):
+        for name in resolve_names:
+            emp_api.resolve_name(name)
+
+    def add_attendees_by_names_300(i: int):
+        # 전체 회의 초대처럼 긴 이름 목록을 빈 회의에 일괄 추가
+        target = Meeting(title="", start_time=meeting.start_time, end_time=meeting.end_time,
+                         content="", attendees=[])
+        AttendeeService.add_attendees_by_names(target, all_hands_names, AttendeeRole.REQUIRED)
+
+    town_hall = Meeting(title="타운홀", start_time=meeting.start_time, end_time=meeting.end_time,
+                        content="", attendees=[])
+    AttendeeService.add_attendees(town_hall, [emp.id for emp in employees[:500]], AttendeeRole.REQUIRED)
+
+    def town_hall_attendee_ops(i: int):
+        # 500명 회의에서 역할 변경, 삭제 후 재추가, 요약 집계
+        emp = employees[i % min(500, len(employees))]
+        AttendeeService.update_attendee_role(town_hall, emp.id, AttendeeRole.OPTIONAL)
+        AttendeeService.remove_attendees(town_hall, [emp.id])
+        AttendeeService.add_attendee(town_hall, emp.id, AttendeeRole.REQUIRED)
+        town_hall.get_organizer()
+        MeetingService.validate_meeting(town_hall)
+
+    def search_employees(i: int):
+        AttendeeService.search_employees(name_queries[i % len(name_queries)])
+
+    def update_meeting_from_llm(i: int):
+        MeetingService.update_meeting_from_llm_response(meeting, llm_response)
+
+    def extract_json(i: int):
+        ai_service._extract_json(STUB_RESPONSE)
+
+    def process_prompt_stream(i: int):
+        # 매번 다른 프롬프트로 fast-path와 응답 캐시를 우회해 LLM 경로 측정
+        for _ in ai_service.process_prompt_stream(f"회의 안건 정리해줘 {i}", meeting):
+            pass
+
+    def process_prompt_fast_path(i: int):
+        for _ in ai_service.process_prompt_stream("내일 오후 2시에 팀 미팅 잡아줘", meeting):
+            pass
+
+    schedule_ids = [schedule.schedule_id for schedule in schedule_api.schedules[:iterations * 2]]
+
+    def update_schedule(i: int):
+        schedule_api.update_schedule(schedule_ids[i % len(schedule_ids)], title=f"수정 {i}")
+
+    def delete_schedule(i: int):
+        schedule_api.delete_schedule(schedule_ids.pop())
+
+    benchmarks: Dict[str, Callable[[int], None]] = {
+        "check_conflicts": check_conflicts,
+        "attendee_table_rerun": attendee_table_rerun,
+        "incremental_conflicts": incremental_conflicts,
+        "suggest_alternative_times": suggest_alternative_times,
+        "find_available_slots": find_available_slots,
+        "search_by_name": search_by_name,
+        "resolve_name_x30": resolve_names_30,
+        "add_attendees_by_names_x300": add_attendees_by_names_300,
+        "town_hall_attendee_ops": town_hall_attendee_ops,
+        "search_employees": search_employees,
+        "update_meeting_from_llm_response": update_meeting_from_llm,
+        "extract_json": extract_json,
+        "process_prompt_stream": process_prompt_stream,
+        "process_prompt_fast_path": process_prompt_fast_path,
+        "update_schedule": update_schedule,
+        "delete_schedule": delete_schedule,
+    }
+
+    # AI 응답 경로는 느리므로 반복 횟수를 줄임
+    slow = {"process_prompt_stream", "find_available_slots"}
+    results = []
+    # Mock API 로그 출력이 결과 표와 섞이지 않도록 stdout 차단
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for name, func in benchmarks.items():
+            count = max(iterations // 10, 5) if name in slow else iterations
+            results.append(measure(name, scale.name, func, iterations=count))
+    return results
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="MeetingAgent 핫패스 벤치마크")
+    parser.add_argument("--scales", default="small,medium",
+                        help=f"쉼표로 구분한 규모 ({', '.join(SCALES)})")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--save-baseline", metavar="PATH", help="결과를 JSON 기준선으로 저장")
+    parser.add_argument("--compare", metavar="PATH", help="JSON 기준선과 비교")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="회귀로 판단할 p50 배율 (기본 1.25)")
+    args = parser.parse_args(argv)
+
+    results: List[BenchmarkResult] = []
+    for scale_name in args.scales.split(","):
+        results.extend(benchmark_scale(SCALES[scale_name.strip()], args.seed, args.iterations))
+
+    print(format_table(results))
+
+    if args.save_baseline:
+        save_baseline(args.save_baseline, results)
+        print(f"기준선 저장: {args.save_baseline}")
+
+    if args.compare:
+        regressions = compare_with_baseline(args.compare, results, args.threshold)
+        if regressions:
+            print("성능 회귀:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("기준선 대비 회귀 없음")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""
+일정 ID 조회/수정/삭제 지연시간 벤치마크
+
+전체 일정 수를 늘려 가며 get_schedule, update_schedule, delete_schedule의 p50/p99를
+측정해 지연시간이 일정 수와 무관하게 평탄한지 확인합니다. 시간을 옮기는
+reschedule_schedule은 임직원 인덱스 재등록(정렬 리스트 삽입/삭제, 임직원당 일정 수 k에
+O(k))을 거치므로, 임직원당 일정 수도 일반 달력(20개)과 빽빽한 달력(2000개)으로 나눠
+측정합니다.
+
+일정 1개당 인덱스 포함 약 0.5KB를 쓰므로 1천만 개는 5GB 이상의 메모리가 필요해
+기본 규모에서 빠져 있습니다. 필요하면 --counts에 직접 지정하세요.
+
+사용법:
+    python -m benchmarks.schedule_lookup
+    python -m benchmarks.schedule_lookup --counts 10000,100000,1000000,10000000
+    python -m benchmarks.schedule_lookup --per-employee 20,1000,5000
+"""
+import argparse
+import contextlib
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+from typing import Iterator, List
+
+from benchmarks.harness import BenchmarkResult, format_table, measure
+from src.api.schedule_api import MockScheduleAPI
+from src.models.employee import Schedule
+
+DEFAULT_COUNTS = "10000,100000,1000000"
+DEFAULT_PER_EMPLOYEE = "20,2000"
+BASE_TIME = datetime(2030, 1, 7, 9)
+
+
+def iter_schedules(count: int, per_employee: int) -> Iterator[Schedule]:
+    """임직원당 per_employee개씩 30분 간격 일정 생성"""
+    for i in range(count):
+        start = BASE_TIME + timedelta(minutes=30 * (i % per_employee))
+        yield Schedule(
+            schedule_id=f"S{i:08d}",
+            employee_id=f"E{i // per_employee:07d}",
+            title="일정",
+            start_datetime=start,
+            end_datetime=start + timedelta(minutes=30)
+        )
+
+
+def benchmark_count(count: int, per_employee: int, iterations: int, seed: int) -> List[BenchmarkResult]:
+    """일정 count개(임직원당 per_employee개) 저장소에서 ID 기반 연산 측정"""
+    schedule_api = MockScheduleAPI(generate_sample_data=False)
+    schedule_api.add_schedules(iter_schedules(count, per_employee))
+    scale = f"{count:,}x{per_employee:,}"
+
+    rng = random.Random(seed)
+    # 삭제 대상은 조회/수정 대상과 겹치지 않게 한 번에 뽑음
+    sampled = [f"S{i:08d}" for i in rng.sample(range(count), min(count, iterations * 2))]
+    lookup_ids, delete_ids = sampled[:iterations], sampled[iterations:]
+
+    def get_schedule(i: int):
+        schedule_api.get_schedule(lookup_ids[i % len(lookup_ids)])
+
+    def update_schedule(i: int):
+        schedule_api.update_schedule(lookup_ids[i % len(lookup_ids)], title=f"수정 {i}")
+
+    def reschedule_schedule(i: int):
+        # 달력 맨 앞으로 옮겨 인덱스 삽입 위치 이후 전체가 밀리도록 함 (최악의 경우)
+        start = BASE_TIME - timedelta(days=1, minutes=i)
+        schedule_api.update_schedule(lookup_ids[i % len(lookup_ids)], start_datetime=start,
+                                     end_datetime=start + timedelta(minutes=30))
+
+    def delete_schedule(i: int):
+        schedule_api.delete_schedule(delete_ids.pop())
+
+    results = []
+    # Mock API 로그 출력이 결과 표와 섞이지 않도록 stdout 차단
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for name, func in (("get_schedule", get_schedule), ("update_schedule", update_schedule),
+                           ("reschedule_schedule", reschedule_schedule),
+                           ("delete_schedule", delete_schedule)):
+            results.append(measure(name, scale, func, iterations=iterations - 10))
+    return results
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="일정 ID 조회/수정/삭제 지연시간 벤치마크")
+    parser.add_argument("--counts", default=DEFAULT_COUNTS, help="쉼표로 구분한 전체 일정 수")
+    parser.add_argument("--per-employee", default=DEFAULT_PER_EMPLOYEE,
+                        help="쉼표로 구분한 임직원당 일정 수")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    results: List[BenchmarkResult] = []
+    for per_employee in (int(value) for value in args.per_employee.split(",")):
+        for count in (int(value) for value in args.counts.split(",")):
+            print(f"[{count:,}x{per_employee:,}] 일정 적재 중", file=sys.stderr)
+            results.extend(benchmark_count(count, per_employee, args.iterations, args.seed))
+
+    print(format_table(results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,15 +2,80 @@
 임직원 조회 Mock API
 """
 import random
-from typing import List, Optional
-from src.models.employee import Employee
+from typing import Dict, Iterable, List, Optional
+from src.models.employee import Employee, NameMatch, NameResolution
+from src.api.employee_index import NgramIndex
+from src.api.name_index import NameIndex, edit_distance, normalize_name
+from src.api.typeahead_index import TypeaheadIndex
+from src.utils.hangul import decompose
 
 
 class MockEmployeeAPI:
     """임직원 조회 시스템 Mock API"""
 
-    def __init__(self):
-        self.employees = self._generate_sample_employees()
+    def __init__(self, employees: Optional[List[Employee]] = None):
+        # 검색 색인 (문서 ID는 등록 순서, 결과를 기존 목록 순서로 유지)
+        self._next_doc_id = 0
+        self._doc_ids: Dict[str, int] = {}
+        self._docs: Dict[int, Employee] = {}
+        # 해시 색인: id / 팀 / 이메일
+        self._by_id: Dict[str, Employee] = {}
+        self._by_team: Dict[str, Dict[str, Employee]] = {}
+        self._by_email: Dict[str, Employee] = {}
+        self._name_index = NgramIndex()
+        self._team_index = NgramIndex()
+        self._email_index = NgramIndex()
+        self._typeahead_index = TypeaheadIndex()
+        self._fuzzy_name_index = NameIndex()
+
+        initial = employees if employees is not None else self._generate_sample_employees()
+        for emp in initial:
+            self.add_employee(emp)
+
+    @property
+    def employees(self) -> List[Employee]:
+        """전체 임직원 목록 (등록 순서)"""
+        return list(self._docs.values())
+
+    def add_employee(self, employee: Employee) -> None:
+        """임직원 추가 및 색인 등록"""
+        if employee.id in self._doc_ids:
+            self.remove_employee(employee.id)
+
+        doc_id = self._next_doc_id
+        self._next_doc_id += 1
+        self._doc_ids[employee.id] = doc_id
+        self._docs[doc_id] = employee
+        self._by_id[employee.id] = employee
+        self._by_team.setdefault(employee.team, {})[employee.id] = employee
+        if employee.email:
+            self._by_email[employee.email] = employee
+        self._name_index.add(doc_id, employee.name)
+        self._team_index.add(doc_id, employee.team)
+        self._email_index.add(doc_id, employee.email)
+        self._typeahead_index.add(doc_id, employee.name)
+        self._fuzzy_name_index.add(doc_id, employee.name)
+
+    def remove_employee(self, employee_id: str) -> bool:
+        """임직원 제거 및 색인 해제"""
+        doc_id = self._doc_ids.pop(employee_id, None)
+        if doc_id is None:
+            return False
+
+        employee = self._docs.pop(doc_id)
+        del self._by_id[employee_id]
+        team_members = self._by_team[employee.team]
+        del team_members[employee_id]
+        if not team_members:
+            del self._by_team[employee.team]
+        if self._by_email.get(employee.email) is employee:
+            del self._by_email[employee.email]
+        self._name_index.remove(doc_id)
+        self._team_index.remove(doc_id)
+        self._email_index.remove(doc_id)
+        self._typeahead_index.remove(doc_id)
+        self._fuzzy_name_index.remove(doc_id)
+        return True
 
     def _generate_sample_employees(self) -> List[Employee]:
         """샘플 임직원 데이터 생성"""
@@ -35,19 +100,84 @@ class MockEmployeeAPI:
         return employees
 
     def search_by_name(self, name: str) -> List[Employee]:
-        """이름으로 임직원 검색"""
-        return [emp for emp in self.employees if name in emp.name]
+        """이름으로 임직원 검색 (부분 문자열)"""
+        return [self._docs[doc_id] for doc_id in self._name_index.search(name)]
+
+    def typeahead(self, query: str, top_k: int = 10) -> List[Employee]:
+        """이름 자동완성 (부분 음절/초성 입력 지원, 순위순)"""
+        return [self._docs[doc_id] for doc_id in self._typeahead_index.search(query, top_k)]
+
+    def resolve_name(self, name: str, max_distance: Optional[int] = None) -> List[NameMatch]:
+        """오타/띄어쓰기/호칭을 보정해 가장 가까운 임직원 조회
+
+        같은 거리의 후보가 여러 명이면 (동명이인 등) 모두 반환합니다. 오타 보정으로
+        찾지 못하면 '철수', '김철'처럼 이름 일부만 쓴 경우로 보고 부분 문자열 검색
+        결과를 후보로 반환합니다 (두 글자 이상일 때만).
+        """
+        matches = [
+            NameMatch(employee=self._docs[doc_id], distance=distance, confidence=confidence)
+            for distance, confidence, doc_ids in self._fuzzy_name_index.search(name, max_distance)
+            for doc_id in doc_ids
+        ]
+        if matches:
+            return matches
+
+        query = normalize_name(name)
+        if len(query) < 2:
+            return []
+        key = decompose(query)
+        results = []
+        for doc_id in self._name_index.search(query):
+            employee = self._docs[doc_id]
+            distance = edit_distance(key, decompose(employee.name))
+            results.append(NameMatch(employee=employee, distance=distance,
+                                     confidence=round(len(query) / len(employee.name), 2)))
+        return results
+
+    def resolve_names(self, names: Iterable[str]) -> NameResolution:
+        """이름 목록 일괄 보정 (같은 이름은 한 번만 조회)"""
+        resolution = NameResolution()
+        seen = set()
+        for name in names:
+            name = name.strip()
+            key = normalize_name(name)
+            if not key or key in seen:
+                continue
+            seen.add(key)
+
+            matches = self.resolve_name(name)
+            if len(matches) == 1:
+                resolution.resolved[name] = matches[0]
+            elif matches:
+                resolution.ambiguous[name] = matches
+            else:
+                resolution.unresolved.append(name)
+        return resolution
+
+    def search_by_team(self, team: str) -> List[Employee]:
+        """팀 이름으로 임직원 검색 (부분 문자열)"""
+        return [self._docs[doc_id] for doc_id in self._team_index.search(team)]
+
+    def search_by_email(self, email: str) -> List[Employee]:
+        """이메일로 임직원 검색 (부분 문자열)"""
+        return [self._docs[doc_id] for doc_id in self._email_index.search(email)]
 
     def get_team_members(self, team: str) -> List[Employee]:
         """팀별 임직원 조회"""
-        return [emp for emp in self.employees if emp.team == team]
+        return list(self._by_team.get(team, {}).values())
 
     def get_employee_by_id(self, employee_id: str) -> Optional[Employee]:
         """ID로 임직원 조회"""
-        for emp in self.employees:
-            if emp.id == employee_id:
-                return emp
-        return None
+        return self._by_id.get(employee_id)
+
+    def get_employees_by_ids(self, employee_ids: List[str]) -> Dict[str, Employee]:
+        """여러 ID를 한 번에 조회 (없는 ID는 제외)"""
+        by_id = self._by_id
+        return {emp_id: by_id[emp_id] for emp_id in employee_ids if emp_id in by_id}
+
+    def get_employee_by_email(self, email: str) -> Optional[Employee]:
+        """이메일로 임직원 조회"""
+        return self._by_email.get(email)
 
     def get_all_employees(self) -> List[Employee]:
         """전체 임직원 조회"""
@@ -55,7 +185,7 @@ class MockEmployeeAPI:
 
     def get_all_teams(self) -> List[str]:
         """전체 팀 목록 조회"""
-        return list(set(emp.team for emp in self.employees))
+        return list(self._by_team)
 
 
 # 싱글톤 인스턴스
@@ -67,4 +197,10 @@ def get_employee_api() -> MockEmployeeAPI:
     global _employee_api_instance
     if _employee_api_instance is None:
         _employee_api_instance = MockEmployeeAPI()
-    return _employee_api_instance
\ No newline at end of file
+    return _employee_api_instance
+
+
+def set_employee_api(employee_api: MockEmployeeAPI) -> None:
+    """임직원 API 인스턴스 교체 (벤치마크/합성 데이터용)"""
+    global _employee_api_instance
+    _employee_api_instance = employee_api
@@ -0,0 +1,70 @@
+"""
+임직원 검색용 N-gram 역색인
+"""
+from typing import Dict, Iterable, List, Set
+
+
+class NgramIndex:
+    """문자 n-gram 역색인 (부분 문자열 검색)
+
+    1-gram부터 n-gram까지의 포스팅 리스트를 유지합니다. 질의의 n-gram 포스팅을
+    작은 것부터 교집합한 뒤 실제 포함 여부를 확인하므로, 결과는
+    `query in value` 선형 검색과 동일합니다.
+    """
+
+    def __init__(self, n: int = 2):
+        self.n = n
+        self._values: Dict[int, str] = {}
+        self._postings: Dict[str, Set[int]] = {}
+
+    def add(self, doc_id: int, value: str) -> None:
+        """문서 추가 (같은 doc_id가 있으면 교체)"""
+        if doc_id in self._values:
+            self.remove(doc_id)
+        self._values[doc_id] = value
+        for gram in self._grams(value):
+            self._postings.setdefault(gram, set()).add(doc_id)
+
+    def remove(self, doc_id: int) -> None:
+        """문서 제거"""
+        value = self._values.pop(doc_id, None)
+        if value is None:
+            return
+        for gram in self._grams(value):
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(doc_id)
+                if not posting:
+                    del self._postings[gram]
+
+    def search(self, query: str) -> List[int]:
+        """query를 포함하는 문서 ID (오름차순)"""
+        if not query:
+            return sorted(self._values)
+
+        size = min(len(query), self.n)
+        grams = {query[i:i + size] for i in range(len(query) - size + 1)}
+        postings = []
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if not posting:
+                return []
+            postings.append(posting)
+
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                return []
+
+        if len(query) > self.n:
+            candidates = {doc_id for doc_id in candidates if query in self._values[doc_id]}
+        return sorted(candidates)
+
+    def _grams(self, value: str) -> Iterable[str]:
+        grams = set()
+        for size in range(1, self.n + 1):
+            for i in range(len(value) - size + 1):
+                grams.add(value[i:i + size])
+        return grams
@@ -0,0 +1,86 @@
+"""
+Free/Busy 비트맵 엔진
+"""
+import math
+from datetime import datetime, timedelta
+from typing import Iterable
+
+import numpy as np
+
+from src.models.employee import Schedule
+
+# 샘플 일정 생성기와 동일한 10분 단위
+SLOT_MINUTES = 10
+
+
+class FreeBusyGrid:
+    """기간을 10분 슬롯으로 나눈 참석자 합산 점유 배열
+
+    충돌 수는 일정의 정확한 시작/종료 시각을 정렬해 두고, 모든 후보 시작 슬롯에 대해
+    "회의 종료 전에 시작한 일정 수 - 회의 시작 전에 끝난 일정 수"를 searchsorted로
+    한 번에 계산하므로, 10분 단위가 아닌 회의 길이(예: 45분)나 일정도 구간 비교와
+    같은 결과를 냅니다.
+    """
+
+    def __init__(self, window_start: datetime, window_end: datetime,
+                 slot_minutes: int = SLOT_MINUTES):
+        self.window_start = window_start
+        self.slot_minutes = slot_minutes
+        self.slot_count = self._ceil_slot(window_end)
+        # window_start 기준 분 단위의 정확한 일정 시작/종료 (정렬 상태 유지)
+        self._start_minutes = np.zeros(0)
+        self._end_minutes = np.zeros(0)
+
+    def add_schedules(self, schedules: Iterable[Schedule]) -> None:
+        """일정 목록을 정렬된 시작/종료 배열에 병합"""
+        starts, ends = [], []
+        for schedule in schedules:
+            starts.append(self._minutes(schedule.start_datetime))
+            ends.append(self._minutes(schedule.end_datetime))
+        if not starts:
+            return
+
+        self._start_minutes = _merge_sorted(self._start_minutes, np.sort(starts))
+        self._end_minutes = _merge_sorted(self._end_minutes, np.sort(ends))
+
+    def conflict_counts(self, duration_minutes: int) -> np.ndarray:
+        """모든 시작 슬롯에 대해 duration 동안 겹치는 일정 수
+
+        반환 배열의 i번째 값은 i번째 슬롯에서 시작하는 회의의 충돌 수이며,
+        기간을 벗어나는 시작 슬롯은 포함하지 않습니다.
+        """
+        width = max(1, math.ceil(duration_minutes / self.slot_minutes))
+        if width > self.slot_count:
+            return np.zeros(0, dtype=np.int32)
+
+        last_start = self.slot_count - width
+        candidate_starts = np.arange(last_start + 1) * self.slot_minutes
+        # 회의 종료 전에 시작한 일정 수 - 회의 시작 시각까지 끝난 일정 수
+        started_before = np.searchsorted(self._start_minutes,
+                                         candidate_starts + duration_minutes, side="left")
+        ended_by = np.searchsorted(self._end_minutes, candidate_starts, side="right")
+        return (started_before - ended_by).astype(np.int32)
+
+    def slot_index(self, dt: datetime) -> int:
+        """시각에 해당하는 슬롯 번호 (경계에 맞지 않으면 내림)"""
+        return self._floor_slot(dt)
+
+    def slot_time(self, index: int) -> datetime:
+        """슬롯 번호의 시작 시각"""
+        return self.window_start + timedelta(minutes=index * self.slot_minutes)
+
+    def _minutes(self, dt: datetime) -> float:
+        return (dt - self.window_start).total_seconds() / 60
+
+    def _floor_slot(self, dt: datetime) -> int:
+        return math.floor((dt - self.window_start).total_seconds() / 60 / self.slot_minutes)
+
+    def _ceil_slot(self, dt: datetime) -> int:
+        return math.ceil((dt - self.window_start).total_seconds() / 60 / self.slot_minutes)
+
+
+def _merge_sorted(existing: np.ndarray, chunk: np.ndarray) -> np.ndarray:
+    """정렬된 배열에 정렬된 새 값들을 끼워 넣음 (전체 재정렬 없이 O(n + k))"""
+    if not len(existing):
+        return chunk
+    return np.insert(existing, np.searchsorted(existing, chunk, side="right"), chunk)
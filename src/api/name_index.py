@@ -0,0 +1,195 @@
+"""
+임직원 이름 오타 보정 색인 (BK-tree)
+"""
+from typing import Dict, List, Optional, Set, Tuple
+
+from src.utils.hangul import decompose
+
+# LLM이 이름 뒤에 붙이는 호칭
+HONORIFIC_SUFFIXES = ("님", "씨")
+
+
+def normalize_name(name: str) -> str:
+    """공백과 호칭 제거 ('김 철수님' -> '김철수')"""
+    name = "".join(name.split())
+    for suffix in HONORIFIC_SUFFIXES:
+        if name.endswith(suffix) and len(name) > len(suffix) + 1:
+            return name[:-len(suffix)]
+    return name
+
+
+def edit_distance(a: str, b: str) -> int:
+    """레벤슈타인 거리"""
+    if not a or not b:
+        return len(a) + len(b)
+    return _BitParallelDistance(a).to(b)
+
+
+class _BitParallelDistance:
+    """한 문자열에서 여러 문자열까지의 레벤슈타인 거리 (Myers 비트 병렬 알고리즘)
+
+    문자별 위치 비트마스크를 한 번만 만들어 두고, 상대 문자열의 문자마다
+    정수 연산 몇 번으로 DP 열 전체를 갱신합니다.
+    """
+
+    __slots__ = ("length", "mask", "high", "peq")
+
+    def __init__(self, pattern: str):
+        self.length = len(pattern)
+        self.mask = (1 << self.length) - 1
+        self.high = 1 << (self.length - 1)
+        self.peq: Dict[str, int] = {}
+        for i, char in enumerate(pattern):
+            self.peq[char] = self.peq.get(char, 0) | (1 << i)
+
+    def to(self, text: str) -> int:
+        mask, high, peq = self.mask, self.high, self.peq
+        pv, mv, score = mask, 0, self.length
+        for char in text:
+            eq = peq.get(char, 0)
+            xv = eq | mv
+            xh = (((eq & pv) + pv) ^ pv) | eq
+            ph = mv | ~(xh | pv)
+            mh = pv & xh
+            if ph & high:
+                score += 1
+            elif mh & high:
+                score -= 1
+            ph = (ph << 1) | 1
+            mh <<= 1
+            pv = (mh | ~(xv | ph)) & mask
+            mv = ph & xv
+        return score
+
+
+class _BKNode:
+    __slots__ = ("key", "entries", "children")
+
+    def __init__(self, key: str):
+        self.key = key
+        self.entries: Set[int] = set()
+        self.children: Dict[int, "_BKNode"] = {}
+
+
+class NameIndex:
+    """자모 단위 편집 거리 BK-tree
+
+    이름을 공백/호칭을 뗀 뒤 자모열로 분해해 BK-tree에 넣으므로 '김철슈'처럼
+    모음 하나가 틀린 이름도 거리 1로 찾습니다. 같은 이름의 임직원은 한 노드에
+    모이고, 정확히 일치하는 이름은 트리를 타지 않고 해시로 바로 찾습니다.
+    가장 흔한 거리 1 오타는 자모 하나를 지운 키의 해시(삭제 이웃)로 후보를 좁혀
+    트리 탐색 없이 처리하고, 거리 2 이상만 BK-tree를 탐색합니다.
+    BK-tree는 삭제를 지원하지 않으므로 제거 시 노드의 문서만 비웁니다.
+    """
+
+    def __init__(self):
+        self._root: Optional[_BKNode] = None
+        self._exact: Dict[str, _BKNode] = {}
+        self._keys: Dict[int, str] = {}
+        # 자모 하나를 지운 키 -> 원래 키 (거리 1 후보 탐색용)
+        self._deletes: Dict[str, Set[str]] = {}
+
+    def add(self, doc_id: int, name: str) -> None:
+        """이름 등록"""
+        if doc_id in self._keys:
+            self.remove(doc_id)
+        key = decompose(normalize_name(name))
+        self._keys[doc_id] = key
+        self._insert(key).entries.add(doc_id)
+
+    def remove(self, doc_id: int) -> None:
+        """이름 제거"""
+        key = self._keys.pop(doc_id, None)
+        if key is not None:
+            self._exact[key].entries.discard(doc_id)
+
+    def search(self, name: str, max_distance: Optional[int] = None) -> List[Tuple[int, float, List[int]]]:
+        """가장 가까운 이름의 (거리, 신뢰도, 문서 ID 목록) 반환
+
+        최소 거리에 있는 이름이 여러 개면 모두 반환합니다. max_distance를 생략하면
+        자모 4개당 1로 잡습니다 (세 글자 이름은 2).
+        """
+        key = decompose(normalize_name(name))
+        if not key:
+            return []
+
+        node = self._exact.get(key)
+        if node is not None and node.entries:
+            return [(0, 1.0, sorted(node.entries))]
+
+        if max_distance is None:
+            max_distance = max(1, len(key) // 4)
+        if max_distance < 1:
+            return []
+
+        distance_to = _BitParallelDistance(key).to
+        neighbors = [node for node in self._one_edit_neighbors(key, distance_to) if node.entries]
+        if neighbors:
+            return self._results(key, 1, neighbors)
+        if max_distance == 1:
+            return []
+
+        best_distance = max_distance
+        best: List[_BKNode] = []
+        stack = [self._root] if self._root else []
+        while stack:
+            node = stack.pop()
+            distance = distance_to(node.key)
+            if node.entries and distance <= best_distance:
+                if distance < best_distance or not best:
+                    best_distance, best = distance, []
+                best.append(node)
+            # 후보 범위를 현재까지의 최소 거리로 좁혀 탐색
+            for child_distance, child in node.children.items():
+                if distance - best_distance <= child_distance <= distance + best_distance:
+                    stack.append(child)
+
+        return self._results(key, best_distance, best)
+
+    def _one_edit_neighbors(self, key: str, distance_to) -> List[_BKNode]:
+        """편집 거리가 정확히 1인 등록 키의 노드"""
+        candidates = set(self._deletes.get(key, ()))
+        for variant in _single_deletes(key):
+            if variant in self._exact:
+                candidates.add(variant)
+            candidates.update(self._deletes.get(variant, ()))
+        candidates.discard(key)
+        return [self._exact[candidate] for candidate in candidates
+                if distance_to(candidate) == 1]
+
+    @staticmethod
+    def _results(key: str, distance: int,
+                 nodes: List[_BKNode]) -> List[Tuple[int, float, List[int]]]:
+        results = []
+        for node in sorted(nodes, key=lambda n: min(n.entries)):
+            confidence = 1.0 - distance / max(len(key), len(node.key))
+            results.append((distance, confidence, sorted(node.entries)))
+        return results
+
+    def _insert(self, key: str) -> _BKNode:
+        node = self._exact.get(key)
+        if node is not None:
+            return node
+
+        new_node = _BKNode(key)
+        self._exact[key] = new_node
+        for variant in _single_deletes(key):
+            self._deletes.setdefault(variant, set()).add(key)
+        if self._root is None:
+            self._root = new_node
+            return new_node
+
+        distance_to = _BitParallelDistance(key).to
+        node = self._root
+        while True:
+            distance = distance_to(node.key)
+            child = node.children.get(distance)
+            if child is None:
+                node.children[distance] = new_node
+                return new_node
+            node = child
+
+
+def _single_deletes(key: str) -> Set[str]:
+    """문자 하나를 지운 문자열 집합"""
+    return {key[:i] + key[i + 1:] for i in range(len(key))}
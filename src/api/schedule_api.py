@@ -1,20 +1,59 @@
 """
 일정 관리 Mock API
 """
+import heapq
+import math
+from abc import ABC, abstractmethod
 import random
+import threading
 import uuid
-from datetime import datetime, timedelta
-from typing import List, Dict
-from src.models.employee import Schedule
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple
+from src.models.employee import Schedule, BookingResult, MeetingScheduleChanges
+from src.models.meeting import AttendeeRole
+from src.utils.config import (
+    ROLE_CONFLICT_WEIGHTS, SCHEDULE_BACKEND, SCHEDULE_DB_PATH, SCHEDULE_LOCK_SHARDS
+)
 from src.api.employee_api import get_employee_api
+from src.api.schedule_index import ScheduleIndex
+from src.api.free_busy import FreeBusyGrid, SLOT_MINUTES
 
 
-class MockScheduleAPI:
-    """임직원 일정 관리 시스템 Mock API"""
+class BaseScheduleAPI(ABC):
+    """일정 관리 API 공통 구현
 
-    def __init__(self):
-        self.schedules: List[Schedule] = []
-        self._generate_sample_schedules()
+    저장소별 구현은 일정 저장/조회/수정/삭제, 충돌 조회, 회의별 일정 조회(추상 메서드)만
+    제공하면 되고, 회의 일정 일괄 생성/예약/수정, 충돌 상세, 대체 시간 탐색은 이 클래스가
+    담당합니다. 추상 메서드를 빠뜨린 저장소는 인스턴스를 만들 때 TypeError가 납니다.
+    """
+
+    LOG_PREFIX = "[SCHEDULE API]"
+
+    # 일정이 생성/수정/삭제될 때마다 증가 (충돌 결과 캐시 무효화용)
+    _version = 0
+    _version_lock = threading.Lock()
+
+    @property
+    def version(self) -> int:
+        """저장소 변경 버전 (단조 증가)"""
+        return self._version
+
+    def _bump_version(self) -> None:
+        with self._version_lock:
+            self._version += 1
+
+    @abstractmethod
+    def _locked(self, employee_ids: Iterable[str]):
+        """주어진 임직원들의 일정을 배타적으로 다루는 컨텍스트 매니저
+
+        블록 안에서는 해당 임직원의 일정 조회/저장이 다른 스레드와 섞이지 않으므로,
+        여러 참석자에 걸친 확인 후 저장을 원자적으로 처리할 수 있습니다. 재진입 가능해야 합니다.
+        """
+
+    @abstractmethod
+    def _add_schedule(self, schedule: Schedule) -> None:
+        """일정 저장"""
 
     def _generate_sample_schedules(self):
         """샘플 일정 데이터 생성"""
@@ -45,7 +84,7 @@ class MockScheduleAPI:
 
                 # 주말 제외
                 if random_date.weekday() < 5:  # 월-금만
-                    self.schedules.append(Schedule(
+                    self._add_schedule(Schedule(
                         schedule_id=str(uuid.uuid4()),
                         employee_id=emp.id,
                         title=random.choice(meeting_types),
@@ -55,19 +94,38 @@ class MockScheduleAPI:
                         attendees=[emp.id]
                     ))
 
+    def add_schedules(self, schedules: Iterable[Schedule]) -> int:
+        """일정 일괄 적재 (로그 출력 없음)"""
+        count = 0
+        for schedule in schedules:
+            self._add_schedule(schedule)
+            count += 1
+        if count:
+            self._bump_version()
+        return count
+
+    @property
+    def schedules(self) -> List[Schedule]:
+        """전체 일정 목록 (저장 순서)"""
+        return self.get_all_schedules()
+
+    @abstractmethod
+    def get_all_schedules(self) -> List[Schedule]:
+        """전체 일정 조회 (저장 순서)"""
+
+    @abstractmethod
+    def get_schedule(self, schedule_id: str) -> Optional[Schedule]:
+        """ID로 일정 조회"""
+
+    @abstractmethod
     def get_schedules(self, employee_id: str, start_datetime: datetime,
                      end_datetime: datetime) -> List[Schedule]:
         """특정 기간의 일정 조회"""
-        return [
-            schedule for schedule in self.schedules
-            if (schedule.employee_id == employee_id and
-                schedule.start_datetime >= start_datetime and
-                schedule.end_datetime <= end_datetime)
-        ]
 
     def create_schedule(self, employee_id: str, title: str,
                        start_datetime: datetime, end_datetime: datetime,
-                       content: str = "", attendees: List[str] = None) -> str:
+                       content: str = "", attendees: List[str] = None,
+                       meeting_id: Optional[str] = None) -> str:
         """일정 생성"""
         schedule_id = str(uuid.uuid4())
         schedule = Schedule(
@@ -77,70 +135,185 @@ class MockScheduleAPI:
             start_datetime=start_datetime,
             end_datetime=end_datetime,
             content=content,
-            attendees=attendees or [employee_id]
+            attendees=attendees or [employee_id],
+            meeting_id=meeting_id
         )
-        self.schedules.append(schedule)
-        print(f"[MOCK API] 일정 생성: {title} ({start_datetime} ~ {end_datetime})")
+        self._add_schedule(schedule)
+        self._bump_version()
+        print(f"{self.LOG_PREFIX} 일정 생성: {title} ({start_datetime} ~ {end_datetime})")
         return schedule_id
 
+    @abstractmethod
     def update_schedule(self, schedule_id: str, **kwargs) -> bool:
         """일정 수정"""
-        for schedule in self.schedules:
-            if schedule.schedule_id == schedule_id:
-                for key, value in kwargs.items():
-                    if hasattr(schedule, key):
-                        setattr(schedule, key, value)
-                print(f"[MOCK API] 일정 수정: {schedule_id}")
-                return True
-        return False
 
+    @abstractmethod
     def delete_schedule(self, schedule_id: str) -> bool:
         """일정 삭제"""
-        for i, schedule in enumerate(self.schedules):
-            if schedule.schedule_id == schedule_id:
-                del self.schedules[i]
-                print(f"[MOCK API] 일정 삭제: {schedule_id}")
-                return True
-        return False
 
+    @abstractmethod
     def check_conflicts(self, employee_ids: List[str], start_datetime: datetime,
-                       end_datetime: datetime, exclude_schedule_id: str = None) -> Dict[str, List[Schedule]]:
-        """일정 충돌 확인"""
-        conflicts = {}
+                       end_datetime: datetime, exclude_schedule_id: str = None,
+                       exclude_meeting_id: str = None) -> Dict[str, List[Schedule]]:
+        """일정 충돌 확인 (exclude_meeting_id 회의에 연결된 일정은 충돌로 보지 않음)"""
 
-        for emp_id in employee_ids:
-            emp_conflicts = []
-            for schedule in self.schedules:
-                if (schedule.employee_id == emp_id and
-                    schedule.schedule_id != exclude_schedule_id):
-                    # 시간 겹침 확인
-                    if (start_datetime < schedule.end_datetime and
-                        end_datetime > schedule.start_datetime):
-                        emp_conflicts.append(schedule)
-
-            if emp_conflicts:
-                conflicts[emp_id] = emp_conflicts
+    @abstractmethod
+    def get_all_schedules_for_date(self, target_date: datetime) -> List[Schedule]:
+        """특정 날짜의 모든 일정 조회"""
 
-        return conflicts
+    @abstractmethod
+    def get_meeting_schedules(self, meeting_id: str) -> Dict[str, str]:
+        """회의에 연결된 참석자별 일정 ID (employee_id -> schedule_id)"""
 
     def create_meeting_schedules(self, attendee_ids: List[str], title: str,
                                start_datetime: datetime, end_datetime: datetime,
-                               content: str = "") -> List[str]:
-        """회의 참석자 전원의 일정 생성"""
-        schedule_ids = []
+                               content: str = "", meeting_id: Optional[str] = None) -> List[str]:
+        """회의 참석자 전원의 일정 생성 (참석자 전원을 잠근 상태에서 한 번에 저장)"""
+        schedules = self._build_meeting_schedules(attendee_ids, title, start_datetime,
+                                                  end_datetime, content, meeting_id)
+
+        with self._locked(attendee_ids):
+            self._add_meeting_schedules(schedules)
+
+        print(f"{self.LOG_PREFIX} 회의 일정 생성: {title} ({start_datetime} ~ {end_datetime}), "
+              f"참석자 {len(schedules)}명")
+        return [schedule.schedule_id for schedule in schedules]
+
+    def book_meeting(self, attendee_ids: List[str], title: str,
+                     start_datetime: datetime, end_datetime: datetime,
+                     content: str = "", meeting_id: Optional[str] = None) -> BookingResult:
+        """참석자 전원이 비어 있을 때만 회의 일정 생성 (확인과 저장을 한 임계 구역에서 처리)
+
+        한 명이라도 겹치는 일정이 있으면 아무것도 저장하지 않고 참석자별 충돌 일정을 반환합니다.
+        meeting_id를 주면 생성한 일정을 회의에 연결해 이후 update_meeting_schedules로 수정할 수 있습니다.
+        """
+        schedules = self._build_meeting_schedules(attendee_ids, title, start_datetime,
+                                                  end_datetime, content, meeting_id)
+
+        with self._locked(attendee_ids):
+            conflicts = self.check_conflicts(attendee_ids, start_datetime, end_datetime)
+            if not conflicts:
+                self._add_meeting_schedules(schedules)
+
+        if conflicts:
+            print(f"{self.LOG_PREFIX} 회의 예약 거절: {title}, 충돌 참석자 {len(conflicts)}명")
+            return BookingResult(conflicts=conflicts)
+
+        print(f"{self.LOG_PREFIX} 회의 예약: {title} ({start_datetime} ~ {end_datetime}), "
+              f"참석자 {len(schedules)}명")
+        return BookingResult(schedule_ids=[schedule.schedule_id for schedule in schedules])
+
+    def update_meeting_schedules(self, meeting_id: str, attendee_ids: List[str], title: str,
+                                 start_datetime: datetime, end_datetime: datetime,
+                                 content: str = "") -> BookingResult:
+        """수정한 회의를 연결된 참석자 일정에 반영 (바뀐 부분만 처리)
+
+        빠진 참석자 일정은 delete_schedule, 새 참석자 일정은 create_schedule로 처리하고,
+        남은 참석자 일정은 제목/시간/내용이 다른 필드만 update_schedule로 고치므로 큰 회의도
+        변경분만큼만 비용이 듭니다. 남은 일정의 attendees는 다시 쓰지 않으며, 현재 참석자
+        구성은 get_meeting_schedules가 기준입니다. 연결된 일정이 없으면 전원의 일정을 새로 만듭니다.
+
+        새 참석자와 시간이 바뀐 참석자는 회의 자신의 일정을 뺀 충돌을 같은 임계 구역에서
+        확인하고, 충돌이 있으면 아무것도 바꾸지 않고 참석자별 충돌 일정을 반환합니다.
+        """
+        attendees = list(attendee_ids)
+        fields = {"title": title, "start_datetime": start_datetime,
+                  "end_datetime": end_datetime, "content": content}
+
+        while True:
+            linked = self.get_meeting_schedules(meeting_id)
+            with self._locked([*linked, *attendees]):
+                current = self.get_meeting_schedules(meeting_id)
+                if current.keys() - linked.keys():
+                    continue  # 잠금을 얻기 전에 다른 스레드가 참석자를 추가함
+
+                updates = self._diff_meeting_schedules(current, attendees, fields)
+                occupying = [emp_id for emp_id in attendees
+                             if emp_id not in current or
+                             updates.get(emp_id, {}).keys() & {"start_datetime", "end_datetime"}]
+                conflicts = self.check_conflicts(occupying, start_datetime, end_datetime,
+                                                 exclude_meeting_id=meeting_id)
+                if not conflicts:
+                    changes = self._apply_meeting_changes(meeting_id, current, attendees,
+                                                          fields, updates)
+                break
+
+        if conflicts:
+            print(f"{self.LOG_PREFIX} 회의 수정 거절: {title}, 충돌 참석자 {len(conflicts)}명")
+            return BookingResult(conflicts=conflicts)
+
+        print(f"{self.LOG_PREFIX} 회의 일정 수정: {title}, 추가 {len(changes.created)}명 / "
+              f"제외 {len(changes.deleted)}명 / 변경 {len(changes.updated)}명")
+        schedule_ids = {**current, **changes.created}
+        return BookingResult(schedule_ids=[schedule_ids[emp_id] for emp_id in attendees],
+                             changes=changes)
+
+    def _diff_meeting_schedules(self, current: Dict[str, str], attendees: List[str],
+                                fields: Dict) -> Dict[str, Dict]:
+        """남은 참석자별로 값이 달라진 필드 (employee_id -> {필드: 새 값})"""
+        updates = {}
+        for emp_id in attendees:
+            schedule_id = current.get(emp_id)
+            if schedule_id is None:
+                continue
+            schedule = self.get_schedule(schedule_id)
+            changed = {key: value for key, value in fields.items()
+                       if getattr(schedule, key) != value}
+            if changed:
+                updates[emp_id] = changed
+        return updates
+
+    def _apply_meeting_changes(self, meeting_id: str, current: Dict[str, str],
+                               attendees: List[str], fields: Dict,
+                               updates: Dict[str, Dict]) -> MeetingScheduleChanges:
+        """참석자/필드 차이만큼 일정 생성/삭제/수정 (호출 측에서 _locked 보유)"""
+        changes = MeetingScheduleChanges()
+        wanted = set(attendees)
+
+        for emp_id, schedule_id in current.items():
+            if emp_id not in wanted:
+                self.delete_schedule(schedule_id)
+                changes.deleted[emp_id] = schedule_id
+
+        for emp_id, changed in updates.items():
+            self.update_schedule(current[emp_id], **changed)
+            changes.updated[emp_id] = current[emp_id]
+
+        for emp_id in attendees:
+            if emp_id not in current:
+                changes.created[emp_id] = self.create_schedule(
+                    emp_id, fields["title"], fields["start_datetime"], fields["end_datetime"],
+                    fields["content"], attendees, meeting_id=meeting_id
+                )
 
-        for emp_id in attendee_ids:
-            schedule_id = self.create_schedule(
+        return changes
+
+    @staticmethod
+    def _build_meeting_schedules(attendee_ids: List[str], title: str,
+                                 start_datetime: datetime, end_datetime: datetime,
+                                 content: str, meeting_id: Optional[str] = None) -> List[Schedule]:
+        """참석자별 회의 일정 객체 생성 (잠금 밖에서 미리 준비)"""
+        attendees = list(attendee_ids)
+        return [
+            Schedule(
+                schedule_id=str(uuid.uuid4()),
                 employee_id=emp_id,
                 title=title,
                 start_datetime=start_datetime,
                 end_datetime=end_datetime,
                 content=content,
-                attendees=attendee_ids
+                attendees=attendees,
+                meeting_id=meeting_id
             )
-            schedule_ids.append(schedule_id)
+            for emp_id in attendees
+        ]
 
-        return schedule_ids
+    def _add_meeting_schedules(self, schedules: List[Schedule]) -> None:
+        """회의 일정 저장 (호출 측에서 _locked 보유)"""
+        for schedule in schedules:
+            self._add_schedule(schedule)
+        if schedules:
+            self._bump_version()
 
     def get_employee_schedules_for_period(self, employee_id: str, days: int = 7) -> List[Schedule]:
         """특정 임직원의 최근/향후 일정 조회"""
@@ -150,21 +323,12 @@ class MockScheduleAPI:
 
         return self.get_schedules(employee_id, start_date, end_date)
 
-    def get_all_schedules_for_date(self, target_date: datetime) -> List[Schedule]:
-        """특정 날짜의 모든 일정 조회"""
-        start_of_day = target_date.replace(hour=0, minute=0, second=0, microsecond=0)
-        end_of_day = start_of_day + timedelta(days=1)
-
-        return [
-            schedule for schedule in self.schedules
-            if (schedule.start_datetime >= start_of_day and
-                schedule.start_datetime < end_of_day)
-        ]
-
     def get_conflict_details(self, employee_id: str, start_datetime: datetime,
-                           end_datetime: datetime) -> List[Dict]:
-        """충돌 상세 정보 조회"""
-        conflicts = self.check_conflicts([employee_id], start_datetime, end_datetime)
+                           end_datetime: datetime,
+                           exclude_meeting_id: Optional[str] = None) -> List[Dict]:
+        """충돌 상세 정보 조회 (exclude_meeting_id 회의 자신의 일정은 충돌로 보지 않음)"""
+        conflicts = self.check_conflicts([employee_id], start_datetime, end_datetime,
+                                         exclude_meeting_id=exclude_meeting_id)
 
         if employee_id not in conflicts:
             return []
@@ -183,51 +347,346 @@ class MockScheduleAPI:
         return conflict_details
 
     def suggest_alternative_times(self, attendee_ids: List[str], duration_minutes: int,
-                                target_date: datetime, business_hours: tuple = (9, 18)) -> List[Dict]:
-        """대체 시간 제안"""
+                                target_date: datetime, business_hours: tuple = (9, 18),
+                                exclude_meeting_id: Optional[str] = None) -> List[Dict]:
+        """대체 시간 제안 (exclude_meeting_id 회의 자신의 일정은 바쁜 시간으로 보지 않음)"""
         suggestions = []
         start_hour, end_hour = business_hours
+        day_start = target_date.replace(hour=0, minute=0, second=0, microsecond=0)
 
-        # 30분 간격으로 체크
+        # 30분 간격 후보 (업무시간 내에서만 제안)
+        candidates = []
         for hour in range(start_hour, end_hour):
             for minute in [0, 30]:
-                proposed_start = target_date.replace(hour=hour, minute=minute, second=0, microsecond=0)
+                proposed_start = day_start.replace(hour=hour, minute=minute)
                 proposed_end = proposed_start + timedelta(minutes=duration_minutes)
-
-                # 업무시간 내에서만 제안
                 if proposed_end.hour <= end_hour:
-                    conflicts = self.check_conflicts(attendee_ids, proposed_start, proposed_end)
-
-                    if not conflicts:  # 충돌이 없는 시간
-                        suggestions.append({
-                            "start_time": proposed_start,
-                            "end_time": proposed_end,
-                            "start_str": proposed_start.strftime("%H:%M"),
-                            "end_str": proposed_end.strftime("%H:%M"),
-                            "conflicts": 0
-                        })
-                    else:
-                        # 부분 충돌 정보도 포함
-                        conflict_count = sum(len(conflicts[emp_id]) for emp_id in conflicts)
-                        suggestions.append({
-                            "start_time": proposed_start,
-                            "end_time": proposed_end,
-                            "start_str": proposed_start.strftime("%H:%M"),
-                            "end_str": proposed_end.strftime("%H:%M"),
-                            "conflicts": conflict_count
-                        })
-
-        # 충돌이 적은 순으로 정렬
-        suggestions.sort(key=lambda x: x["conflicts"])
-        return suggestions[:5]  # 상위 5개만 반환
+                    candidates.append((proposed_start, proposed_end))
+
+        if not candidates:
+            return suggestions
+
+        # 참석자 일정을 한 번만 조회해 free/busy 배열로 합산
+        window_end = max(end for _, end in candidates)
+        grid = FreeBusyGrid(day_start, window_end)
+        for emp_schedules in self.check_conflicts(attendee_ids, day_start, window_end,
+                                                  exclude_meeting_id=exclude_meeting_id).values():
+            grid.add_schedules(emp_schedules)
+        conflict_counts = grid.conflict_counts(duration_minutes)
+
+        for proposed_start, proposed_end in candidates:
+            suggestions.append({
+                "start_time": proposed_start,
+                "end_time": proposed_end,
+                "start_str": proposed_start.strftime("%H:%M"),
+                "end_str": proposed_end.strftime("%H:%M"),
+                "conflicts": int(conflict_counts[grid.slot_index(proposed_start)])
+            })
+
+        # 충돌이 적은 순으로 상위 5개만 반환
+        return heapq.nsmallest(5, suggestions, key=lambda x: x["conflicts"])
+
+    def find_available_slots(self, attendee_ids: List[str], duration_minutes: int,
+                             start_date: datetime, end_date: datetime,
+                             attendee_roles: Optional[Dict[str, AttendeeRole]] = None,
+                             preferred_time: Optional[datetime] = None,
+                             business_hours: tuple = (9, 18), step_minutes: int = 30,
+                             top_k: int = 5, exclude_meeting_id: Optional[str] = None) -> List[Dict]:
+        """기간 내 회의 가능 시간 탐색 (주말 제외)
+
+        후보는 날짜별로 생성되어 크기 top_k의 힙을 거쳐 가므로 전체 후보를
+        리스트로 만들지 않습니다. 순위는 역할 가중 충돌 수, 선호 시간과의 거리
+        (선호 시간이 없으면 탐색 시작 시점부터의 거리, 즉 빠른 순) 순입니다.
+        수정 중인 회의는 exclude_meeting_id로 자신의 일정을 바쁜 시간에서 뺍니다.
+        """
+        attendee_roles = attendee_roles or {}
+        anchor = preferred_time or start_date
+
+        ranked = heapq.nsmallest(
+            top_k,
+            self._iter_slot_candidates(attendee_ids, duration_minutes, start_date, end_date,
+                                       attendee_roles, anchor, business_hours, step_minutes,
+                                       exclude_meeting_id)
+        )
+
+        suggestions = []
+        for score, _, proposed_start, conflicts in ranked:
+            proposed_end = proposed_start + timedelta(minutes=duration_minutes)
+            suggestions.append({
+                "start_time": proposed_start,
+                "end_time": proposed_end,
+                "start_str": proposed_start.strftime("%H:%M"),
+                "end_str": proposed_end.strftime("%H:%M"),
+                "date_str": proposed_start.strftime("%Y-%m-%d"),
+                "conflicts": conflicts,
+                "score": score
+            })
+        return suggestions
+
+    def _iter_slot_candidates(self, attendee_ids: List[str], duration_minutes: int,
+                              start_date: datetime, end_date: datetime,
+                              attendee_roles: Dict[str, AttendeeRole], anchor: datetime,
+                              business_hours: tuple, step_minutes: int,
+                              exclude_meeting_id: Optional[str]) -> Iterator[Tuple[float, float, datetime, int]]:
+        """(가중 충돌 점수, 선호 시간과의 거리, 시작 시각, 충돌 수) 후보 생성"""
+        start_hour, end_hour = business_hours
+        duration = timedelta(minutes=duration_minutes)
+        step_minutes = max(step_minutes // SLOT_MINUTES, 1) * SLOT_MINUTES
+
+        # 역할별로 참석자를 묶어 날짜마다 역할당 배열 하나만 계산
+        role_groups: Dict[float, List[str]] = {}
+        for emp_id in attendee_ids:
+            role = attendee_roles.get(emp_id, AttendeeRole.REQUIRED)
+            role_groups.setdefault(ROLE_CONFLICT_WEIGHTS[role.value], []).append(emp_id)
+
+        day = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        while day <= end_date:
+            if day.weekday() < 5:  # 월-금만
+                window_start = day.replace(hour=start_hour)
+                if start_date > window_start:
+                    # 탐색 시작 시각 이후 첫 step_minutes 경계부터
+                    elapsed = math.ceil((start_date - day).total_seconds() / 60 / step_minutes)
+                    window_start = day + timedelta(minutes=elapsed * step_minutes)
+                # 회의 전체가 탐색 기간 안에 들어가야 함
+                window_end = min(day.replace(hour=end_hour), end_date)
+                if window_start + duration <= window_end:
+                    yield from self._score_day(role_groups, window_start, window_end,
+                                               duration_minutes, anchor,
+                                               step_minutes // SLOT_MINUTES, exclude_meeting_id)
+            day += timedelta(days=1)
+
+    def _score_day(self, role_groups: Dict[float, List[str]], window_start: datetime,
+                   window_end: datetime, duration_minutes: int, anchor: datetime, step: int,
+                   exclude_meeting_id: Optional[str]) -> Iterator[Tuple[float, float, datetime, int]]:
+        """하루 업무시간 내 후보의 점수 계산"""
+        conflicts = None
+        weighted = None
+        for weight, emp_ids in role_groups.items():
+            grid = FreeBusyGrid(window_start, window_end)
+            for emp_schedules in self.check_conflicts(emp_ids, window_start, window_end,
+                                                      exclude_meeting_id=exclude_meeting_id).values():
+                grid.add_schedules(emp_schedules)
+            counts = grid.conflict_counts(duration_minutes)
+            conflicts = counts if conflicts is None else conflicts + counts
+            weighted = counts * weight if weighted is None else weighted + counts * weight
+
+        if conflicts is None:
+            return
+
+        duration = timedelta(minutes=duration_minutes)
+        for index in range(0, len(conflicts), step):
+            proposed_start = window_start + timedelta(minutes=index * SLOT_MINUTES)
+            if proposed_start + duration > window_end:
+                break  # 슬롯 경계에 맞지 않는 window_end를 넘는 후보
+            distance = abs((proposed_start - anchor).total_seconds()) / 60
+            yield float(weighted[index]), distance, proposed_start, int(conflicts[index])
+
+
+
+class MockScheduleAPI(BaseScheduleAPI):
+    """임직원 일정 관리 시스템 Mock API
+
+    Streamlit 세션 스레드들이 공유하므로 임직원 ID 해시로 나눈 샤드 잠금으로
+    임직원별 인덱스를 보호합니다. 여러 임직원을 잠글 때는 샤드 번호 순으로 획득해
+    교착을 피하고, 서로 다른 샤드의 참석자만 다루는 작업은 서로 기다리지 않습니다.
+    회의 색인과 날짜 색인은 여러 샤드에 걸치므로 각각 별도 잠금으로 보호합니다.
+    """
+
+    LOG_PREFIX = "[MOCK API]"
+    # 임직원별 시간 인덱스 / 회의 연결의 키가 되는 필드
+    INDEX_FIELDS = frozenset({"employee_id", "start_datetime", "end_datetime"})
+    LINK_FIELDS = frozenset({"employee_id", "meeting_id"})
+
+    def __init__(self, generate_sample_data: bool = True, lock_shards: int = SCHEDULE_LOCK_SHARDS):
+        # schedule_id -> 일정 (삽입 순서 유지, 조회/삭제 O(1))
+        self._schedules: Dict[str, Schedule] = {}
+        self._index = ScheduleIndex()
+        self._shard_locks = [threading.RLock() for _ in range(max(1, lock_shards))]
+        # meeting_id -> {employee_id: schedule_id}
+        self._meetings: Dict[str, Dict[str, str]] = {}
+        self._meeting_lock = threading.Lock()
+        # 시작 날짜 -> {schedule_id: 일정} (날짜별 전체 일정 조회용)
+        self._dates: Dict[date, Dict[str, Schedule]] = {}
+        self._date_lock = threading.Lock()
+        if generate_sample_data:
+            self._generate_sample_schedules()
+
+    def _shard(self, employee_id: str) -> int:
+        return hash(employee_id) % len(self._shard_locks)
+
+    @contextmanager
+    def _locked(self, employee_ids: Iterable[str]) -> Iterator[None]:
+        """임직원들이 속한 샤드 잠금을 번호 순으로 획득"""
+        locks = [self._shard_locks[shard]
+                 for shard in sorted({self._shard(emp_id) for emp_id in employee_ids})]
+        for lock in locks:
+            lock.acquire()
+        try:
+            yield
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    def get_all_schedules(self) -> List[Schedule]:
+        """전체 일정 조회 (저장 순서)"""
+        return list(self._schedules.values())
+
+    def _add_schedule(self, schedule: Schedule) -> None:
+        """일정 저장 및 인덱스 등록"""
+        with self._shard_locks[self._shard(schedule.employee_id)]:
+            self._schedules[schedule.schedule_id] = schedule
+            self._index.add(schedule)
+            self._index_date(schedule)
+            self._link_meeting(schedule)
+
+    def _index_date(self, schedule: Schedule) -> None:
+        with self._date_lock:
+            self._dates.setdefault(schedule.start_datetime.date(), {})[schedule.schedule_id] = schedule
+
+    def _unindex_date(self, schedule: Schedule) -> None:
+        day = schedule.start_datetime.date()
+        with self._date_lock:
+            bucket = self._dates.get(day, {})
+            if bucket.pop(schedule.schedule_id, None) is not None and not bucket:
+                del self._dates[day]
+
+    def _link_meeting(self, schedule: Schedule) -> None:
+        if schedule.meeting_id is not None:
+            with self._meeting_lock:
+                linked = self._meetings.setdefault(schedule.meeting_id, {})
+                linked[schedule.employee_id] = schedule.schedule_id
+
+    def _unlink_meeting(self, schedule: Schedule) -> None:
+        if schedule.meeting_id is None:
+            return
+        with self._meeting_lock:
+            linked = self._meetings.get(schedule.meeting_id, {})
+            if linked.get(schedule.employee_id) == schedule.schedule_id:
+                del linked[schedule.employee_id]
+                if not linked:
+                    del self._meetings[schedule.meeting_id]
+
+    def get_schedules(self, employee_id: str, start_datetime: datetime,
+                     end_datetime: datetime) -> List[Schedule]:
+        """특정 기간의 일정 조회"""
+        with self._shard_locks[self._shard(employee_id)]:
+            return self._index.within(employee_id, start_datetime, end_datetime)
+
+    def update_schedule(self, schedule_id: str, **kwargs) -> bool:
+        """일정 수정"""
+        while True:
+            schedule = self._schedules.get(schedule_id)
+            if schedule is None:
+                return False
+
+            # 담당자가 바뀌면 이전/새 임직원 샤드를 함께 잠금
+            employee_id = schedule.employee_id
+            with self._locked({employee_id, kwargs.get("employee_id", employee_id)}):
+                if (self._schedules.get(schedule_id) is not schedule or
+                        schedule.employee_id != employee_id):
+                    continue  # 잠금을 얻기 전에 다른 스레드가 수정/삭제함
+
+                changes = {key: value for key, value in kwargs.items()
+                           if key != "schedule_id" and hasattr(schedule, key)
+                           and getattr(schedule, key) != value}
+                # 인덱스 키(employee_id, 시간)나 회의 연결이 바뀔 때만 재등록
+                reindex = not changes.keys().isdisjoint(self.INDEX_FIELDS)
+                relink = not changes.keys().isdisjoint(self.LINK_FIELDS)
+                if reindex:
+                    self._index.remove(schedule)
+                    self._unindex_date(schedule)
+                if relink:
+                    self._unlink_meeting(schedule)
+                for key, value in changes.items():
+                    setattr(schedule, key, value)
+                if reindex:
+                    self._index.add(schedule)
+                    self._index_date(schedule)
+                if relink:
+                    self._link_meeting(schedule)
+                self._bump_version()
+                break
+
+        print(f"{self.LOG_PREFIX} 일정 수정: {schedule_id}")
+        return True
+
+    def delete_schedule(self, schedule_id: str) -> bool:
+        """일정 삭제"""
+        while True:
+            schedule = self._schedules.get(schedule_id)
+            if schedule is None:
+                return False
+
+            employee_id = schedule.employee_id
+            with self._shard_locks[self._shard(employee_id)]:
+                if (self._schedules.get(schedule_id) is not schedule or
+                        schedule.employee_id != employee_id):
+                    continue
+
+                del self._schedules[schedule_id]
+                self._index.remove(schedule)
+                self._unindex_date(schedule)
+                self._unlink_meeting(schedule)
+                self._bump_version()
+                break
+
+        print(f"{self.LOG_PREFIX} 일정 삭제: {schedule_id}")
+        return True
+
+    def get_schedule(self, schedule_id: str) -> Optional[Schedule]:
+        """ID로 일정 조회"""
+        return self._schedules.get(schedule_id)
+
+    def check_conflicts(self, employee_ids: List[str], start_datetime: datetime,
+                       end_datetime: datetime, exclude_schedule_id: str = None,
+                       exclude_meeting_id: str = None) -> Dict[str, List[Schedule]]:
+        """일정 충돌 확인 (참석자 전원을 같은 시점 기준으로 조회)"""
+        conflicts = {}
+
+        with self._locked(employee_ids):
+            for emp_id in employee_ids:
+                emp_conflicts = self._index.overlapping(
+                    emp_id, start_datetime, end_datetime, exclude_schedule_id, exclude_meeting_id
+                )
+                if emp_conflicts:
+                    conflicts[emp_id] = emp_conflicts
+
+        return conflicts
+
+    def get_meeting_schedules(self, meeting_id: str) -> Dict[str, str]:
+        """회의에 연결된 참석자별 일정 ID (employee_id -> schedule_id)"""
+        with self._meeting_lock:
+            return dict(self._meetings.get(meeting_id, {}))
+
+    def get_all_schedules_for_date(self, target_date: datetime) -> List[Schedule]:
+        """특정 날짜의 모든 일정 조회 (시작 시간 순, 날짜 색인에서 해당 날짜만 읽음)"""
+        with self._date_lock:
+            schedules = list(self._dates.get(target_date.date(), {}).values())
+        schedules.sort(key=lambda schedule: schedule.start_datetime)
+        return schedules
 
 
 # 싱글톤 인스턴스
 _schedule_api_instance = None
 
-def get_schedule_api() -> MockScheduleAPI:
+def create_schedule_api(generate_sample_data: bool = True,
+                        db_path: Optional[str] = None) -> BaseScheduleAPI:
+    """SCHEDULE_BACKEND 설정에 따른 일정 API 생성 (db_path를 주면 그 파일의 SQLite 사용)"""
+    if db_path is not None or SCHEDULE_BACKEND == "sqlite":
+        from src.api.sqlite_schedule_api import SQLiteScheduleAPI
+        return SQLiteScheduleAPI(db_path or SCHEDULE_DB_PATH, generate_sample_data)
+    return MockScheduleAPI(generate_sample_data)
+
+
+def get_schedule_api() -> BaseScheduleAPI:
     """일정 API 인스턴스 반환"""
     global _schedule_api_instance
     if _schedule_api_instance is None:
-        _schedule_api_instance = MockScheduleAPI()
+        _schedule_api_instance = create_schedule_api()
     return _schedule_api_instance
+
+
+def set_schedule_api(schedule_api: BaseScheduleAPI) -> None:
+    """일정 API 인스턴스 교체 (벤치마크/합성 데이터용)"""
+    global _schedule_api_instance
+    _schedule_api_instance = schedule_api
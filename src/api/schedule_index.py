@@ -0,0 +1,103 @@
+"""
+임직원별 일정 인덱스
+"""
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from src.models.employee import Schedule
+
+
+class ScheduleIndex:
+    """임직원별로 시작 시간 순 정렬된 일정 인덱스
+
+    겹침 조회는 bisect로 후보 구간을 좁힌 뒤 해당 구간만 확인하므로
+    임직원당 O(log n + k)로 동작합니다.
+    """
+
+    def __init__(self):
+        self._starts: Dict[str, List[datetime]] = {}
+        self._entries: Dict[str, List[Schedule]] = {}
+        # 임직원별 최장 일정 길이 (겹침 조회의 왼쪽 경계 계산용)
+        self._max_duration: Dict[str, timedelta] = {}
+
+    def add(self, schedule: Schedule) -> None:
+        """일정을 인덱스에 추가"""
+        emp_id = schedule.employee_id
+        starts = self._starts.setdefault(emp_id, [])
+        entries = self._entries.setdefault(emp_id, [])
+
+        pos = bisect_right(starts, schedule.start_datetime)
+        starts.insert(pos, schedule.start_datetime)
+        entries.insert(pos, schedule)
+
+        duration = schedule.end_datetime - schedule.start_datetime
+        if duration > self._max_duration.get(emp_id, timedelta(0)):
+            self._max_duration[emp_id] = duration
+
+    def remove(self, schedule: Schedule) -> bool:
+        """인덱스에서 일정 제거 (인덱싱 당시의 employee_id/start_datetime 기준)"""
+        emp_id = schedule.employee_id
+        starts = self._starts.get(emp_id)
+        if not starts:
+            return False
+
+        entries = self._entries[emp_id]
+        pos = bisect_left(starts, schedule.start_datetime)
+        while pos < len(starts) and starts[pos] == schedule.start_datetime:
+            if entries[pos].schedule_id == schedule.schedule_id:
+                del starts[pos]
+                del entries[pos]
+                if not starts:
+                    self._drop_employee(emp_id)
+                return True
+            pos += 1
+        return False
+
+    def overlapping(self, employee_id: str, start_datetime: datetime, end_datetime: datetime,
+                    exclude_schedule_id: Optional[str] = None,
+                    exclude_meeting_id: Optional[str] = None) -> List[Schedule]:
+        """주어진 시간대와 겹치는 일정 조회 (exclude_meeting_id 회의의 일정은 제외)"""
+        starts = self._starts.get(employee_id)
+        if not starts:
+            return []
+
+        entries = self._entries[employee_id]
+        # start < end_datetime 인 일정까지만 후보
+        hi = bisect_left(starts, end_datetime)
+        # 최장 일정보다 먼저 시작한 일정은 start_datetime 이전에 끝남
+        lo = bisect_right(starts, start_datetime - self._max_duration[employee_id])
+
+        return [
+            schedule for schedule in entries[lo:hi]
+            if (schedule.end_datetime > start_datetime and
+                schedule.schedule_id != exclude_schedule_id and
+                (exclude_meeting_id is None or schedule.meeting_id != exclude_meeting_id))
+        ]
+
+    def within(self, employee_id: str, start_datetime: datetime,
+               end_datetime: datetime) -> List[Schedule]:
+        """주어진 기간 안에 완전히 포함되는 일정 조회"""
+        starts = self._starts.get(employee_id)
+        if not starts:
+            return []
+
+        entries = self._entries[employee_id]
+        lo = bisect_left(starts, start_datetime)
+        hi = bisect_right(starts, end_datetime)
+
+        return [
+            schedule for schedule in entries[lo:hi]
+            if schedule.end_datetime <= end_datetime
+        ]
+
+    def clear(self) -> None:
+        """인덱스 초기화"""
+        self._starts.clear()
+        self._entries.clear()
+        self._max_duration.clear()
+
+    def _drop_employee(self, employee_id: str) -> None:
+        del self._starts[employee_id]
+        del self._entries[employee_id]
+        self._max_duration.pop(employee_id, None)
@@ -0,0 +1,343 @@
+"""
+SQLite 기반 일정 관리 API
+"""
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from src.models.employee import Schedule
+from src.api.schedule_api import BaseScheduleAPI
+
+# 문자열 비교가 시간 순서와 일치하도록 고정 길이 포맷 사용
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS schedules (
+    schedule_id TEXT PRIMARY KEY,
+    employee_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    start_datetime TEXT NOT NULL,
+    end_datetime TEXT NOT NULL,
+    content TEXT NOT NULL DEFAULT '',
+    attendees TEXT NOT NULL DEFAULT '[]',
+    meeting_id TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_schedules_employee_time
+    ON schedules (employee_id, start_datetime, end_datetime);
+CREATE INDEX IF NOT EXISTS idx_schedules_start
+    ON schedules (start_datetime);
+CREATE TABLE IF NOT EXISTS schedule_meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+"""
+
+# meeting_id 컬럼이 없던 DB 파일은 컬럼 추가 후 색인 생성
+MEETING_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_schedules_meeting
+    ON schedules (meeting_id) WHERE meeting_id IS NOT NULL
+"""
+
+BULK_INSERT_BATCH_SIZE = 10000
+
+UPDATABLE_COLUMNS = ("employee_id", "title", "start_datetime", "end_datetime", "content", "attendees",
+                     "meeting_id")
+
+
+class SQLiteScheduleAPI(BaseScheduleAPI):
+    """SQLite 영구 저장소 일정 API
+
+    WAL 모드로 여러 Streamlit 워커 프로세스가 같은 DB 파일을 공유할 수 있습니다.
+    겹침 조회는 (employee_id, start_datetime, end_datetime) 복합 인덱스를 사용하며,
+    저장된 일정의 최장 길이를 schedule_meta에 유지해 start_datetime 하한을 함께 걸어
+    인덱스 범위 스캔을 좁힙니다.
+
+    쓰기 메서드는 _transaction으로 감싸므로 _locked 블록 안에서 호출해도
+    바깥 트랜잭션에 합쳐져 블록 전체가 한 번에 커밋됩니다.
+    """
+
+    LOG_PREFIX = "[SQLITE API]"
+
+    def __init__(self, db_path: str, generate_sample_data: bool = True):
+        self.db_path = db_path
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+        # 연결 하나를 스레드들이 공유 (_locked 안에서 조회할 수 있도록 재진입 가능)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._migrate()
+        self._tx_depth = 0
+
+        if generate_sample_data and self._count_schedules() == 0:
+            with self._transaction():
+                self._generate_sample_schedules()
+
+    def _migrate(self) -> None:
+        """이전 스키마 DB 파일에 meeting_id 컬럼 추가"""
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(schedules)")}
+        with self._conn:
+            if "meeting_id" not in columns:
+                self._conn.execute("ALTER TABLE schedules ADD COLUMN meeting_id TEXT")
+            self._conn.execute(MEETING_INDEX)
+
+    @contextmanager
+    def _transaction(self, immediate: bool = False) -> Iterator[None]:
+        """연결 잠금 + 트랜잭션 (중첩되면 가장 바깥 트랜잭션에 합류)"""
+        with self._lock:
+            if self._tx_depth:
+                self._tx_depth += 1
+                try:
+                    yield
+                finally:
+                    self._tx_depth -= 1
+                return
+
+            with self._conn:
+                if immediate:
+                    self._conn.execute("BEGIN IMMEDIATE")
+                self._tx_depth = 1
+                try:
+                    yield
+                finally:
+                    self._tx_depth = 0
+
+    def _locked(self, employee_ids: Iterable[str]):
+        """연결 잠금 + 즉시 쓰기 트랜잭션
+
+        BEGIN IMMEDIATE로 쓰기 잠금을 먼저 잡으므로 같은 DB를 쓰는 다른 프로세스도
+        블록 안의 확인과 저장 사이에 끼어들 수 없습니다.
+        """
+        return self._transaction(immediate=True)
+
+    def _add_schedule(self, schedule: Schedule) -> None:
+        """일정 저장 (호출 측에서 잠금/트랜잭션 관리)"""
+        self._conn.execute(
+            "INSERT INTO schedules VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            self._to_row(schedule)
+        )
+        self._update_max_duration(schedule)
+
+    def add_schedules(self, schedules: Iterable[Schedule]) -> int:
+        """일정 일괄 적재 (배치 단위 executemany)"""
+        iterator = iter(schedules)
+        count = 0
+        while True:
+            batch = list(islice(iterator, BULK_INSERT_BATCH_SIZE))
+            if not batch:
+                return count
+            with self._transaction():
+                self._conn.executemany(
+                    "INSERT INTO schedules VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [self._to_row(schedule) for schedule in batch]
+                )
+                self._update_max_duration(
+                    max(batch, key=lambda s: s.end_datetime - s.start_datetime)
+                )
+                self._bump_version()
+            count += len(batch)
+
+    def create_schedule(self, employee_id: str, title: str,
+                       start_datetime: datetime, end_datetime: datetime,
+                       content: str = "", attendees: List[str] = None,
+                       meeting_id: Optional[str] = None) -> str:
+        """일정 생성"""
+        with self._transaction():
+            return super().create_schedule(employee_id, title, start_datetime, end_datetime,
+                                           content, attendees, meeting_id)
+
+    def get_all_schedules(self) -> List[Schedule]:
+        """전체 일정 조회 (저장 순서)"""
+        return self._query("SELECT * FROM schedules ORDER BY rowid")
+
+    def get_schedule(self, schedule_id: str) -> Optional[Schedule]:
+        """ID로 일정 조회"""
+        rows = self._query("SELECT * FROM schedules WHERE schedule_id = ?", (schedule_id,))
+        return rows[0] if rows else None
+
+    def get_schedules(self, employee_id: str, start_datetime: datetime,
+                     end_datetime: datetime) -> List[Schedule]:
+        """특정 기간의 일정 조회"""
+        return self._query(
+            "SELECT * FROM schedules "
+            "WHERE employee_id = ? AND start_datetime >= ? AND end_datetime <= ? "
+            "ORDER BY start_datetime",
+            (employee_id, self._format(start_datetime), self._format(end_datetime))
+        )
+
+    def update_schedule(self, schedule_id: str, **kwargs) -> bool:
+        """일정 수정"""
+        columns = [key for key in kwargs if key in UPDATABLE_COLUMNS]
+        if not columns:
+            return self.get_schedule(schedule_id) is not None
+
+        values = [self._to_column(key, kwargs[key]) for key in columns]
+        with self._transaction():
+            cursor = self._conn.execute(
+                f"UPDATE schedules SET {', '.join(f'{key} = ?' for key in columns)} "
+                "WHERE schedule_id = ?",
+                (*values, schedule_id)
+            )
+            if cursor.rowcount == 0:
+                return False
+            self._bump_version()
+            if "start_datetime" in kwargs or "end_datetime" in kwargs:
+                updated = self._conn.execute(
+                    "SELECT * FROM schedules WHERE schedule_id = ?", (schedule_id,)
+                ).fetchone()
+                self._update_max_duration(self._from_row(updated))
+
+        print(f"{self.LOG_PREFIX} 일정 수정: {schedule_id}")
+        return True
+
+    def delete_schedule(self, schedule_id: str) -> bool:
+        """일정 삭제"""
+        with self._transaction():
+            cursor = self._conn.execute(
+                "DELETE FROM schedules WHERE schedule_id = ?", (schedule_id,)
+            )
+            if cursor.rowcount:
+                self._bump_version()
+        if cursor.rowcount == 0:
+            return False
+
+        print(f"{self.LOG_PREFIX} 일정 삭제: {schedule_id}")
+        return True
+
+    def check_conflicts(self, employee_ids: List[str], start_datetime: datetime,
+                       end_datetime: datetime, exclude_schedule_id: str = None,
+                       exclude_meeting_id: str = None) -> Dict[str, List[Schedule]]:
+        """일정 충돌 확인 (겹침 조건을 SQL로 처리)"""
+        if not employee_ids:
+            return {}
+
+        earliest_start = start_datetime - self._max_duration()
+        placeholders = ", ".join("?" for _ in employee_ids)
+        params = [*employee_ids, self._format(earliest_start), self._format(end_datetime),
+                  self._format(start_datetime), exclude_schedule_id]
+        meeting_filter = ""
+        if exclude_meeting_id is not None:
+            # meeting_id가 NULL인 일반 일정은 IS NOT 비교에서 남음
+            meeting_filter = "AND meeting_id IS NOT ? "
+            params.append(exclude_meeting_id)
+        rows = self._query(
+            f"SELECT * FROM schedules WHERE employee_id IN ({placeholders}) "
+            "AND start_datetime > ? AND start_datetime < ? AND end_datetime > ? "
+            "AND schedule_id IS NOT ? "
+            f"{meeting_filter}"
+            "ORDER BY start_datetime",
+            tuple(params)
+        )
+
+        conflicts: Dict[str, List[Schedule]] = {}
+        for schedule in rows:
+            conflicts.setdefault(schedule.employee_id, []).append(schedule)
+
+        # 요청한 참석자 순서 유지
+        return {emp_id: conflicts[emp_id] for emp_id in employee_ids if emp_id in conflicts}
+
+    def get_meeting_schedules(self, meeting_id: str) -> Dict[str, str]:
+        """회의에 연결된 참석자별 일정 ID (employee_id -> schedule_id)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT employee_id, schedule_id FROM schedules WHERE meeting_id = ?",
+                (meeting_id,)
+            ).fetchall()
+        return {row["employee_id"]: row["schedule_id"] for row in rows}
+
+    def get_all_schedules_for_date(self, target_date: datetime) -> List[Schedule]:
+        """특정 날짜의 모든 일정 조회"""
+        start_of_day = target_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        end_of_day = start_of_day + timedelta(days=1)
+
+        return self._query(
+            "SELECT * FROM schedules WHERE start_datetime >= ? AND start_datetime < ? "
+            "ORDER BY start_datetime",
+            (self._format(start_of_day), self._format(end_of_day))
+        )
+
+    @property
+    def version(self) -> int:
+        """저장소 변경 버전
+
+        이 연결의 변경 횟수에 SQLite data_version(다른 연결/프로세스가 커밋할 때마다
+        증가)을 더해, 다른 워커의 변경도 캐시 무효화에 반영합니다.
+        """
+        with self._lock:
+            data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        return self._version + data_version
+
+    def close(self) -> None:
+        """DB 연결 종료"""
+        self._conn.close()
+
+    def _count_schedules(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM schedules").fetchone()[0]
+
+    def _query(self, sql: str, params: tuple = ()) -> List[Schedule]:
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [self._from_row(row) for row in rows]
+
+    def _max_duration(self) -> timedelta:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM schedule_meta WHERE key = 'max_duration_seconds'"
+            ).fetchone()
+        return timedelta(seconds=row[0] if row else 0)
+
+    def _update_max_duration(self, schedule: Schedule) -> None:
+        # 최장 길이는 줄이지 않음 (하한이 느슨해질 뿐 결과는 정확)
+        seconds = int((schedule.end_datetime - schedule.start_datetime).total_seconds()) + 1
+        self._conn.execute(
+            "INSERT INTO schedule_meta (key, value) VALUES ('max_duration_seconds', ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = MAX(value, excluded.value)",
+            (seconds,)
+        )
+
+    @staticmethod
+    def _format(dt: datetime) -> str:
+        return dt.strftime(DATETIME_FORMAT)
+
+    @classmethod
+    def _to_column(cls, key: str, value):
+        if key in ("start_datetime", "end_datetime"):
+            return cls._format(value)
+        if key == "attendees":
+            return json.dumps(value or [])
+        return value
+
+    @classmethod
+    def _to_row(cls, schedule: Schedule) -> tuple:
+        return (
+            schedule.schedule_id,
+            schedule.employee_id,
+            schedule.title,
+            cls._format(schedule.start_datetime),
+            cls._format(schedule.end_datetime),
+            schedule.content,
+            json.dumps(schedule.attendees),
+            schedule.meeting_id
+        )
+
+    @staticmethod
+    def _from_row(row: sqlite3.Row) -> Schedule:
+        return Schedule(
+            schedule_id=row["schedule_id"],
+            employee_id=row["employee_id"],
+            title=row["title"],
+            start_datetime=datetime.strptime(row["start_datetime"], DATETIME_FORMAT),
+            end_datetime=datetime.strptime(row["end_datetime"], DATETIME_FORMAT),
+            content=row["content"],
+            attendees=json.loads(row["attendees"]),
+            meeting_id=row["meeting_id"]
+        )
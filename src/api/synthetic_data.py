@@ -0,0 +1,270 @@
+"""
+벤치마크용 대규모 합성 조직/일정 데이터 생성기
+"""
+import json
+import os
+import random
+import tempfile
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.models.employee import Employee, Schedule
+from src.api.employee_api import MockEmployeeAPI, set_employee_api
+from src.api.schedule_api import BaseScheduleAPI, create_schedule_api, set_schedule_api
+from src.utils.config import SCHEDULE_BACKEND
+
+SURNAMES = [
+    "김", "이", "박", "최", "정", "강", "조", "윤", "장", "임",
+    "한", "오", "서", "신", "권", "황", "안", "송", "류", "홍"
+]
+GIVEN_NAME_SYLLABLES = [
+    "민", "서", "지", "현", "준", "영", "수", "우", "윤", "성",
+    "철", "희", "태", "소", "예", "린", "호", "연", "은", "혁",
+    "동", "미", "대", "원", "진", "하", "도", "유", "재", "경"
+]
+DEPARTMENTS = ["개발", "기획", "디자인", "마케팅", "영업", "인사", "재무"]
+MEETING_TYPES = [
+    "프로젝트 회의", "1:1 미팅", "워크샵", "브레인스토밍", "코드 리뷰",
+    "디자인 리뷰", "고객 미팅", "데모 미팅", "교육", "면접", "온보딩"
+]
+
+# 실행 시각과 무관하게 같은 데이터가 나오도록 고정 시작일 (월요일)
+DEFAULT_START_DATE = datetime(2025, 1, 6)
+
+
+@dataclass
+class SyntheticWorld:
+    """생성된 조직 데이터"""
+    seed: int
+    start_date: datetime
+    days: int
+    employees: List[Employee]
+
+
+class SyntheticDataGenerator:
+    """시드 고정 합성 조직/일정 생성기
+
+    같은 시드와 파라미터로는 항상 같은 임직원과 일정이 생성됩니다.
+    일정은 팀 주간 회의, 개발팀 데일리 스탠드업, 팀장과의 주간 1:1 같은
+    반복 패턴에 임직원별 비정기 일정을 더해 만들며, 메모리에 모으지 않고
+    이터레이터로 흘려보냅니다.
+    """
+
+    def __init__(self, seed: int = 42, employee_count: int = 1000, team_size: int = 8,
+                 ad_hoc_per_day: float = 1.5, days: int = 21,
+                 start_date: Optional[datetime] = None):
+        self.seed = seed
+        self.employee_count = employee_count
+        self.team_size = team_size
+        self.ad_hoc_per_day = ad_hoc_per_day
+        self.days = days
+        self.start_date = (start_date or DEFAULT_START_DATE).replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+
+    def generate_employees(self) -> List[Employee]:
+        """임직원 생성 (팀별로 team_size명씩 배정)"""
+        rng = random.Random(f"{self.seed}:employees")
+        team_count = max(1, -(-self.employee_count // self.team_size))
+        teams = [
+            f"{DEPARTMENTS[i % len(DEPARTMENTS)]}{i // len(DEPARTMENTS) + 1}팀"
+            for i in range(team_count)
+        ]
+
+        employees = []
+        for i in range(self.employee_count):
+            emp_id = f"emp_{i + 1:06d}"
+            name = rng.choice(SURNAMES) + "".join(rng.choices(GIVEN_NAME_SYLLABLES, k=2))
+            employees.append(Employee(
+                id=emp_id,
+                name=name,
+                team=teams[i // self.team_size],
+                email=f"{emp_id}@company.com"
+            ))
+        return employees
+
+    def generate(self) -> SyntheticWorld:
+        """조직 데이터 생성"""
+        return SyntheticWorld(
+            seed=self.seed,
+            start_date=self.start_date,
+            days=self.days,
+            employees=self.generate_employees()
+        )
+
+    def iter_schedules(self, employees: List[Employee]) -> Iterator[Schedule]:
+        """일정 스트림 생성 (팀 단위로 반복 패턴 + 비정기 일정)"""
+        teams: Dict[str, List[Employee]] = {}
+        for emp in employees:
+            teams.setdefault(emp.team, []).append(emp)
+
+        for team, members in teams.items():
+            rng = random.Random(f"{self.seed}:{team}")
+            yield from self._iter_team_schedules(rng, team, members)
+
+    def populate(self, schedule_api: Optional[BaseScheduleAPI] = None,
+                 world: Optional[SyntheticWorld] = None,
+                 db_path: Optional[str] = None) -> Tuple[SyntheticWorld, int]:
+        """합성 데이터를 생성해 API 싱글톤에 적재
+
+        schedule_api를 생략하면 create_empty_schedule_api(db_path)로 만든 빈 저장소에
+        적재합니다.
+        """
+        world = world or self.generate()
+        schedule_api = schedule_api or create_empty_schedule_api(db_path)
+
+        set_employee_api(MockEmployeeAPI(world.employees))
+        set_schedule_api(schedule_api)
+        count = schedule_api.add_schedules(self.iter_schedules(world.employees))
+        return world, count
+
+    def dump(self, path: str, world: Optional[SyntheticWorld] = None) -> int:
+        """조직/일정 데이터를 JSON Lines 파일로 저장"""
+        world = world or self.generate()
+        count = 0
+        with open(path, "w", encoding="utf-8") as f:
+            header = {
+                "type": "world",
+                "seed": world.seed,
+                "start_date": world.start_date.isoformat(),
+                "days": world.days
+            }
+            f.write(json.dumps(header, ensure_ascii=False) + "\n")
+            for emp in world.employees:
+                f.write(json.dumps({"type": "employee", **emp.to_dict()}, ensure_ascii=False) + "\n")
+            for schedule in self.iter_schedules(world.employees):
+                f.write(json.dumps({"type": "schedule", **_schedule_to_json(schedule)},
+                                   ensure_ascii=False) + "\n")
+                count += 1
+        return count
+
+    @staticmethod
+    def load(path: str, schedule_api: Optional[BaseScheduleAPI] = None,
+             db_path: Optional[str] = None) -> Tuple[SyntheticWorld, int]:
+        """dump로 저장한 파일을 읽어 API 싱글톤에 적재 (첫 줄이 world 헤더가 아니면 ValueError)"""
+        schedule_api = schedule_api or create_empty_schedule_api(db_path)
+        world = None
+        employees: List[Employee] = []
+
+        def iter_records() -> Iterator[Schedule]:
+            nonlocal world
+            with open(path, encoding="utf-8") as f:
+                for line_no, line in enumerate(f, 1):
+                    record = json.loads(line)
+                    record_type = record.pop("type")
+                    if world is None and record_type != "world":
+                        raise ValueError(f"{path}:{line_no}: world 헤더가 없는 합성 데이터 파일입니다")
+                    if record_type == "world":
+                        world = SyntheticWorld(
+                            seed=record["seed"],
+                            start_date=datetime.fromisoformat(record["start_date"]),
+                            days=record["days"],
+                            employees=employees
+                        )
+                    elif record_type == "employee":
+                        employees.append(Employee.from_dict(record))
+                    elif record_type == "schedule":
+                        yield _schedule_from_json(record)
+
+        count = schedule_api.add_schedules(iter_records())
+        if world is None:
+            raise ValueError(f"{path}: world 헤더가 없는 합성 데이터 파일입니다")
+        set_schedule_api(schedule_api)
+        set_employee_api(MockEmployeeAPI(employees))
+        return world, count
+
+    def _iter_team_schedules(self, rng: random.Random, team: str,
+                             members: List[Employee]) -> Iterator[Schedule]:
+        """팀 하나의 기간 내 일정 생성"""
+        member_ids = [emp.id for emp in members]
+        lead = members[0]
+
+        # 팀별 고정 반복 일정 시각
+        weekly_day = rng.randint(0, 4)
+        weekly_hour = rng.choice([10, 11, 14, 15, 16])
+        one_on_one_day = rng.randint(0, 4)
+        has_standup = team.startswith("개발")
+
+        for offset in range(self.days):
+            day = self.start_date + timedelta(days=offset)
+            if day.weekday() >= 5:  # 주말 제외
+                continue
+
+            if has_standup:
+                yield from self._meeting(rng, "데일리 스탠드업", member_ids,
+                                         day.replace(hour=9, minute=30), 20)
+
+            if day.weekday() == weekly_day:
+                yield from self._meeting(rng, "팀 미팅", member_ids,
+                                         day.replace(hour=weekly_hour), 60)
+
+            if day.weekday() == one_on_one_day:
+                for i, member in enumerate(members[1:]):
+                    slot = day.replace(hour=13) + timedelta(minutes=30 * i)
+                    if slot.hour >= 18:
+                        break
+                    yield from self._meeting(rng, "1:1 미팅", [lead.id, member.id], slot, 30)
+
+            for emp in members:
+                for _ in range(self._ad_hoc_count(rng)):
+                    start = day.replace(
+                        hour=rng.randint(9, 17),
+                        minute=rng.choice([0, 10, 20, 30, 40, 50])
+                    )
+                    duration = rng.choice([30, 60, 90, 120])
+                    yield from self._meeting(rng, rng.choice(MEETING_TYPES), [emp.id],
+                                             start, duration)
+
+    def _ad_hoc_count(self, rng: random.Random) -> int:
+        """하루 비정기 일정 수 (평균 ad_hoc_per_day)"""
+        whole = int(self.ad_hoc_per_day)
+        return whole + (1 if rng.random() < self.ad_hoc_per_day - whole else 0)
+
+    @staticmethod
+    def _meeting(rng: random.Random, title: str, attendee_ids: List[str],
+                 start: datetime, duration_minutes: int) -> Iterator[Schedule]:
+        """참석자별 일정 생성 (create_meeting_schedules와 같은 구조)"""
+        end = start + timedelta(minutes=duration_minutes)
+        for emp_id in attendee_ids:
+            yield Schedule(
+                schedule_id=str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+                employee_id=emp_id,
+                title=title,
+                start_datetime=start,
+                end_datetime=end,
+                content=f"{title} 관련 내용",
+                attendees=attendee_ids
+            )
+
+
+def create_empty_schedule_api(db_path: Optional[str] = None) -> BaseScheduleAPI:
+    """합성 데이터용 빈 일정 저장소 생성
+
+    같은 시드로 다시 적재하면 일정 ID가 겹치고 다른 시드면 두 데이터가 섞이므로,
+    설정된 DB 파일(SCHEDULE_DB_PATH)에는 적재하지 않습니다. db_path를 주면 그 파일을
+    새로 만들어(기존 파일은 삭제) SQLite에, SQLite 백엔드 설정이면 새 임시 파일에,
+    그 밖에는 메모리 저장소에 적재합니다.
+    """
+    if db_path is None and SCHEDULE_BACKEND == "sqlite":
+        fd, db_path = tempfile.mkstemp(prefix="synthetic_schedules_", suffix=".db")
+        os.close(fd)
+    if db_path is not None and db_path != ":memory:":
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(db_path + suffix):
+                os.remove(db_path + suffix)
+    return create_schedule_api(generate_sample_data=False, db_path=db_path)
+
+
+def _schedule_to_json(schedule: Schedule) -> dict:
+    data = schedule.to_dict()
+    data["start_datetime"] = schedule.start_datetime.isoformat()
+    data["end_datetime"] = schedule.end_datetime.isoformat()
+    return data
+
+
+def _schedule_from_json(data: dict) -> Schedule:
+    data["start_datetime"] = datetime.fromisoformat(data["start_datetime"])
+    data["end_datetime"] = datetime.fromisoformat(data["end_datetime"])
+    return Schedule.from_dict(data)
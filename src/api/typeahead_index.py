@@ -0,0 +1,139 @@
+"""
+임직원 이름 자동완성 색인 (자모/초성 트라이)
+"""
+from typing import Dict, List, Set, Tuple
+
+from src.utils.hangul import chosung, decompose, is_chosung_query
+
+# 이름 처음부터 일치 / 이름 중간(이름자)부터 일치
+MATCH_FULL = 0
+MATCH_PARTIAL = 1
+
+
+class _TrieNode:
+    __slots__ = ("children", "entries")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.entries: Set[int] = set()
+
+
+class TypeaheadIndex:
+    """자모 분해 트라이 기반 이름 자동완성
+
+    '김처', '철수', 'ㄱㅊㅅ'처럼 입력 중인 음절이나 초성만으로도 '김철수'를 찾습니다.
+    이름 전체는 full 트라이에, 성 뒤 이름자부터의 접미사는 partial 트라이에
+    자모열/초성열로 넣습니다. full 결과를 먼저 채우고 모자라면 partial로 보충하며,
+    각 트라이는 너비 우선으로 탐색해 짧은 완성(정확한 일치)부터 모읍니다.
+    방문 노드 수에 상한을 두어 디렉터리 규모와 무관하게 지연시간을 제한합니다.
+    """
+
+    def __init__(self, max_visited_nodes: int = 4000):
+        self.max_visited_nodes = max_visited_nodes
+        # (자모 트라이, 초성 트라이) x (이름 전체, 이름자 접미사)
+        self._roots = {
+            (use_chosung, kind): _TrieNode()
+            for use_chosung in (False, True) for kind in (MATCH_FULL, MATCH_PARTIAL)
+        }
+        self._names: Dict[int, str] = {}
+
+    def add(self, doc_id: int, name: str) -> None:
+        """이름 등록"""
+        if doc_id in self._names:
+            self.remove(doc_id)
+        self._names[doc_id] = name
+        for (use_chosung, kind), key in self._keys(name):
+            self._insert(self._roots[(use_chosung, kind)], key, doc_id)
+
+    def remove(self, doc_id: int) -> None:
+        """이름 제거"""
+        name = self._names.pop(doc_id, None)
+        if name is None:
+            return
+        for (use_chosung, kind), key in self._keys(name):
+            self._discard(self._roots[(use_chosung, kind)], key, doc_id)
+
+    def search(self, query: str, top_k: int = 10) -> List[int]:
+        """순위순 문서 ID (이름 처음부터 일치 > 이름자 일치, 짧은 이름 우선)"""
+        query = query.replace(" ", "")
+        if not query:
+            return []
+
+        use_chosung = is_chosung_query(query)
+        key = query if use_chosung else decompose(query)
+
+        results: List[int] = []
+        seen: Set[int] = set()
+        budget = self.max_visited_nodes
+        for kind in (MATCH_FULL, MATCH_PARTIAL):
+            node = self._find(self._roots[(use_chosung, kind)], key)
+            if node is None:
+                continue
+            found, budget = self._collect(node, top_k - len(results), budget, seen)
+            results.extend(found)
+            seen.update(found)
+            if len(results) >= top_k or budget <= 0:
+                break
+        return results
+
+    @staticmethod
+    def _collect(node: _TrieNode, limit: int, budget: int,
+                 exclude: Set[int]) -> Tuple[List[int], int]:
+        """너비 우선으로 limit개 수집 (같은 깊이는 끝까지 확인해 doc_id 순 정렬)"""
+        found: List[int] = []
+        level = [node]
+        while level and budget > 0:
+            level_docs: Set[int] = set()
+            next_level: List[_TrieNode] = []
+            for current in level:
+                budget -= 1
+                level_docs.update(doc_id for doc_id in current.entries if doc_id not in exclude)
+                next_level.extend(current.children.values())
+                if budget <= 0:
+                    break
+            found.extend(sorted(level_docs - set(found)))
+            if len(found) >= limit:
+                break
+            level = next_level
+        return found[:limit], budget
+
+    @staticmethod
+    def _keys(name: str) -> List[Tuple[Tuple[bool, int], str]]:
+        keys = [((False, MATCH_FULL), decompose(name)), ((True, MATCH_FULL), chosung(name))]
+        for start in range(1, len(name)):
+            keys.append(((False, MATCH_PARTIAL), decompose(name[start:])))
+            keys.append(((True, MATCH_PARTIAL), chosung(name[start:])))
+        return keys
+
+    @staticmethod
+    def _insert(root: _TrieNode, key: str, doc_id: int) -> None:
+        node = root
+        for char in key:
+            node = node.children.setdefault(char, _TrieNode())
+        node.entries.add(doc_id)
+
+    @staticmethod
+    def _discard(root: _TrieNode, key: str, doc_id: int) -> None:
+        path = [root]
+        for char in key:
+            child = path[-1].children.get(char)
+            if child is None:
+                return
+            path.append(child)
+        path[-1].entries.discard(doc_id)
+
+        # 비어 있는 가지 정리
+        for i in range(len(key) - 1, -1, -1):
+            node = path[i + 1]
+            if node.entries or node.children:
+                break
+            del path[i].children[key[i]]
+
+    @staticmethod
+    def _find(root: _TrieNode, key: str):
+        node = root
+        for char in key:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
@@ -7,6 +7,7 @@ from typing import Dict, Any
 from src.models.chat import ChatStorage
 from src.services.ai_service import AIService
 from src.utils.config import MAX_CHAT_HISTORY_DISPLAY
+from src.utils.profiler import profiled
 
 
 class AIAssistantComponent:
@@ -16,6 +17,7 @@ class AIAssistantComponent:
         self.ai_service = ai_service
         self.chat_storage = chat_storage
 
+    @profiled()
     def render(self) -> Dict[str, Any]:
         """AI 어시스턴트 렌더링"""
         st.subheader("🤖 AI 어시스턴트")
@@ -49,13 +51,18 @@ class AIAssistantComponent:
         prompt = st.chat_input("자연어로 회의를 예약하거나 질문해주세요...")
 
         # 초기화 버튼
-        # 고유 키 생성
-        if 'clear_btn_counter' not in st.session_state:
-            st.session_state.clear_btn_counter = 0
-        st.session_state.clear_btn_counter += 1
-        clear_clicked = st.button("🗑️ 채팅 초기화", key=f"clear_{st.session_state.clear_btn_counter}", use_container_width=True)
+        clear_clicked = st.button("🗑️ 채팅 초기화", key="chat_clear", use_container_width=True)
+
+        # 응답 캐시 통계
+        cache_stats = self.ai_service.response_cache.stats()
+        if cache_stats['hits'] + cache_stats['misses']:
+            st.caption(
+                f"⚡ 응답 캐시 적중 {cache_stats['hits']}회 / 미적중 {cache_stats['misses']}회 "
+                f"({cache_stats['hit_rate']:.0%})"
+            )
 
         return {
+            'chat_container': chat_container,
             'prompt': prompt,
             'send_clicked': bool(prompt),
             'clear_clicked': clear_clicked
@@ -9,11 +9,14 @@ from src.models.meeting import Meeting, AttendeeRole
 from src.services.attendee_service import AttendeeService
 from src.services.meeting_service import MeetingService
 from src.utils.config import CONFLICT_ICONS
+from src.utils.profiler import profiled
+from src.utils.session import rerun_fragment
 
 
 class AttendeeManagementComponent:
     """참석자 관리 컴포넌트"""
 
+    @profiled()
     def render(self, meeting: Meeting) -> Meeting:
         """참석자 관리 UI 렌더링"""
         st.subheader("👥 참석자 관리")
@@ -29,15 +32,21 @@ class AttendeeManagementComponent:
 
         return meeting
 
+    @profiled()
     def _render_add_attendee_ui(self, meeting: Meeting):
         """참석자 추가 UI"""
+        notice = st.session_state.pop('attendee_notice', None)
+        if notice:
+            kind, message = notice
+            (st.success if kind == "success" else st.error)(message)
+
         with st.expander("➕ 참석자 추가", expanded=False):
             col1, col2, col3 = st.columns([2, 1, 1])
 
             with col1:
                 search_query = st.text_input(
                     "이름 또는 팀 검색",
-                    placeholder="김철수 또는 개발팀",
+                    placeholder="김철수, ㄱㅊㅅ 또는 개발팀",
                     key="attendee_search"
                 )
 
@@ -51,19 +60,16 @@ class AttendeeManagementComponent:
 
             with col3:
                 st.write("")  # 높이 맞추기
-                # 고유 키 생성
-                if 'search_btn_counter' not in st.session_state:
-                    st.session_state.search_btn_counter = 0
-                st.session_state.search_btn_counter += 1
-                search_clicked = st.button("🔍 검색", key=f"search_{st.session_state.search_btn_counter}", use_container_width=True)
-
-            # 검색 결과 표시 및 추가
-            if search_clicked and search_query:
+                st.button("🔍 검색", key="attendee_search_button", use_container_width=True)
+
+            # 검색 결과 표시 및 추가 (입력만으로도 자동완성 결과 표시)
+            if search_query:
                 self._show_search_results(meeting, search_query, AttendeeRole(role))
 
+    @profiled()
     def _show_search_results(self, meeting: Meeting, query: str, role: AttendeeRole):
         """검색 결과 표시"""
-        results = AttendeeService.search_employees(query)
+        results = AttendeeService.typeahead_employees(query, limit=5)
 
         if results:
             st.write("**검색 결과:**")
@@ -78,9 +84,7 @@ class AttendeeManagementComponent:
 
                 with col3:
                     # 이미 추가된 참석자인지 확인
-                    is_already_added = any(
-                        att.employee_id == emp_data['id'] for att in meeting.attendees
-                    )
+                    is_already_added = emp_data['id'] in meeting.attendees
                     if is_already_added:
                         st.write("✅ 추가됨")
                     else:
@@ -88,35 +92,41 @@ class AttendeeManagementComponent:
 
                 with col4:
                     if not is_already_added:
-                        if st.button(
+                        # 검색창 초기화는 위젯 생성 전에 해야 하므로 클릭 콜백에서 처리
+                        st.button(
                             "추가",
                             key=f"add_emp_{emp_data['id']}_{i}",
-                            use_container_width=True
-                        ):
-                            success = AttendeeService.add_attendee(meeting, emp_data['id'], role)
-                            if success:
-                                st.success(f"{emp_data['name']}님을 참석자로 추가했습니다!")
-                                # 검색창 초기화
-                                if 'attendee_search' in st.session_state:
-                                    st.session_state.attendee_search = ""
-                                st.rerun()
-                            else:
-                                st.error("참석자 추가에 실패했습니다.")
+                            use_container_width=True,
+                            on_click=self._add_from_search,
+                            args=(meeting, emp_data, role)
+                        )
         else:
             st.warning("검색 결과가 없습니다.")
 
+    @staticmethod
+    def _add_from_search(meeting: Meeting, emp_data: dict, role: AttendeeRole):
+        """검색 결과 추가 버튼 콜백"""
+        if AttendeeService.add_attendee(meeting, emp_data['id'], role):
+            st.session_state.attendee_notice = ("success", f"{emp_data['name']}님을 참석자로 추가했습니다!")
+            st.session_state.attendee_search = ""
+        else:
+            st.session_state.attendee_notice = ("error", "참석자 추가에 실패했습니다.")
+
+    @profiled()
     def _render_attendee_table(self, meeting: Meeting):
         """참석자 테이블 렌더링"""
         # 일정 충돌 확인
         MeetingService.check_attendee_conflicts(meeting)
 
-        # 테이블 데이터 준비
+        # 테이블 데이터 준비 (이름/팀은 회의 참석자 전원을 한 번에 조회한 현재 정보)
+        employees = AttendeeService.get_attendee_employees(meeting)
         attendee_data = []
         for i, attendee in enumerate(meeting.attendees):
+            employee = employees.get(attendee.employee_id)
             attendee_data.append({
                 "선택": False,
-                "이름": attendee.name,
-                "팀": attendee.team,
+                "이름": employee.name if employee else attendee.name,
+                "팀": employee.team if employee else attendee.team,
                 "역할": attendee.role.value,
                 "일정 충돌": CONFLICT_ICONS[attendee.has_conflict],
                 "_employee_id": attendee.employee_id,
@@ -166,11 +176,7 @@ class AttendeeManagementComponent:
             # 삭제 버튼
             col1, col2 = st.columns([1, 4])
             with col1:
-                # 고유 키 생성
-                if 'delete_btn_counter' not in st.session_state:
-                    st.session_state.delete_btn_counter = 0
-                st.session_state.delete_btn_counter += 1
-                if st.button("🗑️ 선택 삭제", key=f"delete_{st.session_state.delete_btn_counter}", use_container_width=True):
+                if st.button("🗑️ 선택 삭제", key="attendee_delete", use_container_width=True):
                     selected_indices = [
                         attendee_data[i]["_employee_id"]
                         for i, row in enumerate(edited_df.itertuples())
@@ -179,24 +185,21 @@ class AttendeeManagementComponent:
                     if selected_indices:
                         removed_count = AttendeeService.remove_attendees(meeting, selected_indices)
                         st.success(f"{removed_count}명의 참석자를 삭제했습니다.")
-                        st.rerun()
+                        rerun_fragment()
                     else:
                         st.warning("삭제할 참석자를 선택해주세요.")
 
             # 참석자 요약 정보
-            organizers = [att for att in meeting.attendees if att.role == AttendeeRole.ORGANIZER]
-            required = [att for att in meeting.attendees if att.role == AttendeeRole.REQUIRED]
-            optional = [att for att in meeting.attendees if att.role == AttendeeRole.OPTIONAL]
-            conflicts = [att for att in meeting.attendees if att.has_conflict]
+            conflict_count = sum(1 for att in meeting.attendees if att.has_conflict)
 
             st.markdown("---")
             col1, col2, col3, col4 = st.columns(4)
 
             with col1:
-                st.metric("주관자", len(organizers))
+                st.metric("주관자", meeting.attendees.count_role(AttendeeRole.ORGANIZER))
             with col2:
-                st.metric("필수 참석자", len(required))
+                st.metric("필수 참석자", meeting.attendees.count_role(AttendeeRole.REQUIRED))
             with col3:
-                st.metric("선택 참석자", len(optional))
+                st.metric("선택 참석자", meeting.attendees.count_role(AttendeeRole.OPTIONAL))
             with col4:
-                st.metric("일정 충돌", len(conflicts), delta=f"-{len(conflicts)}" if conflicts else None)
\ No newline at end of file
+                st.metric("일정 충돌", conflict_count, delta=f"-{conflict_count}" if conflict_count else None)
\ No newline at end of file
@@ -3,11 +3,14 @@
 """
 import streamlit as st
 
+from src.utils.profiler import profiled
+
 
 class HeaderComponent:
     """헤더 컴포넌트"""
 
     @staticmethod
+    @profiled()
     def render(is_edit_mode: bool = False):
         """헤더 렌더링"""
         title = "📝 회의 수정" if is_edit_mode else "📝 회의 예약"
@@ -49,6 +52,7 @@ class UsageGuideComponent:
     """사용법 안내 컴포넌트"""
 
     @staticmethod
+    @profiled()
     def render():
         """사용법 안내 렌더링"""
         with st.expander("💡 AI 어시스턴트 사용법"):
@@ -1,6 +1,7 @@
 """
 회의 폼 컴포넌트
 """
+import html
 import streamlit as st
 import pandas as pd
 from datetime import datetime, timedelta
@@ -10,11 +11,13 @@ from typing import Dict
 from src.models.meeting import Meeting, MeetingStorage
 from src.services.meeting_service import MeetingService
 from src.utils.config import QUILL_TOOLBAR
+from src.utils.profiler import profiled
 
 
 class MeetingFormComponent:
     """회의 폼 컴포넌트"""
 
+    @profiled()
     def render(self, current_meeting: Meeting, session_manager) -> Meeting:
         """회의 폼 렌더링"""
         # 하이라이트 CSS 추가
@@ -83,6 +86,7 @@ class MeetingFormComponent:
 
         return updated_meeting
 
+    @profiled()
     def render_content_editor(self, current_meeting: Meeting, session_manager) -> str:
         """회의 안건 에디터 별도 렌더링"""
         # 내용 하이라이트 체크
@@ -143,31 +147,25 @@ class MeetingActionsComponent:
     def __init__(self, meeting_storage: MeetingStorage):
         self.meeting_storage = meeting_storage
 
+    @profiled()
     def render(self, current_meeting: Meeting) -> Dict[str, bool]:
         """액션 버튼들 렌더링"""
-        # 세션 상태에서 버튼 카운터 초기화
-        if 'button_counter' not in st.session_state:
-            st.session_state.button_counter = 0
-
-        # 고유 버튼 ID 생성
-        st.session_state.button_counter += 1
-        button_id = st.session_state.button_counter
-
+        # 버튼 키는 재실행 간에 고정되어야 클릭이 다음 실행에 전달됨
         col1, col2, col3, col4 = st.columns([1, 1, 1, 1])
 
         with col1:
             save_label = "💾 회의 수정" if current_meeting.is_edit_mode else "💾 회의 저장"
-            save_clicked = st.button(save_label, key=f"save_{button_id}", use_container_width=True)
+            save_clicked = st.button(save_label, key="meeting_save", use_container_width=True)
 
         with col2:
-            reset_clicked = st.button("🔄 폼 초기화", key=f"reset_{button_id}", use_container_width=True)
+            reset_clicked = st.button("🔄 폼 초기화", key="meeting_reset", use_container_width=True)
 
         with col3:
-            view_list_clicked = st.button("📊 회의 목록", key=f"list_{button_id}", use_container_width=True)
+            view_list_clicked = st.button("📊 회의 목록", key="meeting_list", use_container_width=True)
 
         with col4:
             if current_meeting.is_edit_mode:
-                cancel_clicked = st.button("❌ 수정 취소", key=f"cancel_{button_id}", use_container_width=True)
+                cancel_clicked = st.button("❌ 수정 취소", key="meeting_cancel", use_container_width=True)
             else:
                 cancel_clicked = False
 
@@ -176,9 +174,9 @@ class MeetingActionsComponent:
             is_valid, message = MeetingService.validate_meeting(current_meeting)
             if is_valid:
                 # API에 저장
-                api_success = MeetingService.save_meeting_to_api(current_meeting)
+                booking = MeetingService.save_meeting_to_api(current_meeting)
 
-                if api_success:
+                if booking.success:
                     if current_meeting.is_edit_mode:
                         # 수정 모드
                         self.meeting_storage.update_meeting(current_meeting)
@@ -195,6 +193,22 @@ class MeetingActionsComponent:
                             ✅ 회의가 성공적으로 저장되었습니다!
                         </div>
                         """, unsafe_allow_html=True)
+                elif booking.conflicts:
+                    # 저장 직전 확인에서 겹친 일정 (다른 사용자가 먼저 예약한 경우 포함)
+                    # 일정 제목과 이름은 사용자 입력이므로 HTML로 넣기 전에 이스케이프
+                    conflict_lines = "<br>".join(
+                        f"{html.escape(self._attendee_name(current_meeting, emp_id))}: "
+                        f"{html.escape(schedule.title)} "
+                        f"({schedule.start_datetime.strftime('%m/%d %H:%M')}~"
+                        f"{schedule.end_datetime.strftime('%H:%M')})"
+                        for emp_id, schedules in booking.conflicts.items()
+                        for schedule in schedules
+                    )
+                    st.markdown(f"""
+                    <div class="error-message">
+                        ❌ 참석자 일정이 겹쳐 저장하지 않았습니다.<br>{conflict_lines}
+                    </div>
+                    """, unsafe_allow_html=True)
                 else:
                     st.markdown("""
                     <div class="error-message">
@@ -219,6 +233,11 @@ class MeetingActionsComponent:
             'cancel_clicked': cancel_clicked
         }
 
+    @staticmethod
+    def _attendee_name(meeting: Meeting, employee_id: str) -> str:
+        attendee = meeting.attendees.get(employee_id)
+        return attendee.name if attendee else employee_id
+
     def _show_meetings_list(self):
         """회의 목록 표시"""
         meetings = self.meeting_storage.get_meetings()
@@ -0,0 +1,63 @@
+"""
+렌더 프로파일러 디버그 패널
+"""
+import streamlit as st
+import pandas as pd
+
+from src.utils.profiler import RenderProfiler
+
+
+class ProfilerPanelComponent:
+    """재실행 시간 디버그 패널 컴포넌트 (MEETING_PROFILER=1 일 때만 표시)"""
+
+    def __init__(self, profiler: RenderProfiler):
+        self.profiler = profiler
+
+    def render(self):
+        """디버그 패널 렌더링"""
+        if not self.profiler.enabled:
+            return
+
+        last = self.profiler.last_rerun
+        with st.expander("🛠️ 렌더 프로파일", expanded=False):
+            if last is None:
+                st.caption("아직 측정된 재실행이 없습니다.")
+                return
+
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("재실행 시간", f"{last.wall_ms:.1f} ms")
+            with col2:
+                st.metric("최대 할당", f"{last.peak_kib:.0f} KiB")
+            with col3:
+                st.metric("재실행 횟수", self.profiler.rerun_count)
+
+            st.caption(f"마지막 재실행 #{last.index} ({last.kind})")
+            st.dataframe(pd.DataFrame([
+                {
+                    "구간": name,
+                    "호출": stats.calls,
+                    "시간(ms)": round(stats.wall_ms, 2),
+                    "할당(KiB)": round(stats.alloc_kib, 1)
+                }
+                for name, stats in sorted(last.spans.items(), key=lambda item: -item[1].wall_ms)
+            ]), use_container_width=True, hide_index=True)
+
+            st.caption("세션 누적")
+            st.dataframe(pd.DataFrame([
+                {
+                    "구간": name,
+                    "호출": stats.calls,
+                    "합계(ms)": round(stats.wall_ms, 1),
+                    "평균(ms)": round(stats.wall_ms / stats.calls, 2),
+                    "할당(KiB)": round(stats.alloc_kib, 1)
+                }
+                for name, stats in sorted(self.profiler.session_totals.items(),
+                                          key=lambda item: -item[1].wall_ms)
+            ]), use_container_width=True, hide_index=True)
+
+            if self.profiler.log_path:
+                st.caption(f"JSONL 로그: {self.profiler.log_path} (세션 {self.profiler.session_id})")
+
+            if st.button("통계 초기화", key="profiler_reset", use_container_width=True):
+                self.profiler.reset()
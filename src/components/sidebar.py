@@ -5,12 +5,14 @@ import streamlit as st
 from typing import Optional, Dict, Any
 
 from src.models.meeting import MeetingStorage
+from src.utils.profiler import profiled
 
 
 class SidebarLogoComponent:
     """사이드바 로고 컴포넌트"""
 
     @staticmethod
+    @profiled()
     def render():
         """로고 렌더링"""
         st.markdown("""
@@ -28,6 +30,7 @@ class MeetingHistoryComponent:
     def __init__(self, meeting_storage: MeetingStorage):
         self.meeting_storage = meeting_storage
 
+    @profiled()
     def render(self) -> Optional[Dict[str, Any]]:
         """회의 내역 렌더링 (expander + 카드 방식)"""
         meetings = self.meeting_storage.get_meetings()
@@ -5,6 +5,8 @@ from dataclasses import dataclass, asdict
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 
+from src.models.employee import NameResolution
+
 
 @dataclass
 class ChatMessage:
@@ -30,6 +32,8 @@ class LLMResponse:
     error: Optional[str] = None
     action_description: Optional[str] = None
     requires_confirmation: bool = False
+    # 참석자 이름 보정 결과 (동명이인/미확인 이름을 사용자에게 되묻는 용도)
+    name_resolution: Optional[NameResolution] = None
 
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
@@ -48,6 +52,17 @@ class LLMResponse:
         return self.action == "chat"
 
 
+@dataclass
+class StreamEvent:
+    """LLM 스트리밍 이벤트 (action: ACTION JSON 확정, text: RESPONSE 텍스트 조각)"""
+    kind: str
+    text: str = ""
+    action: Optional[Dict[str, Any]] = None
+
+    def is_action(self) -> bool:
+        return self.kind == "action"
+
+
 class ChatStorage:
     """채팅 저장소 클래스"""
 
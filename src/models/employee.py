@@ -1,9 +1,9 @@
 """
 임직원 및 일정 관련 데이터 모델
 """
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import uuid
 
 
@@ -33,6 +33,7 @@ class Schedule:
     end_datetime: datetime
     content: str = ""
     attendees: List[str] = None
+    meeting_id: Optional[str] = None  # 회의 일정이면 소속 회의 ID
 
     def __post_init__(self):
         if self.attendees is None:
@@ -45,4 +46,45 @@ class Schedule:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Schedule':
-        return cls(**data)
\ No newline at end of file
+        return cls(**data)
+
+
+@dataclass
+class MeetingScheduleChanges:
+    """회의 수정 시 반영한 참석자 일정 변경 내역 (employee_id -> 일정 ID)"""
+    created: Dict[str, str] = field(default_factory=dict)
+    deleted: Dict[str, str] = field(default_factory=dict)
+    updated: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.created or self.deleted or self.updated)
+
+
+@dataclass
+class BookingResult:
+    """회의 일정 예약 결과 (성공 시 생성된 일정 ID, 충돌 시 참석자별 겹치는 일정)"""
+    schedule_ids: List[str] = field(default_factory=list)
+    conflicts: Dict[str, List[Schedule]] = field(default_factory=dict)
+    error: Optional[str] = None
+    changes: Optional[MeetingScheduleChanges] = None  # 회의 수정일 때만
+
+    @property
+    def success(self) -> bool:
+        return not self.conflicts and self.error is None
+
+
+@dataclass
+class NameMatch:
+    """이름 보정 결과 (distance는 자모 단위 편집 거리, confidence는 0~1)"""
+    employee: Employee
+    distance: int
+    confidence: float
+
+
+@dataclass
+class NameResolution:
+    """이름 목록 일괄 보정 결과 (입력한 이름 기준)"""
+    resolved: Dict[str, NameMatch] = field(default_factory=dict)
+    ambiguous: Dict[str, List[NameMatch]] = field(default_factory=dict)
+    unresolved: List[str] = field(default_factory=list)
@@ -1,9 +1,9 @@
 """
 회의 및 참석자 관련 데이터 모델
 """
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields, replace
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Iterator, Union
 from enum import Enum
 import uuid
 
@@ -17,13 +17,19 @@ class AttendeeRole(Enum):
 
 @dataclass
 class Attendee:
-    """참석자 데이터 모델"""
+    """참석자 데이터 모델 (role은 생성 후 AttendeeList.set_role로만 변경)"""
     employee_id: str
     name: str
     team: str
     role: AttendeeRole
     has_conflict: bool = False
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "role" and "role" in self.__dict__:
+            # 직접 바꾸면 AttendeeList의 역할별 색인과 어긋남
+            raise AttributeError("참석자 역할은 AttendeeList.set_role로 변경하세요")
+        super().__setattr__(name, value)
+
     def to_dict(self) -> Dict[str, Any]:
         data = asdict(self)
         data['role'] = self.role.value
@@ -36,6 +42,112 @@ class Attendee:
         return cls(**data)
 
 
+class AttendeeList:
+    """employee_id와 역할로 색인된 참석자 목록
+
+    등록 순서를 유지하면서 참석 여부 확인, 조회, 추가, 역할 변경/집계를 O(1)로
+    처리합니다. 리스트처럼 순회/len/인덱스 접근을 지원하며, 역할은 색인이
+    어긋나지 않도록 set_role로만 바꿉니다.
+
+    인덱스 접근용 목록과 역할별 목록 순서는 필요할 때만 맞춥니다. 제거 후 첫 인덱스 접근,
+    역할 변경 후 첫 by_role 호출에서만 O(n)이 들고 이후에는 다시 O(1)입니다.
+    """
+
+    def __init__(self, attendees: Optional[Iterable[Attendee]] = None):
+        self._items: Dict[str, Attendee] = {}
+        self._by_role: Dict[AttendeeRole, Dict[str, Attendee]] = {role: {} for role in AttendeeRole}
+        # employee_id -> 등록 순번 (역할별 색인을 목록 순서로 맞출 때 사용)
+        self._order: Dict[str, int] = {}
+        self._next_order = 0
+        # 인덱스 접근용 목록 (제거 시 무효화) / 목록 순서와 어긋난 역할 색인
+        self._positions: Optional[List[Attendee]] = []
+        self._unsorted_roles = set()
+        for attendee in attendees or ():
+            self.append(attendee)
+
+    def append(self, attendee: Attendee) -> bool:
+        """참석자 추가 (이미 있는 employee_id면 False)"""
+        if attendee.employee_id in self._items:
+            return False
+        self._items[attendee.employee_id] = attendee
+        self._by_role[attendee.role][attendee.employee_id] = attendee
+        self._order[attendee.employee_id] = self._next_order
+        self._next_order += 1
+        if self._positions is not None:
+            self._positions.append(attendee)
+        return True
+
+    def remove(self, employee_id: str) -> Optional[Attendee]:
+        """참석자 제거"""
+        attendee = self._items.pop(employee_id, None)
+        if attendee is not None:
+            del self._by_role[attendee.role][employee_id]
+            del self._order[employee_id]
+            self._positions = None
+        return attendee
+
+    def get(self, employee_id: str) -> Optional[Attendee]:
+        """employee_id로 참석자 조회"""
+        return self._items.get(employee_id)
+
+    def set_role(self, employee_id: str, role: AttendeeRole) -> bool:
+        """참석자 역할 변경 (O(1), 역할 색인 순서는 by_role에서 맞춤)"""
+        attendee = self._items.get(employee_id)
+        if attendee is None:
+            return False
+        del self._by_role[attendee.role][employee_id]
+        object.__setattr__(attendee, "role", role)
+        bucket = self._by_role[role]
+        last_id = next(reversed(bucket), None)
+        bucket[employee_id] = attendee
+        if last_id is not None and self._order[last_id] > self._order[employee_id]:
+            self._unsorted_roles.add(role)
+        return True
+
+    def by_role(self, role: AttendeeRole) -> List[Attendee]:
+        """역할별 참석자 (목록 순서)"""
+        bucket = self._by_role[role]
+        if role in self._unsorted_roles:
+            self._unsorted_roles.discard(role)
+            ordered = sorted(bucket.items(), key=lambda item: self._order[item[0]])
+            bucket.clear()
+            bucket.update(ordered)
+        return list(bucket.values())
+
+    def count_role(self, role: AttendeeRole) -> int:
+        return len(self._by_role[role])
+
+    def employee_ids(self) -> List[str]:
+        return list(self._items)
+
+    def copy(self) -> 'AttendeeList':
+        """참석자 객체까지 복사한 목록 (원본의 역할 색인과 분리)"""
+        return AttendeeList(replace(attendee) for attendee in self._items.values())
+
+    def __contains__(self, item: Union[str, Attendee]) -> bool:
+        employee_id = item.employee_id if isinstance(item, Attendee) else item
+        return employee_id in self._items
+
+    def __iter__(self) -> Iterator[Attendee]:
+        return iter(self._items.values())
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index: int) -> Attendee:
+        if self._positions is None:
+            self._positions = list(self._items.values())
+        return self._positions[index]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (AttendeeList, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"AttendeeList({list(self._items.values())!r})"
+
+
 @dataclass
 class Meeting:
     """회의 데이터 모델"""
@@ -43,18 +155,18 @@ class Meeting:
     start_time: datetime
     end_time: datetime
     content: str
-    attendees: List[Attendee]
+    attendees: AttendeeList
     meeting_id: str = None
     is_edit_mode: bool = False
 
     def __post_init__(self):
         if self.meeting_id is None:
             self.meeting_id = str(uuid.uuid4())
-        if self.attendees is None:
-            self.attendees = []
+        if not isinstance(self.attendees, AttendeeList):
+            self.attendees = AttendeeList(self.attendees)
 
     def to_dict(self) -> Dict[str, Any]:
-        data = asdict(self)
+        data = {f.name: getattr(self, f.name) for f in fields(self)}
         data['attendees'] = [attendee.to_dict() for attendee in self.attendees]
         return data
 
@@ -82,10 +194,8 @@ class Meeting:
         return ", ".join([attendee.name for attendee in self.attendees])
 
     def get_organizer(self) -> Optional[Attendee]:
-        for attendee in self.attendees:
-            if attendee.role == AttendeeRole.ORGANIZER:
-                return attendee
-        return None
+        organizers = self.attendees.by_role(AttendeeRole.ORGANIZER)
+        return organizers[0] if organizers else None
 
 
 class MeetingStorage:
@@ -3,12 +3,16 @@ AI/LLM 서비스
 """
 from google import genai
 from datetime import datetime
-import json
 import re
-from typing import Optional, Iterator, Tuple
+from typing import Optional, Iterator
 
 from src.utils.config import GOOGLE_API_KEY, GEMINI_MODEL_NAME, SYSTEM_PROMPT
 from src.models.meeting import Meeting
+from src.models.chat import StreamEvent
+from src.services.response_stream_parser import ActionResponseStreamParser
+from src.services.response_cache import get_response_cache
+from src.services.command_parser import FastPathCommandParser
+from src.utils.profiler import profiled
 
 
 class AIService:
@@ -18,6 +22,8 @@ class AIService:
         self.client = None
         self.is_initialized = False
         self.error_message = None
+        self.response_cache = get_response_cache()
+        self.command_parser = FastPathCommandParser()
 
     def initialize(self) -> tuple[bool, str]:
         """AI API 초기화"""
@@ -33,70 +39,69 @@ class AIService:
             self.error_message = f"Google GenAI 클라이언트 설정 오류: {str(e)}"
             return False, self.error_message
 
-    def process_prompt_stream(self, prompt: str, current_meeting: Meeting) -> tuple[Optional[dict], Iterator[str]]:
-        """프롬프트 처리 (action 분리 + response 스트리밍)"""
-        if not self.client:
-            def error_generator():
-                yield "AI 클라이언트가 초기화되지 않았습니다."
+    @profiled()
+    def process_prompt_stream(self, prompt: str, current_meeting: Meeting) -> Iterator[StreamEvent]:
+        """프롬프트 처리 (모델 청크가 도착하는 대로 ACTION/RESPONSE 이벤트 스트리밍)"""
+        # 규칙 기반 파서가 확신하는 명령은 LLM 호출 없이 즉시 처리
+        fast_path = self.command_parser.parse(prompt, current_meeting)
+        if fast_path is not None:
+            action_data, response_text = fast_path
+            yield StreamEvent(kind="action", action=action_data)
+            yield StreamEvent(kind="text", text=response_text)
+            return
 
-            return None, error_generator()
+        if not self.client:
+            yield StreamEvent(kind="text", text="AI 클라이언트가 초기화되지 않았습니다.")
+            return
 
         try:
             # 현재 회의 정보를 컨텍스트에 포함
             meeting_context = self._get_meeting_context(current_meeting)
+            current_time = datetime.now().strftime("%Y-%m-%d %H:%M")
+
+            # 같은 프롬프트/회의 컨텍스트/시각(분 단위)이면 캐시된 응답 재사용
+            cache_key = self.response_cache.make_key(prompt, meeting_context, current_time)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                action_data, response_text = cached
+                if action_data is not None:
+                    yield StreamEvent(kind="action", action=action_data)
+                yield StreamEvent(kind="text", text=response_text)
+                return
 
             full_prompt = SYSTEM_PROMPT.format(
-                current_time=datetime.now().strftime("%Y-%m-%d %H:%M"),
+                current_time=current_time,
                 current_meeting=meeting_context
             ) + f"\n\n사용자 입력: {prompt}"
 
             # Google GenAI 스트리밍 API 호출
-            full_response = ""
+            parser = ActionResponseStreamParser()
+            action_data = None
+            response_parts = []
+
+            def collect(events):
+                nonlocal action_data
+                for event in events:
+                    if event.is_action():
+                        action_data = event.action
+                    else:
+                        response_parts.append(event.text)
+                    yield event
+
             for chunk in self.client.models.generate_content_stream(
                     model=GEMINI_MODEL_NAME,
                     contents=full_prompt
             ):
                 if chunk.text:
-                    full_response += chunk.text
+                    yield from collect(parser.feed(chunk.text))
 
-            # ACTION과 RESPONSE 분리
-            action_data = None
-            response_text = ""
-
-            if "ACTION:" in full_response and "RESPONSE:" in full_response:
-                parts = full_response.split("RESPONSE:")
-                action_part = parts[0].replace("ACTION:", "").strip()
-                response_text = parts[1].strip()
-
-                # ACTION JSON 파싱
-                try:
-                    json_text = self._extract_json(action_part)
-                    if json_text:
-                        action_data = json.loads(json_text)
-                except json.JSONDecodeError:
-                    pass
-            else:
-                # 구분자가 없으면 전체를 response로 처리
-                response_text = full_response
-
-            # RESPONSE 부분을 단어별로 스트리밍
-            def response_generator():
-                import time
-                if response_text:
-                    words = response_text.split()
-                    for word in words:
-                        yield word + " "
-                        time.sleep(0.05)  # 타이핑 효과
-                else:
-                    yield "응답을 처리했습니다."
-
-            return action_data, response_generator()
+            yield from collect(parser.close())
 
-        except Exception as e:
-            def error_generator():
-                yield f"AI 처리 중 오류가 발생했습니다: {str(e)}"
+            # 스트림을 끝까지 받은 정상 응답만 캐시
+            self.response_cache.put(cache_key, action_data, "".join(response_parts))
 
-            return None, error_generator()
+        except Exception as e:
+            yield StreamEvent(kind="text", text=f"AI 처리 중 오류가 발생했습니다: {str(e)}")
 
     def _get_meeting_context(self, meeting: Meeting) -> str:
         """현재 회의 컨텍스트 생성"""
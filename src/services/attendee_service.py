@@ -1,16 +1,19 @@
 """
 참석자 관리 서비스
 """
-from typing import List
+from typing import Dict, Iterable, List
 
+from src.models.employee import Employee, NameResolution
 from src.models.meeting import Meeting, Attendee, AttendeeRole
 from src.api.employee_api import get_employee_api
+from src.utils.profiler import profiled
 
 
 class AttendeeService:
     """참석자 관리 서비스 클래스"""
 
     @staticmethod
+    @profiled()
     def search_employees(query: str) -> List[dict]:
         """임직원 검색"""
         emp_api = get_employee_api()
@@ -27,19 +30,29 @@ class AttendeeService:
 
         return [emp.to_dict() for emp in employees]
 
+    @staticmethod
+    @profiled()
+    def typeahead_employees(query: str, limit: int = 5) -> List[dict]:
+        """이름 자동완성 검색 (초성/입력 중인 음절 지원), 결과가 없으면 팀 검색"""
+        emp_api = get_employee_api()
+        employees = emp_api.typeahead(query, limit)
+        if employees:
+            return [emp.to_dict() for emp in employees]
+        return AttendeeService.search_employees(query)[:limit]
+
     @staticmethod
     def add_attendee(meeting: Meeting, employee_id: str, role: AttendeeRole) -> bool:
         """참석자 추가"""
+        # 이미 있는지 확인
+        if employee_id in meeting.attendees:
+            return False
+
         emp_api = get_employee_api()
         employee = emp_api.get_employee_by_id(employee_id)
 
         if not employee:
             return False
 
-        # 이미 있는지 확인
-        if any(att.employee_id == employee_id for att in meeting.attendees):
-            return False
-
         attendee = Attendee(
             employee_id=employee.id,
             name=employee.name,
@@ -47,24 +60,58 @@ class AttendeeService:
             role=role
         )
 
-        meeting.attendees.append(attendee)
-        return True
+        return meeting.attendees.append(attendee)
+
+    @staticmethod
+    @profiled()
+    def get_attendee_employees(meeting: Meeting) -> Dict[str, Employee]:
+        """회의 참석자 전원의 임직원 정보를 한 번에 조회 (employee_id -> Employee)"""
+        return get_employee_api().get_employees_by_ids(meeting.attendees.employee_ids())
+
+    @staticmethod
+    def add_attendees(meeting: Meeting, employee_ids: List[str], role: AttendeeRole) -> int:
+        """여러 참석자를 한 번에 추가 (이미 있는 참석자는 건너뜀)"""
+        emp_api = get_employee_api()
+        employees = emp_api.get_employees_by_ids(employee_ids)
+        return AttendeeService._append_attendees(meeting, employees.values(), role)
+
+    @staticmethod
+    @profiled()
+    def add_attendees_by_names(meeting: Meeting, names: Iterable[str],
+                               role: AttendeeRole) -> NameResolution:
+        """이름 목록을 한 번에 보정해 참석자로 추가
+
+        후보가 하나로 정해진 이름만 추가하고, 동명이인/미확인 이름은 결과에 담아 반환합니다.
+        """
+        emp_api = get_employee_api()
+        resolution = emp_api.resolve_names(names)
+        AttendeeService._append_attendees(
+            meeting, (match.employee for match in resolution.resolved.values()), role
+        )
+        return resolution
+
+    @staticmethod
+    def _append_attendees(meeting: Meeting, employees: Iterable[Employee], role: AttendeeRole) -> int:
+        added = 0
+        for employee in employees:
+            if employee.id in meeting.attendees:
+                continue
+            meeting.attendees.append(Attendee(
+                employee_id=employee.id,
+                name=employee.name,
+                team=employee.team,
+                role=role
+            ))
+            added += 1
+        return added
 
     @staticmethod
     def remove_attendees(meeting: Meeting, employee_ids: List[str]) -> int:
         """참석자 제거"""
-        original_count = len(meeting.attendees)
-        meeting.attendees = [
-            att for att in meeting.attendees
-            if att.employee_id not in employee_ids
-        ]
-        return original_count - len(meeting.attendees)
+        return sum(1 for employee_id in set(employee_ids)
+                   if meeting.attendees.remove(employee_id) is not None)
 
     @staticmethod
     def update_attendee_role(meeting: Meeting, employee_id: str, new_role: AttendeeRole) -> bool:
         """참석자 역할 업데이트"""
-        for attendee in meeting.attendees:
-            if attendee.employee_id == employee_id:
-                attendee.role = new_role
-                return True
-        return False
\ No newline at end of file
+        return meeting.attendees.set_role(employee_id, new_role)
\ No newline at end of file
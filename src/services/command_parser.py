@@ -0,0 +1,333 @@
+"""
+자주 쓰이는 한국어 일정 명령 규칙 기반 파서 (LLM 앞단 fast-path)
+"""
+import re
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from src.models.meeting import Meeting
+from src.api.employee_api import get_employee_api
+
+WEEKDAYS = {"월": 0, "화": 1, "수": 2, "목": 3, "금": 4, "토": 5, "일": 6}
+RELATIVE_DAYS = {"오늘": 0, "금일": 0, "내일": 1, "명일": 1, "모레": 2, "글피": 3}
+
+# '2시간'의 '2시'는 시각이 아니므로 '시' 뒤에 '간'이 오면 제외
+_TIME = (r"(?:(오전|오후|아침|점심|저녁|밤|낮)\s*)?(\d{1,2})"
+         r"(?:\s*시(?!간)(?:\s*(\d{1,2})\s*분|\s*(반))?|:(\d{2}))")
+TIME_RANGE_PATTERN = re.compile(_TIME + r"\s*(?:부터|에서|~|-)\s*" + _TIME + r"\s*(?:까지)?(?:로|으로)?")
+TIME_PATTERN = re.compile(_TIME + r"(?:에|부터|로|으로)?")
+DATE_PATTERNS = [
+    (re.compile(r"(다음\s*주|담주|이번\s*주|금주)\s*([월화수목금토일])요일(?:에|로|으로)?"), "week_weekday"),
+    (re.compile(r"(\d{1,2})\s*월\s*(\d{1,2})\s*일(?:에|로|으로)?"), "month_day"),
+    (re.compile(r"(오늘|금일|내일|명일|모레|글피)(?:에|로|으로)?"), "relative"),
+    (re.compile(r"([월화수목금토일])요일(?:에|로|으로)?"), "weekday"),
+]
+TITLE_PATTERN = re.compile(r"제목(?:을|를)?\s*['\"“‘](.+?)['\"”’]\s*(?:으로|로)?")
+MOVE_PATTERN = re.compile(r"옮겨|옮기|변경|바꿔|바꾸")
+# 제목 구절에 들어가면 안 되는 길이 표현 ('2시간', '30분')
+DURATION_WORD_PATTERN = re.compile(r"^\d+\s*(?:시간|분)$")
+EXTEND_PATTERN = re.compile(
+    r"(?:(\d+)\s*시간(?:\s*(\d+)\s*분)?|(\d+)\s*분|(반)\s*시간)\s*(?:더\s*)?(?:연장|늘려)"
+)
+
+MEETING_NOUNS = ("회의", "미팅", "리뷰", "워크샵", "교육", "면접", "스크럼", "스탠드업",
+                 "킥오프", "세미나", "회고", "데모", "온보딩", "브레인스토밍")
+ATTENDEE_TRIGGERS = ("추가", "함께")
+NAME_SUFFIXES = ("님을", "님를", "님과", "님와", "님도", "님", "이랑", "하고", "에게",
+                 "을", "를", "와", "과", "랑", "도")
+FILLER_WORDS = {
+    "회의", "회의를", "회의는", "회의에", "회의로", "미팅", "미팅을", "일정", "일정을",
+    "시간", "시간을", "시간은", "참석자", "참석자에", "참석자로", "참석자를",
+    "잡아", "잡아줘", "잡아주세요", "예약", "예약해", "예약해줘", "예약해주세요", "예약하기",
+    "추가", "추가해", "추가해줘", "추가해주세요", "함께", "같이",
+    "변경", "변경해", "변경해줘", "변경해주세요", "바꿔", "바꿔줘", "바꿔주세요",
+    "설정", "설정해", "설정해줘", "설정해주세요", "옮겨", "옮겨줘", "옮겨주세요",
+    "연장", "연장해", "연장해줘", "연장해주세요", "늘려", "늘려줘",
+    "해줘", "해주세요", "줘", "주세요", "좀", "해", "으로", "로", "에", "을", "를",
+    "새", "새로", "하나", "만들어", "만들어줘"
+}
+
+_PLACEHOLDER = "\x00"
+# 시간 범위의 종료 대신 쓰는 표시 (시작만 옮기고 회의 길이 유지)
+KEEP_DURATION = object()
+
+
+class FastPathCommandParser:
+    """규칙 기반 일정 명령 파서
+
+    프롬프트 전체가 인식 가능한 표현(날짜, 시간, 제목, 참석자, 연장)과 허용된
+    어미/조사만으로 이루어졌을 때만 결과를 반환하고, 그 외에는 None을 반환해
+    LLM으로 넘깁니다. 결과 ACTION은 SYSTEM_PROMPT의 형식과 같습니다.
+    """
+
+    def parse(self, prompt: str, current_meeting: Meeting,
+              now: Optional[datetime] = None) -> Optional[Tuple[Dict, str]]:
+        """(ACTION dict, RESPONSE 텍스트) 또는 None"""
+        now = now or datetime.now()
+        text = prompt.strip().rstrip(".!?~ ")
+        if not text:
+            return None
+
+        updates: Dict[str, str] = {}
+        descriptions: List[str] = []
+
+        text = self._extract_title(text, updates, descriptions)
+        text = self._extract_extension(text, current_meeting, updates, descriptions)
+        text, target_date = self._extract_date(text, now)
+        moving = MOVE_PATTERN.search(text) is not None
+        text, time_range = self._extract_time(text, moving)
+        if text is None:
+            return None
+        self._apply_schedule(current_meeting, target_date, time_range, updates, descriptions)
+
+        tokens = [token for token in re.split(r"[\s,、]+", text) if token]
+        tokens = self._extract_attendees(tokens, updates, descriptions)
+        if tokens is None:
+            return None
+
+        tokens = self._extract_meeting_title(tokens, updates, descriptions)
+        if tokens is None or not updates or any(token not in FILLER_WORDS and token != _PLACEHOLDER
+                                  for token in tokens):
+            return None
+
+        description = ", ".join(descriptions)
+        action = {
+            "action": "update",
+            "updates": updates,
+            "requires_confirmation": True,
+            "action_description": description
+        }
+        response = f"회의 정보를 다음과 같이 변경하겠습니다: {description}"
+        return action, response
+
+    def _extract_title(self, text: str, updates: Dict, descriptions: List[str]) -> str:
+        match = TITLE_PATTERN.search(text)
+        if not match:
+            return text
+        updates["title"] = match.group(1).strip()
+        descriptions.append(f"제목 '{updates['title']}'")
+        return self._cut(text, match)
+
+    def _extract_extension(self, text: str, meeting: Meeting, updates: Dict,
+                           descriptions: List[str]) -> str:
+        match = EXTEND_PATTERN.search(text)
+        if not match:
+            return text
+        hours, minutes, only_minutes, half = match.groups()
+        if half:
+            delta = timedelta(minutes=30)
+        elif only_minutes:
+            delta = timedelta(minutes=int(only_minutes))
+        else:
+            delta = timedelta(hours=int(hours), minutes=int(minutes or 0))
+
+        new_end = meeting.end_time + delta
+        updates["end_time"] = new_end.strftime("%Y-%m-%d %H:%M")
+        descriptions.append(f"종료 시간 {new_end.strftime('%H:%M')}로 연장")
+        return self._cut(text, match)
+
+    def _extract_date(self, text: str, now: datetime) -> Tuple[str, Optional[datetime]]:
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        for pattern, kind in DATE_PATTERNS:
+            match = pattern.search(text)
+            if not match:
+                continue
+
+            if kind == "relative":
+                target = today + timedelta(days=RELATIVE_DAYS[match.group(1)])
+            elif kind == "week_weekday":
+                week_offset = 0 if match.group(1).replace(" ", "") in ("이번주", "금주") else 7
+                monday = today - timedelta(days=today.weekday())
+                target = monday + timedelta(days=week_offset + WEEKDAYS[match.group(2)])
+            elif kind == "weekday":
+                days_ahead = (WEEKDAYS[match.group(1)] - today.weekday()) % 7
+                target = today + timedelta(days=days_ahead)
+            else:
+                month, day = int(match.group(1)), int(match.group(2))
+                try:
+                    target = today.replace(month=month, day=day)
+                except ValueError:
+                    return text, None
+                if target < today:
+                    target = target.replace(year=today.year + 1)
+
+            return self._cut(text, match), target
+        return text, None
+
+    def _extract_time(self, text: str, moving: bool = False) -> Tuple[Optional[str], Optional[Tuple]]:
+        """시각/시간 범위 추출
+
+        반환하는 범위는 (시작, 종료)이며 종료가 None이면 시작만 바꾸고, KEEP_DURATION이면
+        시작을 옮기고 기존 회의 길이를 유지합니다.
+        """
+        match = TIME_RANGE_PATTERN.search(text)
+        if match:
+            groups = match.groups()
+            start = self._to_time(*groups[:5])
+            end_meridiem = groups[5] or groups[0]
+            end = self._to_time(end_meridiem, *groups[6:10])
+            if start is None or end is None:
+                return None, None
+            if moving and "에서" in match.group(0):
+                # '2시에서 4시로 옮겨줘'는 범위가 아니라 4시로 이동
+                return self._cut(text, match), (end, KEEP_DURATION)
+            if end <= start:
+                # '10시부터 9시까지'처럼 종료가 시작보다 이르면 오전/오후를 추측하지 않음
+                return None, None
+            return self._cut(text, match), (start, end)
+
+        match = TIME_PATTERN.search(text)
+        if match:
+            start = self._to_time(*match.groups())
+            if start is None:
+                return None, None
+            return self._cut(text, match), (start, None)
+
+        return text, None
+
+    @staticmethod
+    def _to_time(meridiem: Optional[str], hour: str, minute: Optional[str],
+                 half: Optional[str], colon_minute: Optional[str]) -> Optional[Tuple[int, int]]:
+        hour = int(hour)
+        minute = int(minute or colon_minute or (30 if half else 0))
+        if hour > 24 or minute >= 60:
+            return None
+
+        if meridiem in ("저녁", "밤") and (hour == 12 or hour < 5):
+            # '밤 12시', '밤 2시'는 다음 날 새벽일 수 있어 LLM에 넘김
+            return None
+        if meridiem in ("오전", "아침") and hour > 12:
+            return None
+
+        if meridiem in ("오후", "저녁", "밤") and hour < 12:
+            hour += 12
+        elif meridiem in ("점심", "낮") and hour < 6:
+            hour += 12
+        elif meridiem is None and 1 <= hour <= 7:
+            # 오전/오후가 없으면 업무시간 기준으로 해석 (1~7시는 오후)
+            hour += 12
+        elif meridiem in ("오전", "아침") and hour == 12:
+            hour = 0
+        if hour >= 24:
+            return None
+        return hour, minute
+
+    @staticmethod
+    def _apply_schedule(meeting: Meeting, target_date: Optional[datetime], time_range: Optional[Tuple],
+                        updates: Dict, descriptions: List[str]) -> None:
+        if target_date is None and time_range is None:
+            return
+
+        base_date = target_date or meeting.start_time.replace(hour=0, minute=0, second=0, microsecond=0)
+        if time_range is None:
+            # 날짜만 바뀌면 시각과 회의 길이 유지
+            start = base_date.replace(hour=meeting.start_time.hour, minute=meeting.start_time.minute)
+            end = start + (meeting.end_time - meeting.start_time)
+        else:
+            (start_hour, start_minute), end_time = time_range
+            start = base_date.replace(hour=start_hour, minute=start_minute)
+            if end_time is KEEP_DURATION:
+                end = start + (meeting.end_time - meeting.start_time)
+            elif end_time:
+                end = base_date.replace(hour=end_time[0], minute=end_time[1])
+            else:
+                end = None
+
+        updates["start_time"] = start.strftime("%Y-%m-%d %H:%M")
+        if end is not None:
+            updates["end_time"] = end.strftime("%Y-%m-%d %H:%M")
+            descriptions.append(f"시간 {start.strftime('%m/%d %H:%M')}~{end.strftime('%H:%M')}")
+        else:
+            descriptions.append(f"시작 시간 {start.strftime('%m/%d %H:%M')}")
+
+    @staticmethod
+    def _extract_attendees(tokens: List[str], updates: Dict,
+                           descriptions: List[str]) -> Optional[List[str]]:
+        trigger_index = next(
+            (i for i, token in enumerate(tokens) if token.startswith(ATTENDEE_TRIGGERS)), None
+        )
+        if trigger_index is None:
+            return tokens
+
+        emp_api = get_employee_api()
+        names: List[str] = []
+        consumed = set()
+        for i in range(trigger_index - 1, -1, -1):
+            token = tokens[i]
+            if token == _PLACEHOLDER:
+                break
+            if token in FILLER_WORDS:
+                consumed.add(i)
+                continue
+            name = FastPathCommandParser._strip_name_suffix(token)
+            if not re.fullmatch(r"[가-힣]{2,4}", name):
+                break
+            if not any(emp.name == name for emp in emp_api.search_by_name(name)):
+                return None  # 모르는 이름은 LLM에 맡김
+            names.insert(0, name)
+            consumed.add(i)
+
+        if not names:
+            return None
+
+        updates["attendees"] = ", ".join(names)
+        descriptions.append(f"참석자 추가 {updates['attendees']}")
+        return [token for i, token in enumerate(tokens) if i not in consumed]
+
+    @staticmethod
+    def _extract_meeting_title(tokens: List[str], updates: Dict,
+                               descriptions: List[str]) -> Optional[List[str]]:
+        """'팀 미팅 잡아줘'처럼 회의 명사로 끝나는 구절을 제목으로 사용
+
+        구절에 '2시간' 같은 길이 표현이나 인식한 표현에 붙어 있던 나머지 조각이
+        섞이면 제목을 만들지 않고 None을 반환해 LLM에 맡깁니다.
+        """
+        if "title" in updates:
+            return tokens
+
+        phrase_start = None
+        for i, token in enumerate(tokens):
+            word = FastPathCommandParser._strip_title_particle(token)
+            if phrase_start is not None and word.endswith(MEETING_NOUNS) or (
+                    word.endswith(MEETING_NOUNS) and word not in MEETING_NOUNS):
+                start = i if phrase_start is None else phrase_start
+                # '프로젝트 리뷰 회의'처럼 회의 명사가 이어지면 함께 포함
+                end = i + 1
+                while (end < len(tokens) and
+                       FastPathCommandParser._strip_title_particle(tokens[end]).endswith(MEETING_NOUNS)):
+                    end += 1
+                words = tokens[start:end - 1] + [
+                    FastPathCommandParser._strip_title_particle(tokens[end - 1])
+                ]
+                if any(_PLACEHOLDER in word or DURATION_WORD_PATTERN.match(word)
+                       for word in words):
+                    return None
+                title = " ".join(words)
+                updates["title"] = title
+                descriptions.insert(0, f"제목 '{title}'")
+                return tokens[:start] + tokens[end:]
+
+            if token == _PLACEHOLDER or token in FILLER_WORDS:
+                phrase_start = None
+            elif phrase_start is None:
+                phrase_start = i
+        return tokens
+
+    @staticmethod
+    def _strip_title_particle(token: str) -> str:
+        return re.sub(r"(을|를|으로|로|은|는)$", "", token)
+
+    @staticmethod
+    def _strip_name_suffix(token: str) -> str:
+        for suffix in NAME_SUFFIXES:
+            if token.endswith(suffix) and len(token) - len(suffix) >= 2:
+                return token[:-len(suffix)]
+        return token
+
+    @staticmethod
+    def _cut(text: str, match: re.Match) -> str:
+        rest = text[match.end():]
+        # 단어 중간에서 잘린 나머지('2시간'의 '간' 등)는 표시에 붙여 단독 단어로 쓰이지 않게 함
+        glued = rest.split(maxsplit=1)[0] if rest[:1].strip() else ""
+        separator = "" if glued and glued not in FILLER_WORDS else " "
+        return f"{text[:match.start()]} {_PLACEHOLDER}{separator}{rest}"
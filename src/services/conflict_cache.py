@@ -0,0 +1,101 @@
+"""
+참석자 일정 충돌 결과 캐시
+"""
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import FrozenSet, Hashable, Iterable, Optional, Tuple
+
+from src.utils.config import CONFLICT_CACHE_MAX_ENTRIES
+
+ConflictKey = Tuple[Hashable, int, FrozenSet[str], datetime, datetime, Optional[str]]
+
+
+@dataclass(frozen=True)
+class ConflictState:
+    """회의별 마지막 충돌 계산 상태 (증분 재계산 기준점)"""
+    schedule_api: Hashable
+    version: int
+    start_time: datetime
+    end_time: datetime
+    attendee_ids: FrozenSet[str]
+    conflicting: FrozenSet[str]
+
+
+class ConflictCache:
+    """LRU 충돌 결과 캐시
+
+    키는 (일정 API, 저장소 버전, 참석자 ID 집합, 회의 시작/종료, 제외한 회의 ID)입니다. 일정이
+    생성/수정/삭제되면 저장소 버전이 올라가 이전 결과는 다시 조회되지 않으므로,
+    제목이나 내용 입력처럼 참석자/시간과 무관한 rerun은 충돌 조회를 건너뜁니다.
+    회의 ID별 마지막 계산 상태도 함께 보관해 참석자나 시간이 바뀐 경우의
+    증분 재계산에 씁니다.
+    """
+
+    def __init__(self, max_entries: int = CONFLICT_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[ConflictKey, FrozenSet[str]]" = OrderedDict()
+        self._states: "OrderedDict[str, ConflictState]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(schedule_api, employee_ids: Iterable[str], start_time: datetime,
+                 end_time: datetime, exclude_meeting_id: Optional[str] = None) -> ConflictKey:
+        """캐시 키 생성"""
+        return (schedule_api, schedule_api.version, frozenset(employee_ids), start_time, end_time,
+                exclude_meeting_id)
+
+    def get(self, key: ConflictKey) -> Optional[FrozenSet[str]]:
+        """충돌 참석자 ID 집합 조회"""
+        with self._lock:
+            conflicting = self._entries.get(key)
+            if conflicting is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return conflicting
+
+    def put(self, key: ConflictKey, conflicting: FrozenSet[str]) -> None:
+        """충돌 참석자 ID 집합 저장"""
+        with self._lock:
+            self._entries[key] = conflicting
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_state(self, meeting_id: str) -> Optional[ConflictState]:
+        """회의의 마지막 충돌 계산 상태 조회"""
+        with self._lock:
+            return self._states.get(meeting_id)
+
+    def put_state(self, meeting_id: str, state: ConflictState) -> None:
+        """회의의 충돌 계산 상태 저장"""
+        with self._lock:
+            self._states[meeting_id] = state
+            self._states.move_to_end(meeting_id)
+            while len(self._states) > self.max_entries:
+                self._states.popitem(last=False)
+
+    def clear(self) -> None:
+        """캐시 및 통계 초기화"""
+        with self._lock:
+            self._entries.clear()
+            self._states.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# 싱글톤 인스턴스
+_conflict_cache_instance = None
+
+
+def get_conflict_cache() -> ConflictCache:
+    """충돌 결과 캐시 인스턴스 반환"""
+    global _conflict_cache_instance
+    if _conflict_cache_instance is None:
+        _conflict_cache_instance = ConflictCache()
+    return _conflict_cache_instance
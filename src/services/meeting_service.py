@@ -1,13 +1,17 @@
 """
 회의 관리 서비스
 """
-from datetime import datetime
-from typing import Tuple
+from datetime import datetime, timedelta
+from typing import FrozenSet, List, Optional, Tuple
 
 from src.utils.config import DEFAULT_MEETING_DURATION
 from src.models.meeting import Meeting, AttendeeRole
 from src.models.chat import LLMResponse
+from src.models.employee import BookingResult, NameResolution
 from src.api.schedule_api import get_schedule_api
+from src.services.attendee_service import AttendeeService
+from src.services.conflict_cache import ConflictState, get_conflict_cache
+from src.utils.profiler import profiled
 
 
 class MeetingService:
@@ -51,8 +55,13 @@ class MeetingService:
         return new_meeting
 
     @staticmethod
+    @profiled()
     def update_meeting_from_llm_response(meeting: Meeting, llm_response: LLMResponse) -> Meeting:
-        """LLM 응답으로 회의 업데이트"""
+        """LLM 응답으로 회의 업데이트
+
+        참석자 이름 보정 결과는 llm_response.name_resolution에 담아, 후보가 여럿이거나
+        찾지 못한 이름을 호출 측이 사용자에게 되물을 수 있게 합니다.
+        """
         if not llm_response.is_update():
             return meeting
 
@@ -91,34 +100,21 @@ class MeetingService:
 
         # 참석자 업데이트
         if 'attendees' in updates:
-            MeetingService._update_attendees(updated_meeting, updates['attendees'])
+            llm_response.name_resolution = MeetingService._update_attendees(
+                updated_meeting, updates['attendees']
+            )
 
         return updated_meeting
 
     @staticmethod
-    def _update_attendees(meeting: Meeting, attendees_data):
-        """참석자 정보 업데이트"""
+    def _update_attendees(meeting: Meeting, attendees_data) -> Optional[NameResolution]:
+        """참석자 정보 업데이트 (후보가 하나로 정해진 이름만 추가)"""
         if isinstance(attendees_data, str):
-            # 문자열인 경우 이름으로 검색해서 추가
-            from src.api.employee_api import get_employee_api
-            from src.models.meeting import Attendee
-
-            emp_api = get_employee_api()
-            names = [name.strip() for name in attendees_data.split(',')]
-
-            for name in names:
-                employees = emp_api.search_by_name(name)
-                if employees:
-                    emp = employees[0]  # 첫 번째 결과 사용
-                    # 이미 있는지 확인
-                    if not any(att.employee_id == emp.id for att in meeting.attendees):
-                        attendee = Attendee(
-                            employee_id=emp.id,
-                            name=emp.name,
-                            team=emp.team,
-                            role=AttendeeRole.REQUIRED
-                        )
-                        meeting.attendees.append(attendee)
+            # 문자열인 경우 이름 목록을 한 번에 보정해서 추가
+            return AttendeeService.add_attendees_by_names(
+                meeting, attendees_data.split(','), AttendeeRole.REQUIRED
+            )
+        return None
 
     @staticmethod
     def validate_meeting(meeting: Meeting) -> Tuple[bool, str]:
@@ -133,50 +129,174 @@ class MeetingService:
             return False, "최소 한 명의 참석자를 추가해주세요."
 
         # 주관자 확인
-        organizers = [att for att in meeting.attendees if att.role == AttendeeRole.ORGANIZER]
-        if not organizers:
+        if not meeting.attendees.count_role(AttendeeRole.ORGANIZER):
             return False, "주관자를 지정해주세요."
 
         return True, "유효한 회의입니다."
 
     @staticmethod
+    @profiled()
     def check_attendee_conflicts(meeting: Meeting) -> None:
-        """참석자 일정 충돌 확인"""
+        """참석자 일정 충돌 확인
+
+        참석자/시간/저장소 버전이 같으면 캐시를 쓰고, 같은 회의의 직전 계산 이후
+        참석자나 시간만 바뀌었으면 바뀐 부분만 조회합니다. 저장된 회의를 불러와 수정할 때
+        자기 자신과 충돌하지 않도록 이 회의에 연결된 일정은 충돌에서 제외합니다.
+        """
         schedule_api = get_schedule_api()
-        employee_ids = [att.employee_id for att in meeting.attendees]
+        employee_ids = meeting.attendees.employee_ids()
 
-        conflicts = schedule_api.check_conflicts(
-            employee_ids,
-            meeting.start_time,
-            meeting.end_time
-        )
+        cache = get_conflict_cache()
+        version = schedule_api.version
+        key = cache.make_key(schedule_api, employee_ids, meeting.start_time, meeting.end_time,
+                             meeting.meeting_id)
+        conflicting = cache.get(key)
+        if conflicting is None:
+            previous = cache.get_state(meeting.meeting_id)
+            if (previous is not None and previous.schedule_api is schedule_api
+                    and previous.version == version):
+                conflicting = MeetingService._recompute_conflicts(
+                    schedule_api, previous, employee_ids, meeting.start_time, meeting.end_time,
+                    meeting.meeting_id
+                )
+            else:
+                conflicting = frozenset(schedule_api.check_conflicts(
+                    employee_ids,
+                    meeting.start_time,
+                    meeting.end_time,
+                    exclude_meeting_id=meeting.meeting_id
+                ))
+            cache.put(key, conflicting)
+
+        cache.put_state(meeting.meeting_id, ConflictState(
+            schedule_api=schedule_api,
+            version=version,
+            start_time=meeting.start_time,
+            end_time=meeting.end_time,
+            attendee_ids=frozenset(employee_ids),
+            conflicting=conflicting
+        ))
 
         # 충돌 정보 업데이트
         for attendee in meeting.attendees:
-            attendee.has_conflict = attendee.employee_id in conflicts
+            attendee.has_conflict = attendee.employee_id in conflicting
 
     @staticmethod
-    def save_meeting_to_api(meeting: Meeting) -> bool:
-        """회의를 API에 저장"""
+    def _recompute_conflicts(schedule_api, previous: ConflictState, employee_ids: List[str],
+                             start_time: datetime, end_time: datetime,
+                             meeting_id: str) -> FrozenSet[str]:
+        """직전 계산 결과에서 바뀐 참석자/시간 구간만 다시 조회"""
+        added_ids = [emp_id for emp_id in employee_ids if emp_id not in previous.attendee_ids]
+        kept_ids = [emp_id for emp_id in employee_ids if emp_id in previous.attendee_ids]
+
+        conflicting = set()
+        if added_ids:
+            conflicting.update(schedule_api.check_conflicts(added_ids, start_time, end_time,
+                                                            exclude_meeting_id=meeting_id))
+
+        was_conflicting = [emp_id for emp_id in kept_ids if emp_id in previous.conflicting]
+        if start_time <= previous.start_time and end_time >= previous.end_time:
+            # 시간이 같거나 늘어난 경우 기존 충돌은 그대로 유지
+            conflicting.update(was_conflicting)
+            if (start_time, end_time) == (previous.start_time, previous.end_time):
+                return frozenset(conflicting)
+        elif was_conflicting:
+            # 줄거나 옮겨진 경우 기존에 충돌이 있던 참석자는 새 시간 전체를 다시 확인
+            conflicting.update(schedule_api.check_conflicts(was_conflicting, start_time, end_time,
+                                                            exclude_meeting_id=meeting_id))
+
+        # 충돌이 없던 참석자는 이전 시간과 겹치지 않는 새 구간만 확인하면 됨
+        was_free = [emp_id for emp_id in kept_ids if emp_id not in previous.conflicting]
+        for delta_start, delta_end in _window_difference(
+                start_time, end_time, previous.start_time, previous.end_time):
+            if not was_free:
+                break
+            found = schedule_api.check_conflicts(was_free, delta_start, delta_end,
+                                                 exclude_meeting_id=meeting_id)
+            conflicting.update(found)
+            was_free = [emp_id for emp_id in was_free if emp_id not in found]
+
+        return frozenset(conflicting)
+
+    @staticmethod
+    @profiled()
+    def find_available_slots(meeting: Meeting, days: int = 14, top_k: int = 5) -> List[dict]:
+        """참석자 역할을 반영해 향후 기간 내 회의 가능 시간 탐색"""
+        schedule_api = get_schedule_api()
+        duration_minutes = int((meeting.end_time - meeting.start_time).total_seconds() / 60)
+        search_start = datetime.now()
+
+        return schedule_api.find_available_slots(
+            attendee_ids=[att.employee_id for att in meeting.attendees],
+            duration_minutes=duration_minutes,
+            start_date=search_start,
+            end_date=search_start + timedelta(days=days),
+            attendee_roles={att.employee_id: att.role for att in meeting.attendees},
+            preferred_time=meeting.start_time,
+            top_k=top_k,
+            exclude_meeting_id=meeting.meeting_id
+        )
+
+    @staticmethod
+    @profiled()
+    def save_meeting_to_api(meeting: Meeting) -> BookingResult:
+        """회의를 API에 저장
+
+        신규 회의는 참석자 전원의 빈 시간 확인과 일정 생성을 한 번에 처리하는 book_meeting으로
+        저장하므로, 저장 직전에 다른 사용자가 같은 참석자를 예약해도 이중 예약되지 않습니다.
+        충돌이 있으면 해당 참석자의 충돌 표시를 갱신합니다. 생성한 일정은 meeting_id로 회의에
+        연결되고, 수정 모드에서는 연결된 일정과의 차이(참석자 추가/제외, 제목/시간/내용)만 반영하며
+        충돌 확인에서 회의 자신의 일정은 제외합니다.
+        """
+        schedule_api = get_schedule_api()
         try:
-            schedule_api = get_schedule_api()
-            attendee_ids = [att.employee_id for att in meeting.attendees]
+            attendee_ids = meeting.attendees.employee_ids()
 
             if meeting.is_edit_mode:
-                # 수정 모드: 기존 일정 업데이트
-                print(f"[MOCK API] 회의 수정: {meeting.title}")
+                # 수정 모드: 연결된 참석자 일정을 변경분만 갱신
+                result = schedule_api.update_meeting_schedules(
+                    meeting_id=meeting.meeting_id,
+                    attendee_ids=attendee_ids,
+                    title=meeting.title,
+                    start_datetime=meeting.start_time,
+                    end_datetime=meeting.end_time,
+                    content=meeting.content
+                )
+                if result.success:
+                    changes = result.changes
+                    print(f"{schedule_api.LOG_PREFIX} 회의 수정 완료: 생성 {len(changes.created)}개, "
+                          f"삭제 {len(changes.deleted)}개, 수정 {len(changes.updated)}개")
             else:
                 # 신규 생성
-                schedule_ids = schedule_api.create_meeting_schedules(
+                result = schedule_api.book_meeting(
                     attendee_ids=attendee_ids,
                     title=meeting.title,
                     start_datetime=meeting.start_time,
                     end_datetime=meeting.end_time,
-                    content=meeting.content
+                    content=meeting.content,
+                    meeting_id=meeting.meeting_id
                 )
-                print(f"[MOCK API] 회의 생성 완료: {len(schedule_ids)}개 일정 생성")
+                if result.success:
+                    print(f"{schedule_api.LOG_PREFIX} 회의 생성 완료: {len(result.schedule_ids)}개 일정 생성")
 
-            return True
+            if not result.success:
+                for attendee in meeting.attendees:
+                    attendee.has_conflict = attendee.employee_id in result.conflicts
+            return result
         except Exception as e:
-            print(f"[MOCK API] 저장 실패: {str(e)}")
-            return False
\ No newline at end of file
+            print(f"{schedule_api.LOG_PREFIX} 저장 실패: {str(e)}")
+            return BookingResult(error=str(e))
+
+
+def _window_difference(start_time: datetime, end_time: datetime,
+                       previous_start: datetime, previous_end: datetime) -> List[Tuple[datetime, datetime]]:
+    """새 시간 구간 중 이전 구간과 겹치지 않는 부분"""
+    if start_time >= previous_end or end_time <= previous_start:
+        return [(start_time, end_time)]
+
+    parts = []
+    if start_time < previous_start:
+        parts.append((start_time, previous_start))
+    if end_time > previous_end:
+        parts.append((previous_end, end_time))
+    return parts
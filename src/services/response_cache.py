@@ -0,0 +1,102 @@
+"""
+AI 응답 캐시
+"""
+import copy
+import hashlib
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.utils.config import AI_CACHE_MAX_ENTRIES, AI_CACHE_TTL_SECONDS
+
+CachedResponse = Tuple[Optional[Dict[str, Any]], str]
+
+
+def normalize_prompt(prompt: str) -> str:
+    """캐시 키용 프롬프트 정규화 (유니코드 NFC, 공백 축약, 소문자, 끝 문장부호 제거)"""
+    text = unicodedata.normalize("NFC", prompt)
+    text = re.sub(r"\s+", " ", text).strip().lower()
+    return text.rstrip(" .!?~")
+
+
+class ResponseCache:
+    """LRU + TTL AI 응답 캐시
+
+    키는 정규화된 프롬프트, 회의 컨텍스트, 분 단위 현재 시각을 합쳐 만든 해시입니다.
+    현재 시각이 키에 포함되므로 "내일" 같은 상대 시간 표현도 안전하게 재사용됩니다.
+    세션 간에 공유되므로 ACTION dict는 저장할 때와 꺼낼 때 모두 복사합니다.
+    """
+
+    def __init__(self, max_entries: int = AI_CACHE_MAX_ENTRIES,
+                 ttl_seconds: float = AI_CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, CachedResponse]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(prompt: str, meeting_context: str, current_time: str) -> str:
+        """캐시 키 생성"""
+        raw = "\x1f".join([normalize_prompt(prompt), meeting_context, current_time])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """캐시 조회 (만료 항목은 제거)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] > self.ttl_seconds:
+                del self._entries[key]
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            action_data, response_text = entry[1]
+        return copy.deepcopy(action_data), response_text
+
+    def put(self, key: str, action_data: Optional[Dict[str, Any]], response_text: str) -> None:
+        """응답 저장"""
+        action_data = copy.deepcopy(action_data)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), (action_data, response_text))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """캐시 및 통계 초기화"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """적중/실패 통계"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "hit_rate": self.hits / total if total else 0.0
+            }
+
+
+# 세션 간 공유 인스턴스
+_response_cache_instance = None
+
+
+def get_response_cache() -> ResponseCache:
+    """AI 응답 캐시 인스턴스 반환"""
+    global _response_cache_instance
+    if _response_cache_instance is None:
+        _response_cache_instance = ResponseCache()
+    return _response_cache_instance
@@ -0,0 +1,152 @@
+"""
+LLM 스트리밍 응답 파서 (ACTION / RESPONSE 분리)
+"""
+import json
+from typing import List, Optional
+
+from src.models.chat import StreamEvent
+
+ACTION_MARKER = "ACTION:"
+RESPONSE_MARKER = "RESPONSE:"
+
+
+class ActionResponseStreamParser:
+    """청크 단위로 들어오는 응답을 ACTION JSON과 RESPONSE 텍스트로 분리
+
+    ACTION JSON은 닫는 중괄호가 도착하는 즉시 action 이벤트로, RESPONSE 이후의
+    텍스트는 도착하는 대로 text 이벤트로 내보냅니다. 응답이 ACTION:으로 시작하지
+    않으면 전체를 일반 텍스트로 취급합니다.
+    """
+
+    _PREFIX = "prefix"
+    _ACTION = "action"
+    _AFTER_ACTION = "after_action"
+    _RESPONSE = "response"
+    _PLAIN = "plain"
+
+    def __init__(self):
+        self._state = self._PREFIX
+        self._buffer = ""
+        self._raw = ""
+        # ACTION JSON 스캔 상태
+        self._scan_pos = 0
+        self._json_start: Optional[int] = None
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._action_emitted = False
+        self._response_started = False
+
+    def feed(self, chunk: str) -> List[StreamEvent]:
+        """청크 입력 후 새로 확정된 이벤트 반환"""
+        if not chunk:
+            return []
+        self._raw += chunk
+        self._buffer += chunk
+        return self._drain()
+
+    def close(self) -> List[StreamEvent]:
+        """스트림 종료 시 남은 내용 처리"""
+        if self._state in (self._PREFIX, self._PLAIN):
+            return self._text(self._buffer)
+        if self._state != self._RESPONSE and not self._action_emitted:
+            # 형식을 벗어난 응답은 원문 전체를 텍스트로 표시
+            return self._text(self._raw)
+        return []
+
+    def _drain(self) -> List[StreamEvent]:
+        events: List[StreamEvent] = []
+        while True:
+            if self._state == self._PREFIX:
+                stripped = self._buffer.lstrip()
+                if stripped.startswith(ACTION_MARKER):
+                    self._buffer = stripped[len(ACTION_MARKER):]
+                    self._state = self._ACTION
+                    continue
+                if ACTION_MARKER.startswith(stripped):
+                    return events  # 판단하기에 아직 짧음
+                self._state = self._PLAIN
+                continue
+
+            if self._state == self._PLAIN:
+                events.extend(self._text(self._buffer))
+                self._buffer = ""
+                return events
+
+            if self._state == self._ACTION:
+                if not self._scan_action_json(events):
+                    return events
+                continue
+
+            if self._state == self._AFTER_ACTION:
+                marker_pos = self._buffer.find(RESPONSE_MARKER)
+                if marker_pos < 0:
+                    return events
+                self._buffer = self._buffer[marker_pos + len(RESPONSE_MARKER):]
+                self._state = self._RESPONSE
+                continue
+
+            # RESPONSE: 앞쪽 공백만 제거하고 그대로 전달
+            if not self._response_started:
+                self._buffer = self._buffer.lstrip()
+                if not self._buffer:
+                    return events
+                self._response_started = True
+            events.extend(self._text(self._buffer))
+            self._buffer = ""
+            return events
+
+    def _scan_action_json(self, events: List[StreamEvent]) -> bool:
+        """ACTION 영역에서 JSON 객체 끝을 찾으면 True"""
+        buffer = self._buffer
+        while self._scan_pos < len(buffer):
+            char = buffer[self._scan_pos]
+
+            if self._json_start is None:
+                remaining = buffer[self._scan_pos:]
+                if len(remaining) < len(RESPONSE_MARKER) and RESPONSE_MARKER.startswith(remaining):
+                    return False  # 마커가 청크 경계에 걸림
+                if remaining.startswith(RESPONSE_MARKER):
+                    # JSON 없이 RESPONSE가 시작됨
+                    self._buffer = buffer[self._scan_pos:]
+                    self._scan_pos = 0
+                    self._state = self._AFTER_ACTION
+                    return True
+                if char == "{":
+                    self._json_start = self._scan_pos
+                    self._depth = 1
+            elif self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._emit_action(buffer[self._json_start:self._scan_pos + 1], events)
+                    self._buffer = buffer[self._scan_pos + 1:]
+                    self._scan_pos = 0
+                    self._state = self._AFTER_ACTION
+                    return True
+
+            self._scan_pos += 1
+        return False
+
+    def _emit_action(self, json_text: str, events: List[StreamEvent]) -> None:
+        try:
+            action = json.loads(json_text)
+        except json.JSONDecodeError:
+            return
+        if isinstance(action, dict):
+            self._action_emitted = True
+            events.append(StreamEvent(kind="action", action=action))
+
+    @staticmethod
+    def _text(text: str) -> List[StreamEvent]:
+        return [StreamEvent(kind="text", text=text)] if text else []
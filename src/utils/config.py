@@ -8,6 +8,25 @@ from datetime import timedelta
 GOOGLE_API_KEY = os.getenv('GOOGLE_API_KEY')
 GEMINI_MODEL_NAME = 'gemini-2.0-flash-001'
 
+# AI 응답 캐시 설정
+AI_CACHE_MAX_ENTRIES = 256
+AI_CACHE_TTL_SECONDS = 300
+
+# 참석자 충돌 결과 캐시 설정
+CONFLICT_CACHE_MAX_ENTRIES = 128
+
+# 렌더 프로파일러 설정 (MEETING_PROFILER=1 이면 디버그 패널과 JSONL 로그 활성화)
+PROFILER_ENABLED = os.getenv('MEETING_PROFILER', '0') == '1'
+PROFILER_LOG_PATH = os.getenv('PROFILER_LOG_PATH', 'logs/render_profile.jsonl')
+PROFILER_TRACE_ALLOCATIONS = os.getenv('PROFILER_TRACE_ALLOCATIONS', '1') == '1'
+PROFILER_HISTORY = 20
+
+# 일정 저장소 설정 ("memory": Mock API, "sqlite": SQLite 영구 저장소)
+SCHEDULE_BACKEND = os.getenv('SCHEDULE_BACKEND', 'memory')
+SCHEDULE_DB_PATH = os.getenv('SCHEDULE_DB_PATH', 'data/schedules.db')
+# Mock 일정 저장소 잠금 샤드 수 (임직원 ID 해시로 분산)
+SCHEDULE_LOCK_SHARDS = 64
+
 # 시간 설정
 TIME_STEP = timedelta(minutes=30)
 DEFAULT_MEETING_DURATION = timedelta(hours=1)
@@ -42,6 +61,13 @@ ROLE_COLORS = {
     "선택": "#95a5a6"
 }
 
+# 대체 시간 탐색 시 참석자 역할별 충돌 가중치
+ROLE_CONFLICT_WEIGHTS = {
+    "주관자": 3.0,
+    "필수": 2.0,
+    "선택": 0.5
+}
+
 # 충돌 상태별 아이콘
 CONFLICT_ICONS = {
     True: "⚠️",
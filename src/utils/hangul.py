@@ -0,0 +1,54 @@
+"""
+한글 자모 분해 유틸리티
+"""
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+
+CHOSUNG = ["ㄱ", "ㄲ", "ㄴ", "ㄷ", "ㄸ", "ㄹ", "ㅁ", "ㅂ", "ㅃ", "ㅅ",
+           "ㅆ", "ㅇ", "ㅈ", "ㅉ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+JUNGSUNG = ["ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅗㅏ", "ㅗㅐ",
+            "ㅗㅣ", "ㅛ", "ㅜ", "ㅜㅓ", "ㅜㅔ", "ㅜㅣ", "ㅠ", "ㅡ", "ㅡㅣ", "ㅣ"]
+JONGSUNG = ["", "ㄱ", "ㄲ", "ㄱㅅ", "ㄴ", "ㄴㅈ", "ㄴㅎ", "ㄷ", "ㄹ", "ㄹㄱ",
+            "ㄹㅁ", "ㄹㅂ", "ㄹㅅ", "ㄹㅌ", "ㄹㅍ", "ㄹㅎ", "ㅁ", "ㅂ", "ㅂㅅ", "ㅅ",
+            "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+
+# 입력 중 조합된 겹자음/겹모음 호환 자모를 기본 자모로 분해
+COMPOUND_JAMO = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ", "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ"
+}
+
+_CHOSUNG_SET = set(CHOSUNG)
+
+
+def is_hangul_syllable(char: str) -> bool:
+    """완성형 한글 음절 여부"""
+    return HANGUL_BASE <= ord(char) <= HANGUL_LAST
+
+
+def decompose(text: str) -> str:
+    """한글 음절을 기본 자모열로 분해 ('김철수' -> 'ㄱㅣㅁㅊㅓㄹㅅㅜ')"""
+    result = []
+    for char in text:
+        if is_hangul_syllable(char):
+            offset = ord(char) - HANGUL_BASE
+            result.append(CHOSUNG[offset // 588])
+            result.append(JUNGSUNG[(offset % 588) // 28])
+            result.append(JONGSUNG[offset % 28])
+        else:
+            result.append(COMPOUND_JAMO.get(char, char))
+    return "".join(result)
+
+
+def chosung(text: str) -> str:
+    """초성열 추출 ('김철수' -> 'ㄱㅊㅅ')"""
+    return "".join(
+        CHOSUNG[(ord(char) - HANGUL_BASE) // 588] if is_hangul_syllable(char) else char
+        for char in text
+    )
+
+
+def is_chosung_query(text: str) -> bool:
+    """초성으로만 이루어진 입력 여부 ('ㄱㅊㅅ')"""
+    return bool(text) and all(char in _CHOSUNG_SET for char in text)
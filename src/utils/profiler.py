@@ -0,0 +1,253 @@
+"""
+렌더 프로파일러
+
+컴포넌트 render와 서비스 호출의 실행 시간, 호출 수, 메모리 할당량을
+재실행(rerun) 단위와 세션 단위로 집계합니다.
+"""
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+import tracemalloc
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Deque, Dict, Iterator, Optional
+
+from src.utils.config import (
+    PROFILER_ENABLED, PROFILER_LOG_PATH, PROFILER_TRACE_ALLOCATIONS, PROFILER_HISTORY
+)
+
+LOG_PREFIX = "[PROFILER]"
+
+# 스크립트 스레드별 활성 프로파일러 (Streamlit은 세션마다 별도 스레드에서 스크립트 실행)
+_active = threading.local()
+_log_lock = threading.Lock()
+
+
+def _traced_bytes() -> int:
+    """현재 추적 중인 할당 바이트 (tracemalloc 비활성 시 0)"""
+    if not tracemalloc.is_tracing():
+        return 0
+    return tracemalloc.get_traced_memory()[0]
+
+
+@dataclass
+class SpanStats:
+    """구간별 누적 통계"""
+    calls: int = 0
+    wall_ms: float = 0.0
+    alloc_kib: float = 0.0
+
+    def add(self, wall_ms: float, alloc_kib: float, calls: int = 1) -> None:
+        self.calls += calls
+        self.wall_ms += wall_ms
+        self.alloc_kib += alloc_kib
+
+    def to_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "wall_ms": round(self.wall_ms, 3),
+            "alloc_kib": round(self.alloc_kib, 1)
+        }
+
+
+@dataclass
+class RerunProfile:
+    """재실행 1회의 측정 결과"""
+    index: int
+    kind: str
+    started_at: datetime
+    wall_ms: float = 0.0
+    peak_kib: float = 0.0
+    spans: Dict[str, SpanStats] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return {
+            "rerun": self.index,
+            "kind": self.kind,
+            "started_at": self.started_at.isoformat(timespec="milliseconds"),
+            "wall_ms": round(self.wall_ms, 3),
+            "peak_kib": round(self.peak_kib, 1),
+            "spans": {name: stats.to_dict() for name, stats in self.spans.items()}
+        }
+
+
+class RenderProfiler:
+    """세션별 렌더 프로파일러
+
+    rerun() 블록 안에서 실행되는 profile()/profiled() 구간만 기록합니다.
+    구간 시간은 하위 구간을 포함한 값이고, 할당량은 구간 종료 시점에 남아 있는
+    순 할당량입니다. tracemalloc은 프로세스 전역이므로 여러 세션이 동시에
+    실행되면 할당량은 근사치입니다.
+    """
+
+    def __init__(self, enabled: bool = PROFILER_ENABLED,
+                 log_path: Optional[str] = PROFILER_LOG_PATH,
+                 trace_allocations: bool = PROFILER_TRACE_ALLOCATIONS,
+                 history: int = PROFILER_HISTORY):
+        self.enabled = enabled
+        self.log_path = log_path or None
+        self.session_id = uuid.uuid4().hex[:12]
+        self.rerun_count = 0
+        self.reruns: Deque[RerunProfile] = deque(maxlen=history)
+        self.session_totals: Dict[str, SpanStats] = {}
+        self._current: Optional[RerunProfile] = None
+
+        if enabled and trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @property
+    def last_rerun(self) -> Optional[RerunProfile]:
+        return self.reruns[-1] if self.reruns else None
+
+    @contextmanager
+    def rerun(self, kind: str = "app") -> Iterator[None]:
+        """재실행 1회 측정 (이미 측정 중이면 하위 구간으로 기록)
+
+        프래그먼트 단독 재실행은 전체 스크립트를 거치지 않으므로, 프래그먼트 본문도
+        rerun()으로 감싸 두면 단독 실행 시에는 별도 재실행으로, 전체 실행 중에는
+        하위 구간으로 기록됩니다.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        if self._current is not None:
+            with self.span(kind):
+                yield
+            return
+
+        self.rerun_count += 1
+        profile = RerunProfile(self.rerun_count, kind, datetime.now())
+        previous = getattr(_active, "profiler", None)
+        _active.profiler = self
+        self._current = profile
+
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+        start_bytes = _traced_bytes()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            # st.rerun()/st.stop()도 예외로 빠져나오므로 finally에서 기록
+            profile.wall_ms = (time.perf_counter() - start) * 1000
+            if tracing:
+                profile.peak_kib = max(0, tracemalloc.get_traced_memory()[1] - start_bytes) / 1024
+            self._current = None
+            _active.profiler = previous
+            self.reruns.append(profile)
+            self._write_log(profile)
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """구간 측정"""
+        start_bytes = _traced_bytes()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000,
+                        (_traced_bytes() - start_bytes) / 1024)
+
+    def record(self, name: str, wall_ms: float, alloc_kib: float, calls: int = 1) -> None:
+        """측정값을 현재 재실행과 세션 누적에 반영"""
+        if self._current is not None:
+            self._current.spans.setdefault(name, SpanStats()).add(wall_ms, alloc_kib, calls)
+        self.session_totals.setdefault(name, SpanStats()).add(wall_ms, alloc_kib, calls)
+
+    def reset(self) -> None:
+        """세션 누적 통계 초기화"""
+        self.rerun_count = 0
+        self.reruns.clear()
+        self.session_totals.clear()
+
+    def _write_log(self, profile: RerunProfile) -> None:
+        """JSONL 로그에 재실행 1회를 한 줄로 추가"""
+        if not self.log_path:
+            return
+
+        record = {"session": self.session_id, **profile.to_dict()}
+        try:
+            directory = os.path.dirname(self.log_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            line = json.dumps(record, ensure_ascii=False)
+            with _log_lock, open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        except OSError as e:
+            print(f"{LOG_PREFIX} 로그 기록 실패, 파일 로그를 끕니다: {e}")
+            self.log_path = None
+
+
+def get_active_profiler() -> Optional[RenderProfiler]:
+    """현재 스레드에서 측정 중인 프로파일러 반환"""
+    return getattr(_active, "profiler", None)
+
+
+@contextmanager
+def profile(name: str) -> Iterator[None]:
+    """측정 중인 재실행이 있으면 구간을 기록하는 컨텍스트 매니저"""
+    profiler = get_active_profiler()
+    if profiler is None:
+        yield
+        return
+    with profiler.span(name):
+        yield
+
+
+def profiled(name: Optional[str] = None) -> Callable:
+    """함수/메서드 호출을 구간으로 기록하는 데코레이터 (기본 이름은 __qualname__)
+
+    제너레이터 함수는 호출 1회로 세고, 소비하는 쪽 코드 시간은 빼고
+    제너레이터 내부에서 실행된 시간만 합산합니다.
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        if inspect.isgeneratorfunction(func):
+            @functools.wraps(func)
+            def gen_wrapper(*args, **kwargs):
+                profiler = get_active_profiler()
+                if profiler is None:
+                    return (yield from func(*args, **kwargs))
+
+                wall_ms = 0.0
+                alloc_kib = 0.0
+                gen = func(*args, **kwargs)
+                value = None
+                try:
+                    while True:
+                        start_bytes = _traced_bytes()
+                        start = time.perf_counter()
+                        try:
+                            item = gen.send(value)
+                        except StopIteration as stop:
+                            return stop.value
+                        finally:
+                            wall_ms += (time.perf_counter() - start) * 1000
+                            alloc_kib += (_traced_bytes() - start_bytes) / 1024
+                        value = yield item
+                finally:
+                    gen.close()
+                    profiler.record(span_name, wall_ms, alloc_kib)
+
+            return gen_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = get_active_profiler()
+            if profiler is None:
+                return func(*args, **kwargs)
+            with profiler.span(span_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -3,11 +3,24 @@
 """
 import streamlit as st
 from datetime import datetime
+from streamlit.errors import StreamlitAPIException
 
 from src.models.meeting import Meeting, MeetingStorage, AttendeeRole, Attendee
 from src.models.chat import ChatMessage, ChatStorage
 from src.services.meeting_service import MeetingService
 from src.services.ai_service import AIService
+from src.utils.profiler import RenderProfiler
+
+
+def rerun_fragment():
+    """현재 프래그먼트만 다시 실행 (전체 실행 중 호출되면 전체 재실행)
+
+    프래그먼트 본문이 전체 재실행의 일부로 실행될 때는 scope="fragment"를 쓸 수 없습니다.
+    """
+    try:
+        st.rerun(scope="fragment")
+    except StreamlitAPIException:
+        st.rerun()
 
 
 class SessionManager:
@@ -35,6 +48,10 @@ class SessionManager:
         if 'ai_service' not in st.session_state:
             st.session_state.ai_service = AIService()
 
+        # 렌더 프로파일러 초기화
+        if 'profiler' not in st.session_state:
+            st.session_state.profiler = RenderProfiler()
+
         # 하이라이트된 필드 초기화
         if 'highlighted_fields' not in st.session_state:
             st.session_state.highlighted_fields = {}
@@ -108,6 +125,10 @@ class SessionManager:
         """AI 서비스 반환"""
         return st.session_state.ai_service
 
+    def get_profiler(self) -> RenderProfiler:
+        """렌더 프로파일러 반환"""
+        return st.session_state.profiler
+
     def reset_current_meeting(self):
         """현재 회의 초기화"""
         st.session_state.current_meeting = MeetingService.create_default_meeting()
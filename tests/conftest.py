@@ -0,0 +1,18 @@
+"""
+공통 테스트 픽스처
+"""
+import pytest
+
+from src.api.schedule_api import MockScheduleAPI
+from src.api.sqlite_schedule_api import SQLiteScheduleAPI
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def schedule_api(request, tmp_path):
+    """빈 일정 저장소 (메모리/SQLite 파일 백엔드 각각)"""
+    if request.param == "sqlite":
+        api = SQLiteScheduleAPI(str(tmp_path / "schedules.db"), generate_sample_data=False)
+        yield api
+        api.close()
+    else:
+        yield MockScheduleAPI(generate_sample_data=False)
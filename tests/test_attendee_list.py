@@ -0,0 +1,91 @@
+"""
+참석자 목록 색인 테스트
+"""
+import copy
+import random
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.models.meeting import Attendee, AttendeeList, AttendeeRole, Meeting
+
+
+def _attendee(employee_id: str, role: AttendeeRole) -> Attendee:
+    return Attendee(employee_id=employee_id, name=employee_id, team="개발팀", role=role)
+
+
+def test_by_role_follows_list_order_after_role_changes():
+    attendees = AttendeeList([
+        _attendee("a", AttendeeRole.REQUIRED),
+        _attendee("b", AttendeeRole.ORGANIZER),
+        _attendee("c", AttendeeRole.REQUIRED),
+        _attendee("d", AttendeeRole.ORGANIZER),
+    ])
+
+    attendees.set_role("c", AttendeeRole.ORGANIZER)
+    attendees.set_role("a", AttendeeRole.ORGANIZER)
+
+    assert [a.employee_id for a in attendees.by_role(AttendeeRole.ORGANIZER)] == ["a", "b", "c", "d"]
+    assert [a.employee_id for a in attendees.by_role(AttendeeRole.REQUIRED)] == []
+
+
+def test_get_organizer_returns_first_organizer_in_list():
+    start = datetime(2030, 1, 8, 10)
+    meeting = Meeting(title="회의", start_time=start, end_time=start + timedelta(hours=1), content="",
+                      attendees=[_attendee("a", AttendeeRole.REQUIRED), _attendee("b", AttendeeRole.ORGANIZER)])
+
+    meeting.attendees.set_role("a", AttendeeRole.ORGANIZER)
+
+    assert meeting.get_organizer().employee_id == "a"
+
+
+def test_reappended_attendee_goes_to_the_end():
+    attendees = AttendeeList([_attendee("a", AttendeeRole.REQUIRED), _attendee("b", AttendeeRole.REQUIRED)])
+
+    attendees.remove("a")
+    attendees.append(_attendee("a", AttendeeRole.REQUIRED))
+
+    assert [a.employee_id for a in attendees] == ["b", "a"]
+    assert [a.employee_id for a in attendees.by_role(AttendeeRole.REQUIRED)] == ["b", "a"]
+
+
+def test_role_cannot_be_assigned_directly():
+    attendees = AttendeeList([_attendee("a", AttendeeRole.REQUIRED)])
+
+    with pytest.raises(AttributeError):
+        attendees[0].role = AttendeeRole.ORGANIZER
+
+    assert attendees.count_role(AttendeeRole.ORGANIZER) == 0
+    assert copy.deepcopy(attendees[0]).role is AttendeeRole.REQUIRED
+    assert replace(attendees[0], role=AttendeeRole.OPTIONAL).role is AttendeeRole.OPTIONAL
+
+
+def test_random_operations_match_a_plain_list():
+    rng = random.Random(5)
+    attendees = AttendeeList()
+    reference = []
+    roles = list(AttendeeRole)
+    for step in range(500):
+        employee_id = f"e{rng.randrange(30)}"
+        op = rng.random()
+        if op < 0.4:
+            attendee = _attendee(employee_id, rng.choice(roles))
+            if attendees.append(attendee):
+                reference.append(attendee)
+        elif op < 0.6:
+            present = any(a.employee_id == employee_id for a in reference)
+            removed = attendees.remove(employee_id)
+            reference = [a for a in reference if a.employee_id != employee_id]
+            assert (removed is not None) == present
+        else:
+            attendees.set_role(employee_id, rng.choice(roles))
+
+        if step % 7 == 0 and reference:
+            index = rng.randrange(len(reference))
+            assert attendees[index] is reference[index]
+            assert attendees[-1] is reference[-1]
+        for role in roles:
+            assert attendees.by_role(role) == [a for a in reference if a.role is role]
+            assert attendees.count_role(role) == len(attendees.by_role(role))
+        assert list(attendees) == reference
@@ -0,0 +1,87 @@
+"""
+규칙 기반 일정 명령 파서 테스트
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.models.meeting import Meeting
+from src.services.command_parser import FastPathCommandParser
+
+NOW = datetime(2030, 1, 7, 9, 0)  # 월요일
+
+
+@pytest.fixture
+def meeting():
+    start = datetime(2030, 1, 8, 10, 0)
+    return Meeting(title="", start_time=start, end_time=start + timedelta(minutes=30),
+                   content="", attendees=[])
+
+
+def _parse(prompt, meeting):
+    return FastPathCommandParser().parse(prompt, meeting, now=NOW)
+
+
+@pytest.mark.parametrize("prompt", [
+    "2시간 회의 잡아줘",
+    "내일 2시간 회의 잡아줘",
+    "30분 회의 잡아줘",
+    "3시쯤 회의 잡아줘",
+])
+def test_duration_phrases_are_left_to_llm(prompt, meeting):
+    assert _parse(prompt, meeting) is None
+
+
+def test_hours_extension_is_not_read_as_clock_time(meeting):
+    action, _ = _parse("1시간 연장해줘", meeting)
+
+    assert action["updates"] == {"end_time": "2030-01-08 11:30"}
+
+
+@pytest.mark.parametrize("prompt", [
+    "회의를 2시에서 4시로 옮겨줘",
+    "회의 2시에서 4시로 변경해줘",
+    "2시에서 4시로 바꿔줘",
+])
+def test_move_phrase_moves_start_and_keeps_duration(prompt, meeting):
+    action, _ = _parse(prompt, meeting)
+
+    assert action["updates"] == {"start_time": "2030-01-08 16:00", "end_time": "2030-01-08 16:30"}
+
+
+def test_range_without_move_verb_sets_start_and_end(meeting):
+    action, _ = _parse("내일 2시에서 4시까지 회의", meeting)
+
+    assert action["updates"] == {"start_time": "2030-01-08 14:00", "end_time": "2030-01-08 16:00"}
+
+
+def test_clock_time_with_meeting_title(meeting):
+    action, _ = _parse("내일 오후 2시에 팀 미팅 잡아줘", meeting)
+
+    assert action["updates"] == {"title": "팀 미팅", "start_time": "2030-01-08 14:00"}
+
+
+@pytest.mark.parametrize("prompt", [
+    "내일 밤 12시에 회의 잡아줘",
+    "내일 밤 2시에 회의 잡아줘",
+    "내일 저녁 12시에 회의 잡아줘",
+    "내일 오전 13시에 회의 잡아줘",
+    "내일 10시부터 9시까지 회의",
+    "내일 오후 3시부터 2시까지 회의",
+])
+def test_ambiguous_meridiem_or_backwards_range_is_left_to_llm(prompt, meeting):
+    assert _parse(prompt, meeting) is None
+
+
+@pytest.mark.parametrize("prompt, start, end", [
+    ("내일 밤 9시에 회의 잡아줘", "2030-01-08 21:00", None),
+    ("내일 저녁 7시에 회의 잡아줘", "2030-01-08 19:00", None),
+    ("내일 11시부터 1시까지 회의", "2030-01-08 11:00", "2030-01-08 13:00"),
+    ("내일 오후 2시부터 4시까지 회의", "2030-01-08 14:00", "2030-01-08 16:00"),
+])
+def test_unambiguous_times_still_parse(prompt, start, end, meeting):
+    action, _ = _parse(prompt, meeting)
+
+    assert action["updates"]["start_time"] == start
+    if end:
+        assert action["updates"]["end_time"] == end
@@ -0,0 +1,114 @@
+"""
+참석자 충돌 결과 캐시 테스트
+"""
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.api.sqlite_schedule_api import SQLiteScheduleAPI
+from src.models.meeting import Attendee, AttendeeRole, Meeting
+from src.services import meeting_service
+from src.services.conflict_cache import ConflictCache
+from src.services.meeting_service import MeetingService, _window_difference
+
+START = datetime(2030, 1, 8, 10)
+
+
+@pytest.fixture
+def cache(schedule_api, monkeypatch):
+    cache = ConflictCache()
+    monkeypatch.setattr(meeting_service, "get_schedule_api", lambda: schedule_api)
+    monkeypatch.setattr(meeting_service, "get_conflict_cache", lambda: cache)
+    return cache
+
+
+def _meeting(*employee_ids):
+    meeting = Meeting(title="", start_time=START, end_time=START + timedelta(hours=1),
+                      content="", attendees=[])
+    for emp_id in employee_ids:
+        meeting.attendees.append(Attendee(emp_id, emp_id, "팀", AttendeeRole.REQUIRED))
+    return meeting
+
+
+def _conflicting(meeting):
+    return [attendee.employee_id for attendee in meeting.attendees if attendee.has_conflict]
+
+
+def test_repeated_check_is_served_from_cache(schedule_api, cache, monkeypatch):
+    schedule_api.create_schedule("E1", "외부 미팅", START, START + timedelta(minutes=30))
+    meeting = _meeting("E1", "E2")
+    MeetingService.check_attendee_conflicts(meeting)
+
+    # 참석자/시간/저장소가 같으면 저장소를 다시 조회하지 않음
+    monkeypatch.setattr(schedule_api, "check_conflicts",
+                        lambda *args, **kwargs: pytest.fail("캐시를 건너뜀"))
+    meeting.title = "제목만 변경"
+    MeetingService.check_attendee_conflicts(meeting)
+
+    assert _conflicting(meeting) == ["E1"]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_store_change_invalidates_cached_result(schedule_api, cache):
+    meeting = _meeting("E1", "E2")
+    MeetingService.check_attendee_conflicts(meeting)
+    assert _conflicting(meeting) == []
+
+    schedule_api.create_schedule("E2", "외부 미팅", START, START + timedelta(minutes=30))
+    MeetingService.check_attendee_conflicts(meeting)
+
+    assert _conflicting(meeting) == ["E2"]
+
+
+def test_other_sqlite_connection_invalidates_cached_result(tmp_path, monkeypatch):
+    path = str(tmp_path / "schedules.db")
+    api = SQLiteScheduleAPI(path, generate_sample_data=False)
+    other = SQLiteScheduleAPI(path, generate_sample_data=False)
+    monkeypatch.setattr(meeting_service, "get_schedule_api", lambda: api)
+    cache = ConflictCache()
+    monkeypatch.setattr(meeting_service, "get_conflict_cache", lambda: cache)
+    try:
+        meeting = _meeting("E1")
+        MeetingService.check_attendee_conflicts(meeting)
+
+        # 다른 워커(연결)의 커밋도 data_version으로 감지
+        other.create_schedule("E1", "외부 미팅", START, START + timedelta(minutes=30))
+        MeetingService.check_attendee_conflicts(meeting)
+
+        assert _conflicting(meeting) == ["E1"]
+    finally:
+        api.close()
+        other.close()
+
+
+def test_lru_evicts_least_recently_used_entry():
+    cache = ConflictCache(max_entries=2)
+    cache.put("a", frozenset({"E1"}))
+    cache.put("b", frozenset())
+    cache.get("a")
+    cache.put("c", frozenset())
+
+    assert cache.get("b") is None
+    assert cache.get("a") == frozenset({"E1"})
+    assert cache.get("c") == frozenset()
+
+
+def _minutes(start: datetime, end: datetime):
+    return {start + timedelta(minutes=m) for m in range(int((end - start).total_seconds() // 60))}
+
+
+def test_window_difference_matches_minute_scan():
+    rng = random.Random(18)
+    for _ in range(500):
+        previous_start = START + timedelta(minutes=rng.randrange(0, 240, 10))
+        previous_end = previous_start + timedelta(minutes=rng.randrange(10, 180, 10))
+        start = START + timedelta(minutes=rng.randrange(0, 240, 10))
+        end = start + timedelta(minutes=rng.randrange(10, 180, 10))
+
+        parts = _window_difference(start, end, previous_start, previous_end)
+
+        # 구간들은 서로 겹치지 않고, 합치면 새 구간 - 이전 구간과 같음
+        covered = [_minutes(part_start, part_end) for part_start, part_end in parts]
+        assert sum(len(minutes) for minutes in covered) == len(set().union(*covered))
+        assert set().union(*covered) == _minutes(start, end) - _minutes(previous_start, previous_end)
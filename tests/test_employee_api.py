@@ -0,0 +1,96 @@
+"""
+임직원 API 해시 색인 테스트
+"""
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.api.employee_api import MockEmployeeAPI, get_employee_api, set_employee_api
+from src.models.employee import Employee
+from src.models.meeting import Attendee, AttendeeRole, Meeting
+from src.services.attendee_service import AttendeeService
+
+
+def _employee(emp_id: str, name: str, team: str) -> Employee:
+    return Employee(id=emp_id, name=name, team=team, email=f"{emp_id}@company.com")
+
+
+@pytest.fixture
+def emp_api():
+    return MockEmployeeAPI([
+        _employee("e1", "김철수", "개발팀"),
+        _employee("e2", "이영희", "개발팀"),
+        _employee("e3", "박민수", "기획팀"),
+    ])
+
+
+def _assert_indexes_match_scan(api: MockEmployeeAPI):
+    """해시 색인 조회 결과가 전체 목록을 훑은 결과와 같은지 확인"""
+    employees = api.get_all_employees()
+    teams = list(dict.fromkeys(emp.team for emp in employees))
+    assert sorted(api.get_all_teams()) == sorted(teams)
+    for team in teams:
+        assert api.get_team_members(team) == [emp for emp in employees if emp.team == team]
+    for emp in employees:
+        assert api.get_employee_by_id(emp.id) is emp
+        assert api.get_employee_by_email(emp.email) is emp
+
+
+def test_indexes_follow_add_and_remove(emp_api):
+    emp_api.add_employee(_employee("e4", "최윤호", "디자인팀"))
+    assert emp_api.remove_employee("e3")
+    assert not emp_api.remove_employee("e3")
+
+    _assert_indexes_match_scan(emp_api)
+    assert emp_api.get_employee_by_id("e3") is None
+    assert emp_api.get_employee_by_email("e3@company.com") is None
+    assert emp_api.get_team_members("기획팀") == []
+    assert "기획팀" not in emp_api.get_all_teams()
+
+
+def test_re_adding_an_id_moves_it_to_the_new_team(emp_api):
+    emp_api.add_employee(_employee("e1", "김철수", "기획팀"))
+
+    _assert_indexes_match_scan(emp_api)
+    assert [emp.id for emp in emp_api.get_team_members("개발팀")] == ["e2"]
+    assert [emp.id for emp in emp_api.get_team_members("기획팀")] == ["e3", "e1"]
+    assert len(emp_api.get_all_employees()) == 3
+
+
+def test_random_add_remove_sequence_keeps_indexes_consistent():
+    rng = random.Random(3)
+    api = MockEmployeeAPI([])
+    teams = ["개발팀", "기획팀", "디자인팀"]
+    for step in range(300):
+        emp_id = f"e{rng.randrange(40)}"
+        if rng.random() < 0.6:
+            api.add_employee(_employee(emp_id, f"직원{step}", rng.choice(teams)))
+        else:
+            api.remove_employee(emp_id)
+        _assert_indexes_match_scan(api)
+
+
+def test_get_employees_by_ids_skips_unknown_ids(emp_api):
+    found = emp_api.get_employees_by_ids(["e3", "missing", "e1"])
+
+    assert list(found) == ["e3", "e1"]
+    assert found["e1"].name == "김철수"
+
+
+def test_attendee_employees_are_looked_up_in_one_batch(emp_api, monkeypatch):
+    previous = get_employee_api()
+    set_employee_api(emp_api)
+    try:
+        start = datetime(2030, 1, 8, 10)
+        meeting = Meeting(title="회의", start_time=start, end_time=start + timedelta(hours=1), content="",
+                          attendees=[Attendee("e1", "김철수", "예전팀", AttendeeRole.ORGANIZER),
+                                     Attendee("e9", "퇴사자", "예전팀", AttendeeRole.REQUIRED)])
+        monkeypatch.setattr(emp_api, "get_employee_by_id",
+                            lambda *_: pytest.fail("참석자마다 개별 조회하면 안 됨"))
+
+        employees = AttendeeService.get_attendee_employees(meeting)
+
+        assert {emp_id: emp.team for emp_id, emp in employees.items()} == {"e1": "개발팀"}
+    finally:
+        set_employee_api(previous)
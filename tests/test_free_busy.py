@@ -0,0 +1,75 @@
+"""
+FreeBusyGrid 충돌 수 테스트
+"""
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.api.free_busy import FreeBusyGrid
+from src.models.employee import Schedule
+
+DAY = datetime(2030, 1, 7)
+
+
+def _schedule(start: datetime, end: datetime) -> Schedule:
+    return Schedule(schedule_id=None, employee_id="E1", title="일정",
+                    start_datetime=start, end_datetime=end)
+
+
+def _interval_count(schedules, start: datetime, end: datetime) -> int:
+    return sum(1 for s in schedules if s.start_datetime < end and s.end_datetime > start)
+
+
+def test_non_aligned_duration_does_not_count_next_cell():
+    window_start, window_end = DAY.replace(hour=9), DAY.replace(hour=18)
+    grid = FreeBusyGrid(window_start, window_end)
+    # 09:50에 시작하는 일정은 09:00~09:45 회의와 겹치지 않음
+    grid.add_schedules([_schedule(DAY.replace(hour=9, minute=50), DAY.replace(hour=10, minute=30))])
+
+    counts = grid.conflict_counts(45)
+
+    assert counts[grid.slot_index(DAY.replace(hour=9))] == 0
+    assert counts[grid.slot_index(DAY.replace(hour=9, minute=10))] == 1
+
+
+@pytest.mark.parametrize("duration_minutes", [10, 30, 45, 60, 95])
+def test_conflict_counts_match_interval_check(duration_minutes):
+    rng = random.Random(duration_minutes)
+    window_start, window_end = DAY.replace(hour=9), DAY.replace(hour=18)
+    schedules = []
+    for _ in range(40):
+        start = DAY + timedelta(minutes=rng.randrange(8 * 60, 19 * 60, 5))
+        schedules.append(_schedule(start, start + timedelta(minutes=rng.choice([15, 30, 45, 60, 120]))))
+    grid = FreeBusyGrid(window_start, window_end)
+    grid.add_schedules(schedules)
+
+    counts = grid.conflict_counts(duration_minutes)
+
+    assert len(counts) > 0
+    for index, count in enumerate(counts):
+        start = grid.slot_time(index)
+        end = start + timedelta(minutes=duration_minutes)
+        assert end <= window_end
+        assert count == _interval_count(schedules, start, end)
+
+
+def test_chunked_add_schedules_matches_single_batch():
+    rng = random.Random(3)
+    window_start, window_end = DAY.replace(hour=9), DAY.replace(hour=18)
+    schedules = []
+    for _ in range(60):
+        start = DAY + timedelta(minutes=rng.randrange(8 * 60, 19 * 60, 5))
+        schedules.append(_schedule(start, start + timedelta(minutes=rng.choice([15, 30, 60]))))
+    batched = FreeBusyGrid(window_start, window_end)
+    batched.add_schedules(schedules)
+
+    # 참석자별로 나눠 넣는 호출 방식 (빈 묶음 포함)
+    chunked = FreeBusyGrid(window_start, window_end)
+    for offset in range(0, len(schedules), 7):
+        chunked.add_schedules(schedules[offset:offset + 7])
+        chunked.add_schedules([])
+
+    for duration_minutes in (30, 45):
+        assert chunked.conflict_counts(duration_minutes).tolist() == \
+            batched.conflict_counts(duration_minutes).tolist()
@@ -0,0 +1,90 @@
+"""
+회의 일괄 예약(book_meeting) 테스트 (Mock/SQLite)
+"""
+import threading
+from datetime import datetime, timedelta
+
+from src.api.sqlite_schedule_api import SQLiteScheduleAPI
+
+START = datetime(2030, 1, 7, 10)
+END = START + timedelta(hours=1)
+
+
+def test_clean_booking_writes_one_linked_schedule_per_attendee(schedule_api):
+    result = schedule_api.book_meeting(["E1", "E2", "E3"], "주간 회의", START, END, meeting_id="M1")
+
+    assert result.success
+    assert len(result.schedule_ids) == 3
+    assert schedule_api.get_meeting_schedules("M1") == dict(zip(["E1", "E2", "E3"], result.schedule_ids))
+    for emp_id, schedule_id in zip(["E1", "E2", "E3"], result.schedule_ids):
+        schedule = schedule_api.get_schedule(schedule_id)
+        assert (schedule.employee_id, schedule.meeting_id) == (emp_id, "M1")
+        assert (schedule.start_datetime, schedule.end_datetime) == (START, END)
+        assert schedule.attendees == ["E1", "E2", "E3"]
+
+
+def test_conflicting_booking_writes_nothing(schedule_api):
+    busy_id = schedule_api.create_schedule("E2", "외부 미팅", START + timedelta(minutes=30),
+                                           END + timedelta(minutes=30))
+    version = schedule_api.version
+
+    result = schedule_api.book_meeting(["E1", "E2", "E3"], "주간 회의", START, END, meeting_id="M1")
+
+    assert not result.success
+    assert result.schedule_ids == []
+    assert [s.schedule_id for s in result.conflicts["E2"]] == [busy_id]
+    assert list(result.conflicts) == ["E2"]
+    assert [s.schedule_id for s in schedule_api.schedules] == [busy_id]
+    assert schedule_api.get_meeting_schedules("M1") == {}
+    assert schedule_api.version == version
+
+
+def test_adjacent_booking_is_not_a_conflict(schedule_api):
+    schedule_api.create_schedule("E1", "이전 회의", START - timedelta(hours=1), START)
+
+    assert schedule_api.book_meeting(["E1"], "회의", START, END).success
+
+
+def _race(book, threads: int = 8):
+    """같은 시간대를 동시에 예약하고 결과 목록 반환"""
+    barrier = threading.Barrier(threads)
+    results = [None] * threads
+
+    def worker(i: int):
+        barrier.wait()
+        # 모든 요청이 E0을 공유하므로 많아야 하나만 성공할 수 있음
+        results[i] = book(i, ["E0", f"E{i + 1}"])
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return results
+
+
+def test_concurrent_bookings_for_same_slot_let_exactly_one_win(schedule_api):
+    results = _race(lambda i, ids: schedule_api.book_meeting(ids, f"회의 {i}", START, END,
+                                                             meeting_id=f"M{i}"))
+
+    winners = [i for i, result in enumerate(results) if result.success]
+    assert len(winners) == 1
+    assert all(result.conflicts["E0"] for result in results if not result.success)
+    stored = schedule_api.schedules
+    assert len(stored) == 2
+    assert {s.meeting_id for s in stored} == {f"M{winners[0]}"}
+
+
+def test_concurrent_bookings_across_sqlite_connections(tmp_path):
+    # 같은 DB 파일을 쓰는 워커 프로세스처럼 연결을 따로 둠
+    db_path = str(tmp_path / "shared.db")
+    apis = [SQLiteScheduleAPI(db_path, generate_sample_data=False) for _ in range(4)]
+    try:
+        results = _race(lambda i, ids: apis[i % len(apis)].book_meeting(ids, f"회의 {i}", START, END),
+                        threads=4)
+
+        assert sum(result.success for result in results) == 1
+        assert len(apis[0].schedules) == 2
+    finally:
+        for api in apis:
+            api.close()
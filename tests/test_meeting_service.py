@@ -0,0 +1,89 @@
+"""
+회의 서비스 테스트
+"""
+import random
+from datetime import datetime, timedelta
+
+from src.models.chat import LLMResponse
+from src.models.meeting import Meeting
+from src.services.meeting_service import MeetingService
+
+START = datetime(2030, 1, 8, 10)
+
+
+def _meeting():
+    return Meeting(title="", start_time=START, end_time=START + timedelta(hours=1),
+                   content="", attendees=[])
+
+
+def test_llm_attendee_names_report_ambiguous_and_unknown():
+    # 샘플 임직원: 김철수, 정지영/한지영/김지영
+    response = LLMResponse(action="update", updates={"attendees": "김철수, 지영, 홍길동"})
+
+    updated = MeetingService.update_meeting_from_llm_response(_meeting(), response)
+
+    assert [attendee.name for attendee in updated.attendees] == ["김철수"]
+    resolution = response.name_resolution
+    assert sorted(m.employee.name for m in resolution.ambiguous["지영"]) == ["김지영", "정지영", "한지영"]
+    assert resolution.unresolved == ["홍길동"]
+
+
+def test_response_without_attendees_has_no_resolution():
+    response = LLMResponse(action="update", updates={"title": "주간 회의"})
+
+    MeetingService.update_meeting_from_llm_response(_meeting(), response)
+
+    assert response.name_resolution is None
+
+
+def test_incremental_conflicts_match_full_recompute(schedule_api, monkeypatch):
+    from src.models.meeting import Attendee, AttendeeRole
+    from src.services import meeting_service
+    from src.services.conflict_cache import ConflictCache
+
+    rng = random.Random(7)
+    employee_ids = [f"E{i:03d}" for i in range(12)]
+    day = datetime(2030, 1, 8, 8)
+    for _ in range(60):
+        start = day + timedelta(minutes=30 * rng.randrange(20))
+        schedule_api.create_schedule(rng.choice(employee_ids), "일정", start,
+                                     start + timedelta(minutes=30 * rng.randint(1, 4)))
+
+    meeting = _meeting()
+    # 회의 자신에 연결된 일정은 충돌에서 빠져야 함
+    schedule_api.create_schedule(employee_ids[0], "회의", meeting.start_time, meeting.end_time,
+                                 meeting_id=meeting.meeting_id)
+
+    cache = ConflictCache()
+    recomputes = []
+    original = MeetingService._recompute_conflicts
+    monkeypatch.setattr(meeting_service, "get_schedule_api", lambda: schedule_api)
+    monkeypatch.setattr(meeting_service, "get_conflict_cache", lambda: cache)
+    monkeypatch.setattr(MeetingService, "_recompute_conflicts",
+                        staticmethod(lambda *args: recomputes.append(1) or original(*args)))
+
+    for _ in range(300):
+        edit = rng.random()
+        if edit < 0.3:
+            emp_id = rng.choice(employee_ids)
+            if emp_id in meeting.attendees:
+                meeting.attendees.remove(emp_id)
+            else:
+                meeting.attendees.append(Attendee(emp_id, emp_id, "팀", AttendeeRole.REQUIRED))
+        elif edit < 0.9:
+            meeting.start_time = day + timedelta(minutes=30 * rng.randrange(20))
+            meeting.end_time = meeting.start_time + timedelta(minutes=30 * rng.randint(1, 6))
+        else:
+            # 저장소가 바뀌면 전체 재계산으로 돌아가야 함
+            start = day + timedelta(minutes=30 * rng.randrange(20))
+            schedule_api.create_schedule(rng.choice(employee_ids), "추가", start,
+                                         start + timedelta(minutes=30))
+
+        MeetingService.check_attendee_conflicts(meeting)
+
+        expected = set(schedule_api.check_conflicts(meeting.attendees.employee_ids(),
+                                                    meeting.start_time, meeting.end_time,
+                                                    exclude_meeting_id=meeting.meeting_id))
+        assert {a.employee_id for a in meeting.attendees if a.has_conflict} == expected
+
+    assert len(recomputes) > 100
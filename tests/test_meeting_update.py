@@ -0,0 +1,123 @@
+"""
+회의 일정 차등 수정(update_meeting_schedules) 테스트 (Mock/SQLite)
+"""
+from datetime import datetime, timedelta
+
+START = datetime(2030, 1, 7, 10)
+END = START + timedelta(hours=1)
+
+
+def _book(schedule_api, attendees=("E1", "E2", "E3")):
+    result = schedule_api.book_meeting(list(attendees), "주간 회의", START, END, "안건", meeting_id="M1")
+    assert result.success
+    return schedule_api.get_meeting_schedules("M1")
+
+
+def _snapshot(schedule_api):
+    return sorted((s.schedule_id, s.employee_id, s.title, s.start_datetime, s.end_datetime, s.content)
+                  for s in schedule_api.schedules)
+
+
+def test_unchanged_meeting_keeps_every_schedule(schedule_api):
+    linked = _book(schedule_api)
+    before = _snapshot(schedule_api)
+
+    result = schedule_api.update_meeting_schedules("M1", ["E1", "E2", "E3"], "주간 회의", START, END, "안건")
+
+    assert result.success and result.changes.is_empty
+    assert result.schedule_ids == [linked[e] for e in ("E1", "E2", "E3")]
+    assert _snapshot(schedule_api) == before
+
+
+def test_title_change_updates_in_place(schedule_api):
+    linked = _book(schedule_api)
+
+    result = schedule_api.update_meeting_schedules("M1", ["E1", "E2", "E3"], "월간 회의", START, END, "안건")
+
+    assert result.changes.updated == linked
+    assert not result.changes.created and not result.changes.deleted
+    assert schedule_api.get_meeting_schedules("M1") == linked
+    assert {s.title for s in schedule_api.schedules} == {"월간 회의"}
+
+
+def test_move_overlapping_own_slot_is_not_a_conflict(schedule_api):
+    linked = _book(schedule_api)
+    new_start, new_end = START + timedelta(minutes=30), END + timedelta(minutes=30)
+
+    result = schedule_api.update_meeting_schedules("M1", ["E1", "E2", "E3"], "주간 회의",
+                                                   new_start, new_end, "안건")
+
+    assert result.success
+    assert result.changes.updated == linked
+    for schedule_id in linked.values():
+        schedule = schedule_api.get_schedule(schedule_id)
+        assert (schedule.start_datetime, schedule.end_datetime) == (new_start, new_end)
+    assert schedule_api.check_conflicts(["E1"], new_start, new_end) != {}
+    assert schedule_api.check_conflicts(["E1"], START, new_start) == {}
+
+
+def test_add_and_remove_attendees(schedule_api):
+    linked = _book(schedule_api)
+
+    result = schedule_api.update_meeting_schedules("M1", ["E1", "E3", "E4"], "주간 회의", START, END, "안건")
+
+    changes = result.changes
+    assert changes.deleted == {"E2": linked["E2"]}
+    assert list(changes.created) == ["E4"]
+    assert changes.updated == {}
+    assert schedule_api.get_schedule(linked["E2"]) is None
+    current = schedule_api.get_meeting_schedules("M1")
+    assert current == {"E1": linked["E1"], "E3": linked["E3"], "E4": changes.created["E4"]}
+    assert result.schedule_ids == [current[e] for e in ("E1", "E3", "E4")]
+    added = schedule_api.get_schedule(changes.created["E4"])
+    assert (added.title, added.start_datetime, added.end_datetime, added.meeting_id) == \
+        ("주간 회의", START, END, "M1")
+
+
+def test_meeting_without_linked_schedules_creates_all(schedule_api):
+    result = schedule_api.update_meeting_schedules("M9", ["E1", "E2"], "새 회의", START, END)
+
+    assert result.success
+    assert list(result.changes.created) == ["E1", "E2"]
+    assert schedule_api.get_meeting_schedules("M9") == result.changes.created
+
+
+def test_conflict_for_new_attendee_rejects_without_changes(schedule_api):
+    _book(schedule_api)
+    schedule_api.create_schedule("E4", "외부 미팅", START, END)
+    before = _snapshot(schedule_api)
+    version = schedule_api.version
+
+    # 제목 변경, E2 제외, E4 추가를 함께 요청해도 하나도 반영되지 않아야 함
+    result = schedule_api.update_meeting_schedules("M1", ["E1", "E3", "E4"], "월간 회의", START, END, "안건")
+
+    assert not result.success
+    assert list(result.conflicts) == ["E4"]
+    assert result.changes is None
+    assert _snapshot(schedule_api) == before
+    assert schedule_api.version == version
+
+
+def test_conflict_for_moved_attendee_rejects_without_changes(schedule_api):
+    _book(schedule_api)
+    new_start, new_end = START + timedelta(hours=2), END + timedelta(hours=2)
+    schedule_api.create_schedule("E3", "외부 미팅", new_start, new_end)
+    before = _snapshot(schedule_api)
+
+    result = schedule_api.update_meeting_schedules("M1", ["E1", "E2", "E3"], "주간 회의",
+                                                   new_start, new_end, "안건")
+
+    assert not result.success
+    assert list(result.conflicts) == ["E3"]
+    assert _snapshot(schedule_api) == before
+
+
+def test_unmoved_attendee_existing_overlap_does_not_block_title_change(schedule_api):
+    # 시간이 그대로인 참석자는 충돌 확인 대상이 아님 (이미 잡혀 있던 겹침은 그대로 둠)
+    linked = _book(schedule_api)
+    schedule_api.create_schedule("E1", "겹쳐 잡힌 일정", START, END)
+
+    result = schedule_api.update_meeting_schedules("M1", ["E1", "E2", "E3"], "월간 회의", START, END, "안건")
+
+    assert result.success
+    assert result.changes.updated == linked
@@ -0,0 +1,104 @@
+"""
+이름 오타 보정 색인(BK-tree) 테스트
+"""
+import random
+
+import pytest
+
+from src.api.employee_api import MockEmployeeAPI
+from src.api.name_index import NameIndex, edit_distance, normalize_name
+from src.models.employee import Employee
+from src.utils.hangul import decompose
+
+SURNAMES = "김이박정최"
+GIVEN = "철수영희민지현호"
+
+
+def _levenshtein(a: str, b: str) -> int:
+    """기준 DP 구현"""
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, start=1):
+        current = [i]
+        for j, char_b in enumerate(b, start=1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1,
+                               previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+def _random_name(rng: random.Random) -> str:
+    return rng.choice(SURNAMES) + "".join(rng.choice(GIVEN) for _ in range(rng.randint(1, 2)))
+
+
+def _scan(names, query, max_distance):
+    """모든 이름과의 거리를 계산한 기준 결과 {(거리, 문서 ID 목록)}"""
+    key = decompose(normalize_name(query))
+    groups = {}
+    for doc_id, name in names.items():
+        groups.setdefault(decompose(normalize_name(name)), []).append(doc_id)
+    distances = {name_key: _levenshtein(key, name_key) for name_key in groups}
+    if not distances:
+        return set()
+    best = min(distances.values())
+    if best > 0 and best > max_distance:
+        return set()
+    return {(best, tuple(sorted(groups[name_key])))
+            for name_key, distance in distances.items() if distance == best}
+
+
+def test_edit_distance_matches_dp():
+    rng = random.Random(14)
+    # 64자를 넘는 문자열도 비트 병렬 계산이 정수 폭과 무관하게 맞는지 확인
+    for _ in range(500):
+        a = "".join(rng.choice("ㄱㄴㅏㅓㅣ") for _ in range(rng.randint(0, 80)))
+        b = "".join(rng.choice("ㄱㄴㅏㅓㅣ") for _ in range(rng.randint(0, 80)))
+        assert edit_distance(a, b) == _levenshtein(a, b)
+
+
+@pytest.mark.parametrize("max_distance", [None, 1, 2, 3])
+def test_search_matches_naive_scan(max_distance):
+    rng = random.Random(max_distance or 0)
+    names = {doc_id: _random_name(rng) for doc_id in range(120)}
+    index = NameIndex()
+    for doc_id, name in names.items():
+        index.add(doc_id, name)
+
+    for _ in range(200):
+        query = _random_name(rng)
+        if rng.random() < 0.5:
+            # 자모 하나를 바꾼 오타
+            jamo = list(decompose(query))
+            jamo[rng.randrange(len(jamo))] = rng.choice("ㄱㅈㅅㅏㅜ")
+            query = "".join(jamo)
+        radius = max_distance if max_distance is not None else max(1, len(decompose(query)) // 4)
+
+        results = {(distance, tuple(doc_ids))
+                   for distance, _, doc_ids in index.search(query, max_distance)}
+        assert results == _scan(names, query, radius), query
+
+
+def test_add_remove_sequence_matches_scan():
+    rng = random.Random(4)
+    index = NameIndex()
+    names = {}
+    for _ in range(400):
+        doc_id = rng.randrange(30)
+        if rng.random() < 0.6:
+            names[doc_id] = _random_name(rng)
+            index.add(doc_id, names[doc_id])
+        else:
+            names.pop(doc_id, None)
+            index.remove(doc_id)
+
+        query = _random_name(rng)
+        results = {(distance, tuple(doc_ids)) for distance, _, doc_ids in index.search(query, 2)}
+        assert results == _scan(names, query, 2), query
+
+
+def test_resolve_name_follows_add_and_remove():
+    api = MockEmployeeAPI([Employee(id="e1", name="김철수", team="개발팀")])
+    api.add_employee(Employee(id="e2", name="김철민", team="기획팀"))
+    api.remove_employee("e1")
+
+    assert [match.employee.id for match in api.resolve_name("김철미")] == ["e2"]
+    assert api.resolve_name("김철수") == []
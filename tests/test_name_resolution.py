@@ -0,0 +1,51 @@
+"""
+임직원 이름 보정 테스트
+"""
+import pytest
+
+from src.api.employee_api import MockEmployeeAPI
+from src.models.employee import Employee
+
+
+@pytest.fixture
+def emp_api():
+    names = ["김철수", "이영희", "박민수", "정지영", "한지영"]
+    return MockEmployeeAPI([
+        Employee(id=f"emp_{i:03d}", name=name, team="개발팀")
+        for i, name in enumerate(names, start=1)
+    ])
+
+
+def _names(matches):
+    return [match.employee.name for match in matches]
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("김철수", "김철수"),
+    ("김철슈", "김철수"),
+    ("김 철수님", "김철수"),
+    ("철수", "김철수"),
+    ("영희", "이영희"),
+    ("김철", "김철수"),
+    ("철수씨", "김철수"),
+    ("영희님", "이영희"),
+])
+def test_resolve_name_finds_single_employee(emp_api, query, expected):
+    assert _names(emp_api.resolve_name(query)) == [expected]
+
+
+def test_exact_match_ranks_above_partial(emp_api):
+    assert emp_api.resolve_name("김철수")[0].confidence == 1.0
+    assert emp_api.resolve_name("철수")[0].confidence < 1.0
+
+
+def test_shared_given_name_is_ambiguous(emp_api):
+    resolution = emp_api.resolve_names(["지영", "철수", "홍길동"])
+
+    assert _names(resolution.resolved.values()) == ["김철수"]
+    assert _names(resolution.ambiguous["지영"]) == ["정지영", "한지영"]
+    assert resolution.unresolved == ["홍길동"]
+
+
+def test_single_syllable_is_not_resolved(emp_api):
+    assert emp_api.resolve_name("김") == []
@@ -0,0 +1,76 @@
+"""
+N-gram 역색인 테스트
+"""
+import random
+
+import pytest
+
+from src.api.employee_api import MockEmployeeAPI
+from src.api.employee_index import NgramIndex
+from src.models.employee import Employee
+
+SYLLABLES = "김이박정최철수영희민지현호개발기획팀"
+
+
+def _random_value(rng: random.Random) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 6)))
+
+
+def _scan(values, query):
+    """선형 검색 기준 결과"""
+    return sorted(doc_id for doc_id, value in values.items() if query in value)
+
+
+@pytest.mark.parametrize("n", [1, 2, 3])
+def test_search_matches_substring_scan(n):
+    rng = random.Random(n)
+    values = {doc_id: _random_value(rng) for doc_id in range(200)}
+    index = NgramIndex(n)
+    for doc_id, value in values.items():
+        index.add(doc_id, value)
+
+    queries = [""] + [_random_value(rng) for _ in range(100)]
+    # 실제 값의 부분 문자열도 섞어 결과가 있는 질의를 충분히 포함
+    for value in rng.sample(list(values.values()), 50):
+        start = rng.randrange(len(value))
+        queries.append(value[start:start + rng.randint(1, 4)])
+
+    for query in queries:
+        assert index.search(query) == _scan(values, query), query
+
+
+def test_add_remove_sequence_keeps_postings_consistent():
+    rng = random.Random(11)
+    index = NgramIndex()
+    values = {}
+    for _ in range(500):
+        doc_id = rng.randrange(50)
+        if rng.random() < 0.6:
+            # 같은 doc_id 재등록은 교체
+            values[doc_id] = _random_value(rng)
+            index.add(doc_id, values[doc_id])
+        else:
+            values.pop(doc_id, None)
+            index.remove(doc_id)
+
+        query = _random_value(rng)[:2]
+        assert index.search(query) == _scan(values, query)
+
+    for value in set(values.values()):
+        assert index.search(value) == _scan(values, value)
+    # 제거된 문서가 포스팅에 남거나 빈 포스팅이 남지 않음
+    assert all(index._postings.values())
+    assert set().union(*index._postings.values()) == set(values)
+
+
+def test_employee_search_follows_add_and_remove():
+    api = MockEmployeeAPI([
+        Employee(id="e1", name="김철수", team="개발팀", email="e1@company.com"),
+        Employee(id="e2", name="이철민", team="기획팀", email="e2@company.com"),
+    ])
+    api.add_employee(Employee(id="e3", name="박철호", team="개발팀", email="e3@company.com"))
+    api.remove_employee("e1")
+
+    assert [emp.id for emp in api.search_by_name("철")] == ["e2", "e3"]
+    assert api.search_by_name("김철") == []
+    assert [emp.id for emp in api.search_by_team("개발")] == ["e3"]
@@ -0,0 +1,98 @@
+"""
+렌더 프로파일러 테스트
+"""
+import json
+import time
+
+from src.utils.profiler import RenderProfiler, get_active_profiler, profile, profiled
+
+
+@profiled("inner")
+def _inner(sleep_s: float) -> int:
+    time.sleep(sleep_s)
+    return 1
+
+
+@profiled("outer")
+def _outer() -> int:
+    with profile("block"):
+        return _inner(0.01) + _inner(0.01)
+
+
+@profiled("items")
+def _items():
+    time.sleep(0.005)
+    yield 1
+    yield 2
+
+
+def _profiler(**kwargs) -> RenderProfiler:
+    return RenderProfiler(enabled=True, log_path=None, trace_allocations=False, **kwargs)
+
+
+def test_nested_spans_record_calls_and_include_children():
+    profiler = _profiler()
+
+    with profiler.rerun():
+        assert _outer() == 2
+
+    spans = profiler.last_rerun.spans
+    assert {name: stats.calls for name, stats in spans.items()} == {"inner": 2, "block": 1, "outer": 1}
+    # 상위 구간 시간은 하위 구간을 포함
+    assert spans["inner"].wall_ms >= 20
+    assert spans["outer"].wall_ms >= spans["block"].wall_ms >= spans["inner"].wall_ms
+    assert profiler.last_rerun.wall_ms >= spans["outer"].wall_ms
+
+
+def test_nested_rerun_is_recorded_as_span_and_totals_accumulate():
+    profiler = _profiler()
+
+    for _ in range(2):
+        with profiler.rerun("app"):
+            # 전체 실행 중의 프래그먼트는 별도 재실행이 아닌 하위 구간
+            with profiler.rerun("fragment:chat"):
+                _inner(0)
+
+    assert [rerun.kind for rerun in profiler.reruns] == ["app", "app"]
+    assert profiler.last_rerun.spans["fragment:chat"].calls == 1
+    assert profiler.session_totals["inner"].calls == 2
+    assert get_active_profiler() is None
+
+
+def test_generator_counts_one_call_and_excludes_consumer_time():
+    profiler = _profiler()
+
+    with profiler.rerun():
+        for _ in _items():
+            time.sleep(0.05)
+
+    stats = profiler.last_rerun.spans["items"]
+    assert stats.calls == 1
+    assert 5 <= stats.wall_ms < 60
+
+
+def test_disabled_profiler_and_calls_outside_rerun_record_nothing():
+    disabled = RenderProfiler(enabled=False, log_path=None, trace_allocations=False)
+    with disabled.rerun():
+        _outer()
+    _outer()
+
+    assert disabled.rerun_count == 0
+    assert disabled.session_totals == {}
+
+
+def test_rerun_is_logged_as_jsonl(tmp_path):
+    log_path = tmp_path / "logs" / "render_profile.jsonl"
+    profiler = _profiler()
+    profiler.log_path = str(log_path)
+
+    with profiler.rerun():
+        _outer()
+    with profiler.rerun("fragment:attendees"):
+        pass
+
+    records = [json.loads(line) for line in log_path.read_text(encoding="utf-8").splitlines()]
+    assert [(record["rerun"], record["kind"]) for record in records] == \
+        [(1, "app"), (2, "fragment:attendees")]
+    assert records[0]["spans"]["inner"]["calls"] == 2
+    assert {record["session"] for record in records} == {profiler.session_id}
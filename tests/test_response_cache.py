@@ -0,0 +1,151 @@
+"""
+AI 응답 캐시 테스트
+"""
+import unicodedata
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.models.meeting import Meeting
+from src.services import ai_service, response_cache
+from src.services.ai_service import AIService
+from src.services.response_cache import ResponseCache, normalize_prompt
+
+ACTION = {"action": "update", "updates": {"title": "주간 회의"}, "requires_confirmation": True}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(response_cache.time, "monotonic", fake)
+    return fake
+
+
+def test_miss_then_hit_updates_stats():
+    cache = ResponseCache()
+    key = cache.make_key("회의 잡아줘", "ctx", "2030-01-07 09:00")
+
+    assert cache.get(key) is None
+    cache.put(key, ACTION, "응답")
+
+    assert cache.get(key) == (ACTION, "응답")
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1, "hit_rate": 0.5}
+
+
+def test_hit_returns_a_copy_that_callers_may_mutate():
+    cache = ResponseCache()
+    stored = {"action": "update", "updates": {"title": "주간 회의"}}
+    cache.put("k", stored, "응답")
+    stored["updates"]["title"] = "저장 뒤 바뀐 값"
+
+    first, _ = cache.get("k")
+    first["updates"]["title"] = "다른 세션이 바꾼 값"
+    second, _ = cache.get("k")
+
+    assert second == {"action": "update", "updates": {"title": "주간 회의"}}
+    assert second is not first
+
+
+def test_none_action_is_cached():
+    cache = ResponseCache()
+    cache.put("k", None, "일반 답변")
+
+    assert cache.get("k") == (None, "일반 답변")
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = ResponseCache(ttl_seconds=60)
+    cache.put("k", ACTION, "응답")
+
+    clock.now += 60
+    assert cache.get("k") is not None
+    clock.now += 0.1
+    assert cache.get("k") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_lru_evicts_least_recently_used():
+    cache = ResponseCache(max_entries=2)
+    cache.put("a", None, "A")
+    cache.put("b", None, "B")
+    cache.get("a")  # a를 최근 사용으로
+    cache.put("c", None, "C")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == (None, "A")
+    assert cache.get("c") == (None, "C")
+
+
+@pytest.mark.parametrize("variant", [
+    "회의  잡아줘", " 회의 잡아줘. ", "회의\t잡아줘!!", "회의 잡아줘?",
+    "회의 잡아줘",  # 자모 분해형(NFD) '회의'
+])
+def test_key_normalization(variant):
+    base = ResponseCache.make_key("회의 잡아줘", "ctx", "2030-01-07 09:00")
+
+    assert normalize_prompt(variant) == "회의 잡아줘"
+    assert ResponseCache.make_key(variant, "ctx", "2030-01-07 09:00") == base
+
+
+def test_key_depends_on_context_and_minute():
+    base = ResponseCache.make_key("회의 잡아줘", "ctx", "2030-01-07 09:00")
+
+    assert ResponseCache.make_key("회의 잡아줘", "other", "2030-01-07 09:00") != base
+    assert ResponseCache.make_key("회의 잡아줘", "ctx", "2030-01-07 09:01") != base
+    assert ResponseCache.make_key("ABC", "ctx", "t") == ResponseCache.make_key("abc", "ctx", "t")
+
+
+@dataclass
+class _Chunk:
+    text: str
+
+
+class _CountingModels:
+    def __init__(self, response: str):
+        self.response = response
+        self.calls = 0
+
+    def generate_content_stream(self, model, contents):
+        self.calls += 1
+        for i in range(0, len(self.response), 7):
+            yield _Chunk(self.response[i:i + 7])
+
+
+class _CountingClient:
+    def __init__(self, response: str):
+        self.models = _CountingModels(response)
+
+
+class _FixedDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2030, 1, 7, 9, 0)
+
+
+def test_ai_service_cache_hit_skips_llm_and_isolates_callers(monkeypatch):
+    # 분 단위 시각이 키에 들어가므로 두 호출 사이에 분이 바뀌지 않게 고정
+    monkeypatch.setattr(ai_service, "datetime", _FixedDatetime)
+    start = datetime(2030, 1, 8, 10)
+    meeting = Meeting(title="", start_time=start, end_time=start + timedelta(hours=1), content="", attendees=[])
+    ai = AIService()
+    ai.response_cache = ResponseCache()
+    ai.client = _CountingClient('ACTION: {"action": "update", "updates": {"title": "주간 회의"}}\nRESPONSE: 변경합니다')
+    # 규칙 기반 파서가 처리하지 않는 프롬프트
+    prompt = "지난번처럼 적당히 정리해줘"
+
+    first = list(ai.process_prompt_stream(prompt, meeting))
+    first[0].action["updates"]["title"] = "호출 측이 바꾼 값"
+    second = list(ai.process_prompt_stream(prompt, meeting))
+
+    assert ai.client.models.calls == 1
+    assert second[0].action == {"action": "update", "updates": {"title": "주간 회의"}}
+    assert "".join(event.text for event in second[1:]) == "변경합니다"
@@ -0,0 +1,103 @@
+"""
+ACTION/RESPONSE 스트리밍 파서 테스트
+"""
+import json
+
+import pytest
+
+from src.services.response_stream_parser import ActionResponseStreamParser
+
+ACTION = {"action": "update", "updates": {"title": "주간 {회의}", "content": "따옴표 \" 와 \\ 역슬래시"},
+          "requires_confirmation": True}
+FULL_RESPONSE = f"ACTION: {json.dumps(ACTION, ensure_ascii=False)}\nRESPONSE: 제목을 변경하겠습니다. {{확인}}"
+
+
+def _run(chunks):
+    """청크를 차례로 넣고 (action 목록, 이어 붙인 텍스트, 연속 중복을 합친 이벤트 종류 순서) 반환"""
+    parser = ActionResponseStreamParser()
+    events = []
+    for chunk in chunks:
+        events.extend(parser.feed(chunk))
+    events.extend(parser.close())
+    actions = [event.action for event in events if event.is_action()]
+    text = "".join(event.text for event in events if not event.is_action())
+    kinds = [event.kind for event in events]
+    return actions, text, [kind for i, kind in enumerate(kinds) if i == 0 or kinds[i - 1] != kind]
+
+
+def _expected(response):
+    return _run([response])
+
+
+@pytest.mark.parametrize("response", [
+    FULL_RESPONSE,
+    "  ACTION:{\"action\": \"none\"}RESPONSE:바로 붙은 마커",
+    "ACTION: RESPONSE: JSON 없이 응답",
+    "그냥 일반 답변입니다. ACTION: 이라는 단어가 있어도",
+    f"ACTION: {json.dumps(ACTION)}",
+])
+def test_every_two_way_split_matches_single_chunk(response):
+    expected = _expected(response)
+    for i in range(len(response) + 1):
+        assert _run([response[:i], response[i:]]) == expected, i
+
+
+def test_every_three_way_split_matches_single_chunk():
+    expected = _expected(FULL_RESPONSE)
+    for i in range(len(FULL_RESPONSE) + 1):
+        for j in range(i, len(FULL_RESPONSE) + 1, 3):
+            assert _run([FULL_RESPONSE[:i], FULL_RESPONSE[i:j], FULL_RESPONSE[j:]]) == expected, (i, j)
+
+
+def test_character_stream_emits_action_before_response_text():
+    actions, text, kinds = _run(list(FULL_RESPONSE))
+
+    assert actions == [ACTION]
+    assert text == "제목을 변경하겠습니다. {확인}"
+    assert kinds == ["action", "text"]
+
+
+def test_action_is_emitted_as_soon_as_json_closes():
+    parser = ActionResponseStreamParser()
+    head, _ = FULL_RESPONSE.split("\nRESPONSE:")
+
+    events = parser.feed(head)
+
+    assert [event.action for event in events] == [ACTION]
+
+
+def test_plain_text_response():
+    assert _expected("안녕하세요") == ([], "안녕하세요", ["text"])
+
+
+def test_malformed_action_json_is_dropped_but_response_kept():
+    actions, text, _ = _run(["ACTION: {\"action\": update,}\nRESPONSE: 응답"])
+
+    assert actions == []
+    assert text == "응답"
+
+
+def test_only_json_objects_are_actions():
+    assert _run(["ACTION: {}", "RESPONSE: 응답"]) == ([{}], "응답", ["action", "text"])
+    assert _run(["ACTION: [1, 2]\nRESPONSE: 응답"])[0] == []
+
+
+@pytest.mark.parametrize("truncated", [
+    "ACTION: {\"action\": \"update\", \"updates\": {\"title\": \"회",
+    "ACTION: {\"action\": \"update\", \"updates\": {}",
+    "ACTION:",
+    "ACTI",
+])
+def test_truncated_action_falls_back_to_raw_text(truncated):
+    for i in range(len(truncated) + 1):
+        actions, text, _ = _run([truncated[:i], truncated[i:]])
+        assert actions == []
+        assert text == truncated
+
+
+def test_action_without_response_yields_only_the_action():
+    assert _run([f"ACTION: {json.dumps(ACTION)}"]) == ([ACTION], "", ["action"])
+
+
+def test_empty_chunks_are_ignored():
+    assert _run(["", FULL_RESPONSE[:10], "", FULL_RESPONSE[10:], ""]) == _expected(FULL_RESPONSE)
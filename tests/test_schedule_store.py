@@ -0,0 +1,102 @@
+"""
+일정 저장소 공통 동작 테스트 (Mock/SQLite)
+"""
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.api.schedule_api import BaseScheduleAPI, MockScheduleAPI
+
+START = datetime(2030, 1, 7, 10)
+
+
+def test_schedules_lists_all_in_insertion_order(schedule_api):
+    first = schedule_api.create_schedule("E1", "첫 일정", START, START + timedelta(hours=1))
+    second = schedule_api.create_schedule("E2", "둘째 일정", START, START + timedelta(hours=1))
+
+    assert [schedule.schedule_id for schedule in schedule_api.schedules] == [first, second]
+
+
+def test_conflict_details_skip_the_meetings_own_schedules(schedule_api):
+    schedule_api.create_meeting_schedules(["E1"], "주간 회의", START, START + timedelta(hours=1),
+                                          meeting_id="M1")
+    schedule_api.create_schedule("E1", "외부 미팅", START + timedelta(minutes=30),
+                                 START + timedelta(hours=2))
+
+    details = schedule_api.get_conflict_details("E1", START, START + timedelta(hours=1),
+                                                exclude_meeting_id="M1")
+
+    assert [detail["title"] for detail in details] == ["외부 미팅"]
+    assert len(schedule_api.get_conflict_details("E1", START, START + timedelta(hours=1))) == 2
+
+
+def test_backend_missing_an_abstract_hook_fails_at_instantiation():
+    class IncompleteScheduleAPI(BaseScheduleAPI):
+        def get_schedule(self, schedule_id):
+            return None
+
+    with pytest.raises(TypeError, match="abstract"):
+        IncompleteScheduleAPI()
+
+
+def test_update_and_delete_log_with_backend_prefix(schedule_api, capsys):
+    schedule_id = schedule_api.create_schedule("E1", "일정", START, START + timedelta(hours=1))
+    schedule_api.update_schedule(schedule_id, title="수정")
+    schedule_api.delete_schedule(schedule_id)
+
+    lines = capsys.readouterr().out.splitlines()
+    assert len(lines) == 3
+    assert all(line.startswith(schedule_api.LOG_PREFIX) for line in lines)
+
+
+def test_update_moves_schedule_only_when_index_keys_change(schedule_api):
+    schedule_id = schedule_api.create_schedule("E1", "일정", START, START + timedelta(hours=1))
+    later = START + timedelta(hours=3)
+
+    schedule_api.update_schedule(schedule_id, title="제목만 수정")
+    schedule_api.update_schedule(schedule_id, start_datetime=later,
+                                 end_datetime=later + timedelta(hours=1))
+    schedule_api.update_schedule(schedule_id, employee_id="E2")
+
+    assert schedule_api.get_schedule(schedule_id).title == "제목만 수정"
+    assert schedule_api.get_schedules("E1", START, later + timedelta(hours=2)) == []
+    assert [s.schedule_id for s in schedule_api.get_schedules("E2", later, later + timedelta(hours=1))] \
+        == [schedule_id]
+    assert schedule_api.get_schedules("E2", START, START + timedelta(hours=1)) == []
+
+
+def test_title_update_keeps_index_entry_in_memory_backend(monkeypatch):
+    schedule_api = MockScheduleAPI(generate_sample_data=False)
+    schedule_id = schedule_api.create_schedule("E1", "일정", START, START + timedelta(hours=1))
+    removed = []
+    monkeypatch.setattr(schedule_api._index, "remove", lambda schedule: removed.append(schedule))
+
+    schedule_api.update_schedule(schedule_id, title="수정", content="내용")
+
+    assert removed == []
+    assert schedule_api.get_schedules("E1", START, START + timedelta(hours=1))[0].title == "수정"
+
+
+def test_schedules_for_date_follow_create_move_and_delete(schedule_api):
+    rng = random.Random(3)
+    days = [START + timedelta(days=offset) for offset in range(3)]
+    schedule_ids = []
+    for _ in range(60):
+        start = rng.choice(days).replace(hour=rng.randrange(0, 24), minute=rng.randrange(0, 60, 10))
+        schedule_ids.append(schedule_api.create_schedule(
+            f"E{rng.randrange(5)}", "일정", start, start + timedelta(minutes=30)))
+    for schedule_id in rng.sample(schedule_ids, 15):
+        start = rng.choice(days).replace(hour=rng.randrange(0, 24))
+        schedule_api.update_schedule(schedule_id, start_datetime=start,
+                                     end_datetime=start + timedelta(hours=1))
+    for schedule_id in rng.sample(schedule_ids, 15):
+        schedule_api.delete_schedule(schedule_id)
+
+    for day in days + [START - timedelta(days=1)]:
+        expected = sorted((s for s in schedule_api.schedules
+                           if s.start_datetime.date() == day.date()),
+                          key=lambda s: s.start_datetime)
+        found = schedule_api.get_all_schedules_for_date(day.replace(hour=13))
+        assert [s.start_datetime for s in found] == [s.start_datetime for s in expected]
+        assert {s.schedule_id for s in found} == {s.schedule_id for s in expected}
@@ -0,0 +1,31 @@
+"""
+기간 내 회의 가능 시간 탐색 테스트
+"""
+from datetime import datetime, timedelta
+
+from src.api.schedule_api import MockScheduleAPI
+
+# 2030-01-07은 월요일
+MONDAY = datetime(2030, 1, 7)
+
+
+def test_slots_end_within_end_date():
+    schedule_api = MockScheduleAPI(generate_sample_data=False)
+    end_date = MONDAY.replace(hour=11, minute=5)
+
+    slots = schedule_api.find_available_slots(["E1"], 60, MONDAY, end_date, top_k=50)
+
+    assert slots
+    assert all(slot["end_time"] <= end_date for slot in slots)
+    assert max(slot["start_time"] for slot in slots) == MONDAY.replace(hour=10)
+
+
+def test_slots_rank_fewer_conflicts_first():
+    schedule_api = MockScheduleAPI(generate_sample_data=False)
+    schedule_api.create_schedule("E1", "기존 일정", MONDAY.replace(hour=9), MONDAY.replace(hour=10))
+
+    slots = schedule_api.find_available_slots(["E1"], 60, MONDAY, MONDAY + timedelta(days=1),
+                                              preferred_time=MONDAY.replace(hour=9))
+
+    assert slots[0]["conflicts"] == 0
+    assert slots[0]["start_time"] == MONDAY.replace(hour=10)
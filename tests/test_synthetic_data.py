@@ -0,0 +1,94 @@
+"""
+합성 데이터 생성/적재 테스트
+"""
+import tempfile
+
+import pytest
+
+from src.api import employee_api, schedule_api, synthetic_data
+from src.api.synthetic_data import SyntheticDataGenerator
+
+
+@pytest.fixture(autouse=True)
+def restore_singletons():
+    saved = schedule_api._schedule_api_instance, employee_api._employee_api_instance
+    yield
+    schedule_api._schedule_api_instance, employee_api._employee_api_instance = saved
+
+
+@pytest.fixture
+def sqlite_backend(monkeypatch, tmp_path):
+    # 설정된 DB 파일에는 쓰지 않아야 하므로 건드리면 드러나도록 경로를 바꿔 둠
+    monkeypatch.setattr(synthetic_data, "SCHEDULE_BACKEND", "sqlite")
+    monkeypatch.setattr(schedule_api, "SCHEDULE_DB_PATH", str(tmp_path / "configured.db"))
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    return tmp_path
+
+
+def _rows(api):
+    return sorted((s.schedule_id, s.employee_id, s.start_datetime, s.title) for s in api.schedules)
+
+
+def _generator(seed: int) -> SyntheticDataGenerator:
+    return SyntheticDataGenerator(seed=seed, employee_count=24, days=5)
+
+
+def test_populate_twice_on_sqlite_gives_identical_fresh_stores(sqlite_backend):
+    _, first_count = _generator(7).populate()
+    first = _rows(schedule_api.get_schedule_api())
+
+    _, second_count = _generator(7).populate()
+
+    assert second_count == first_count == len(first)
+    assert _rows(schedule_api.get_schedule_api()) == first
+    assert not (sqlite_backend / "configured.db").exists()
+
+
+def test_populate_with_other_seed_does_not_merge(sqlite_backend):
+    _generator(7).populate()
+    _, count = _generator(8).populate()
+
+    assert len(schedule_api.get_schedule_api().schedules) == count
+
+
+def test_explicit_db_path_is_recreated(tmp_path):
+    db_path = str(tmp_path / "synthetic.db")
+    _generator(7).populate(db_path=db_path)
+    _, count = _generator(7).populate(db_path=db_path)
+
+    assert len(schedule_api.get_schedule_api().schedules) == count
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_dump_load_round_trip(monkeypatch, tmp_path, backend):
+    monkeypatch.setattr(synthetic_data, "SCHEDULE_BACKEND", backend)
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    generator = _generator(7)
+    generator.populate()
+    expected = _rows(schedule_api.get_schedule_api())
+    path = str(tmp_path / "world.jsonl")
+
+    dumped = generator.dump(path)
+    world, loaded = SyntheticDataGenerator.load(path)
+
+    assert loaded == dumped == len(expected)
+    assert _rows(schedule_api.get_schedule_api()) == expected
+    assert world.seed == 7 and len(world.employees) == 24
+    assert employee_api.get_employee_api().get_employee_by_id("emp_000001") is not None
+
+
+def test_load_without_header_raises(tmp_path):
+    path = tmp_path / "world.jsonl"
+    _generator(7).dump(str(path))
+    path.write_text("".join(path.read_text(encoding="utf-8").splitlines(True)[1:]), encoding="utf-8")
+
+    with pytest.raises(ValueError, match="world 헤더"):
+        SyntheticDataGenerator.load(str(path))
+
+
+def test_load_empty_file_raises(tmp_path):
+    path = tmp_path / "empty.jsonl"
+    path.write_text("", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="world 헤더"):
+        SyntheticDataGenerator.load(str(path))
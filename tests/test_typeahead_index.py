@@ -0,0 +1,110 @@
+"""
+자모/초성 자동완성 색인 테스트
+"""
+import random
+
+import pytest
+
+from src.api.employee_api import MockEmployeeAPI
+from src.api.typeahead_index import TypeaheadIndex
+from src.models.employee import Employee
+from src.utils.hangul import chosung, decompose, is_chosung_query
+
+SURNAMES = "김이박정최한"
+GIVEN = "철수영희민지현호준서"
+
+
+def _random_name(rng: random.Random) -> str:
+    return rng.choice(SURNAMES) + "".join(rng.choice(GIVEN) for _ in range(rng.randint(1, 2)))
+
+
+def _scan(names, query):
+    """(이름 처음부터 일치, 이름자부터 일치) 문서 ID 집합 기준 결과"""
+    query = query.replace(" ", "")
+    if is_chosung_query(query):
+        key, to_key = query, chosung
+    else:
+        key, to_key = decompose(query), decompose
+    full = {doc_id for doc_id, name in names.items() if to_key(name).startswith(key)}
+    partial = {doc_id for doc_id, name in names.items()
+               if any(to_key(name[start:]).startswith(key) for start in range(1, len(name)))}
+    return full, partial - full
+
+
+def _queries(rng: random.Random, names):
+    for name in rng.sample(sorted(set(names.values())), 30):
+        start = rng.randrange(len(name))
+        syllables = name[start:start + rng.randint(1, 3)]
+        yield syllables
+        yield chosung(syllables)
+        # 마지막 음절을 입력 중인 상태 ('김철' -> '김처')
+        jamo = decompose(syllables)
+        yield jamo[:rng.randint(1, len(jamo))]
+
+
+@pytest.fixture
+def names():
+    rng = random.Random(12)
+    return {doc_id: _random_name(rng) for doc_id in range(150)}
+
+
+def test_search_matches_prefix_and_chosung_scan(names):
+    index = TypeaheadIndex(max_visited_nodes=10 ** 6)
+    for doc_id, name in names.items():
+        index.add(doc_id, name)
+
+    for query in _queries(random.Random(1), names):
+        full, partial = _scan(names, query)
+        results = index.search(query, top_k=len(names))
+
+        assert len(results) == len(set(results)), query
+        # 이름 처음부터 일치하는 결과가 이름자 일치보다 앞섬
+        assert set(results[:len(full)]) == full, query
+        assert set(results[len(full):]) == partial, query
+
+
+@pytest.mark.parametrize("query", ["김처", "김철", "철수", "ㄱㅊㅅ", "ㅊㅅ", "김 철수"])
+def test_known_typeahead_inputs_find_full_name(query):
+    index = TypeaheadIndex()
+    for doc_id, name in enumerate(["김철수", "이영희", "김철민", "박수철"]):
+        index.add(doc_id, name)
+
+    assert 0 in index.search(query)
+
+
+def test_exact_name_ranks_first():
+    index = TypeaheadIndex()
+    for doc_id, name in enumerate(["김철수민", "김철수", "이김철"]):
+        index.add(doc_id, name)
+
+    assert index.search("김철") == [1, 0, 2]
+
+
+def test_add_remove_sequence_matches_scan_and_prunes_trie():
+    rng = random.Random(5)
+    index = TypeaheadIndex(max_visited_nodes=10 ** 6)
+    names = {}
+    for _ in range(400):
+        doc_id = rng.randrange(40)
+        if rng.random() < 0.6:
+            names[doc_id] = _random_name(rng)
+            index.add(doc_id, names[doc_id])
+        else:
+            names.pop(doc_id, None)
+            index.remove(doc_id)
+
+        query = rng.choice([rng.choice(SURNAMES), chosung(rng.choice(GIVEN))])
+        full, partial = _scan(names, query)
+        assert set(index.search(query, top_k=len(names) + 1)) == full | partial
+
+    for doc_id in list(names):
+        index.remove(doc_id)
+    assert all(not root.children and not root.entries for root in index._roots.values())
+
+
+def test_employee_typeahead_follows_add_and_remove():
+    api = MockEmployeeAPI([Employee(id="e1", name="김철수", team="개발팀")])
+    api.add_employee(Employee(id="e2", name="김철민", team="기획팀"))
+    api.remove_employee("e1")
+
+    assert [emp.id for emp in api.typeahead("ㄱㅊ")] == ["e2"]